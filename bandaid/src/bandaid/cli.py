@@ -4,36 +4,80 @@ Provides command-line interface for managing the proxy lifecycle, configuration,
 and monitoring via the `guardrail` command.
 """
 
+import functools
+import os
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich import print as rprint
-from rich.console import Console
+from typer.core import TyperGroup
 
-from bandaid.observability.logger import get_logger
+from bandaid.cli_commands._console import get_console
+from bandaid.cli_commands._paths import CONFIG_PATH
 
-logger = get_logger(__name__)
-console = Console()
+if TYPE_CHECKING:
+    import click
+    import structlog
 
-# Create Typer app
+
+@functools.cache
+def _logger() -> "structlog.stdlib.BoundLogger":
+    """Get the CLI logger, importing the logging stack on first use."""
+    from bandaid.observability.logger import get_logger
+
+    return get_logger(__name__)
+
+
+def _completion_requested() -> bool:
+    """Check whether this invocation installs, shows, or serves shell completion."""
+    return "_GUARDRAIL_COMPLETE" in os.environ or any(
+        arg in ("--install-completion", "--show-completion") for arg in sys.argv[1:]
+    )
+
+
+class _LazyConfigGroup(TyperGroup):
+    """Root command group that builds the `config` group only when it is looked up.
+
+    Click asks for it by name to dispatch `guardrail config ...`, and through
+    list_commands for help and completion, so other commands skip building it.
+    """
+
+    def list_commands(self, ctx: "click.Context") -> list[str]:
+        """List subcommand names, including the lazily built `config` group."""
+        return [*super().list_commands(ctx), "config"]
+
+    def get_command(self, ctx: "click.Context", cmd_name: str) -> "click.Command | None":
+        """Get a subcommand by name, building the `config` group on first use."""
+        if cmd_name == "config":
+            return _config_group()
+        return super().get_command(ctx, cmd_name)
+
+
+# Create Typer app. Completion commands and Rich markup are only wired up when
+# they can be used, so plain invocations and piped output skip that setup.
 app = typer.Typer(
     name="guardrail",
     help="Bandaid Security Proxy - LLM security and threat detection",
-    add_completion=True,
-    rich_markup_mode="rich",
+    add_completion=_completion_requested(),
+    rich_markup_mode="rich" if sys.stdout.isatty() else None,
+    cls=_LazyConfigGroup,
 )
 
-# Create config subcommand group
-config_app = typer.Typer(help="Configuration management commands")
-app.add_typer(config_app, name="config")
-
 
 def version_callback(value: bool):
     """Show version and exit."""
     if value:
-        rprint("[bold]Bandaid Security Proxy[/bold]")
-        rprint("Version: [cyan]1.0.0[/cyan]")
-        rprint("Python ML-based security proxy for LLM applications")
+        if sys.stdout.isatty():
+            console = get_console()
+            console.print("[bold]Bandaid Security Proxy[/bold]")
+            console.print("Version: [cyan]1.0.0[/cyan]")
+            console.print("Python ML-based security proxy for LLM applications")
+        else:
+            # Plain output for pipes; avoids importing Rich for scripted version checks
+            print("Bandaid Security Proxy")
+            print("Version: 1.0.0")
+            print("Python ML-based security proxy for LLM applications")
         raise typer.Exit()
 
 
@@ -58,6 +102,11 @@ def main(
         "-q",
         help="Suppress all non-error output",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the cached parsed configuration (for debugging)",
+    ),
     version: bool | None = typer.Option(
         None,
         "--version",
@@ -67,8 +116,13 @@ def main(
     ),
 ):
     """Bandaid Security Proxy CLI - Global options and configuration."""
+    if no_cache:
+        from bandaid.config import get_config_manager
+
+        get_config_manager().cache_enabled = False
+
     ctx.obj = {
-        "config_path": config or Path.home() / ".bandaid" / "config.toml",
+        "config_path": config or CONFIG_PATH,
         "verbose": verbose,
         "quiet": quiet,
     }
@@ -109,11 +163,11 @@ def setup(
             model_device=model_device,
         )
     except KeyboardInterrupt:
-        console.print("\n[yellow]Setup cancelled by user[/yellow]")
+        get_console().print("\n[yellow]Setup cancelled by user[/yellow]")
         raise typer.Exit(1) from None
     except Exception as e:
-        console.print(f"[red]✗ Setup failed: {e}[/red]")
-        logger.error("setup command failed", error=str(e), exc_info=True)
+        get_console().print(f"[red]✗ Setup failed: {e}[/red]")
+        _logger().error("setup command failed", error=str(e), exc_info=True)
         raise typer.Exit(1) from e
 
 
@@ -160,11 +214,11 @@ def start(
         )
         raise typer.Exit(exit_code)
     except KeyboardInterrupt:
-        console.print("\n[yellow]Proxy startup cancelled[/yellow]")
+        get_console().print("\n[yellow]Proxy startup cancelled[/yellow]")
         raise typer.Exit(1) from None
     except Exception as e:
-        console.print(f"[red]✗ Failed to start proxy: {e}[/red]")
-        logger.error("start command failed", error=str(e), exc_info=True)
+        get_console().print(f"[red]✗ Failed to start proxy: {e}[/red]")
+        _logger().error("start command failed", error=str(e), exc_info=True)
         raise typer.Exit(1) from e
 
 
@@ -194,8 +248,8 @@ def stop(
         exit_code = run_stop(force=force, timeout=timeout)
         raise typer.Exit(exit_code)
     except Exception as e:
-        console.print(f"[red]✗ Failed to stop proxy: {e}[/red]")
-        logger.error("stop command failed", error=str(e), exc_info=True)
+        get_console().print(f"[red]✗ Failed to stop proxy: {e}[/red]")
+        _logger().error("stop command failed", error=str(e), exc_info=True)
         raise typer.Exit(1) from e
 
 
@@ -229,8 +283,8 @@ def validate(
         )
         raise typer.Exit(exit_code)
     except Exception as e:
-        console.print(f"[red]✗ Validation failed: {e}[/red]")
-        logger.error("validate command failed", error=str(e), exc_info=True)
+        get_console().print(f"[red]✗ Validation failed: {e}[/red]")
+        _logger().error("validate command failed", error=str(e), exc_info=True)
         raise typer.Exit(2) from e
 
 
@@ -262,84 +316,11 @@ def dashboard(
         )
         raise typer.Exit(exit_code)
     except Exception as e:
-        console.print(f"[red]✗ Failed to open dashboard: {e}[/red]")
-        logger.error("dashboard command failed", error=str(e), exc_info=True)
+        get_console().print(f"[red]✗ Failed to open dashboard: {e}[/red]")
+        _logger().error("dashboard command failed", error=str(e), exc_info=True)
         raise typer.Exit(1) from e
 
 
-@config_app.command("show")
-def config_show(
-    ctx: typer.Context,
-    format: str = typer.Option(
-        "table",
-        "--format",
-        help="Output format (table, json, yaml)",
-    ),
-    show_keys: bool = typer.Option(
-        False,
-        "--show-keys",
-        help="Show masked API keys (e.g., sk-...abc)",
-    ),
-):
-    """
-    Display current configuration (sanitized).
-
-    Shows ports, providers, thresholds, and settings without exposing sensitive data.
-    """
-    from bandaid.cli_commands.config_show import run_config_show
-
-    try:
-        config_path = ctx.parent.obj["config_path"] if ctx.parent else None
-        from pathlib import Path
-
-        exit_code = run_config_show(
-            config_path=Path(config_path)
-            if config_path
-            else Path.home() / ".bandaid" / "config.toml",
-            output_format=format,
-            show_keys=show_keys,
-        )
-        raise typer.Exit(exit_code)
-    except Exception as e:
-        console.print(f"[red]✗ Failed to show config: {e}[/red]")
-        logger.error("config show command failed", error=str(e), exc_info=True)
-        raise typer.Exit(2) from e
-
-
-@config_app.command("set")
-def config_set(
-    ctx: typer.Context,
-    key: str = typer.Argument(..., help="Configuration key to set"),
-    value: str = typer.Argument(..., help="New value"),
-):
-    """
-    Update a configuration value without editing the file.
-
-    Validates the new value and warns if proxy restart is required.
-
-    Supported keys: proxy_port, dashboard_port, log_retention_days, model_device,
-    confidence.high, confidence.medium_min, sentry_dsn
-    """
-    from bandaid.cli_commands.config_set import run_config_set
-
-    try:
-        config_path = ctx.parent.obj["config_path"] if ctx.parent else None
-        from pathlib import Path
-
-        exit_code = run_config_set(
-            config_path=Path(config_path)
-            if config_path
-            else Path.home() / ".bandaid" / "config.toml",
-            key=key,
-            value=value,
-        )
-        raise typer.Exit(exit_code)
-    except Exception as e:
-        console.print(f"[red]✗ Failed to set config: {e}[/red]")
-        logger.error("config set command failed", error=str(e), exc_info=True)
-        raise typer.Exit(2) from e
-
-
 @app.command()
 def status(ctx: typer.Context):
     """
@@ -353,11 +334,89 @@ def status(ctx: typer.Context):
         exit_code = run_status()
         raise typer.Exit(exit_code)
     except Exception as e:
-        console.print(f"[red]✗ Failed to get status: {e}[/red]")
-        logger.error("status command failed", error=str(e), exc_info=True)
+        get_console().print(f"[red]✗ Failed to get status: {e}[/red]")
+        _logger().error("status command failed", error=str(e), exc_info=True)
         raise typer.Exit(1) from e
 
 
+@functools.cache
+def _config_group() -> "click.Command":
+    """Build the `config` command group (looked up through _LazyConfigGroup)."""
+    config_app = typer.Typer(
+        name="config",
+        help="Configuration management commands",
+        add_completion=False,
+        rich_markup_mode="rich" if sys.stdout.isatty() else None,
+    )
+
+    @config_app.command("show")
+    def config_show(
+        ctx: typer.Context,
+        format: str = typer.Option(
+            "table",
+            "--format",
+            help="Output format (table, json, yaml)",
+        ),
+        show_keys: bool = typer.Option(
+            False,
+            "--show-keys",
+            help="Show masked API keys (e.g., sk-...abc)",
+        ),
+    ):
+        """
+        Display current configuration (sanitized).
+
+        Shows ports, providers, thresholds, and settings without exposing sensitive data.
+        """
+        from bandaid.cli_commands.config_show import run_config_show
+
+        try:
+            config_path = (ctx.parent.obj["config_path"] if ctx.parent else None) or CONFIG_PATH
+
+            exit_code = run_config_show(
+                config_path=config_path,
+                output_format=format,
+                show_keys=show_keys,
+            )
+            raise typer.Exit(exit_code)
+        except Exception as e:
+            get_console().print(f"[red]✗ Failed to show config: {e}[/red]")
+            _logger().error("config show command failed", error=str(e), exc_info=True)
+            raise typer.Exit(2) from e
+
+    @config_app.command("set")
+    def config_set(
+        ctx: typer.Context,
+        key: str = typer.Argument(..., help="Configuration key to set"),
+        value: str = typer.Argument(..., help="New value"),
+    ):
+        """
+        Update a configuration value without editing the file.
+
+        Validates the new value and warns if proxy restart is required.
+
+        Supported keys: proxy_port, dashboard_port, log_retention_days, model_device,
+        confidence.high, confidence.medium_min, sentry_dsn
+        """
+        from bandaid.cli_commands.config_set import run_config_set
+
+        try:
+            config_path = (ctx.parent.obj["config_path"] if ctx.parent else None) or CONFIG_PATH
+
+            exit_code = run_config_set(
+                config_path=config_path,
+                key=key,
+                value=value,
+            )
+            raise typer.Exit(exit_code)
+        except Exception as e:
+            get_console().print(f"[red]✗ Failed to set config: {e}[/red]")
+            _logger().error("config set command failed", error=str(e), exc_info=True)
+            raise typer.Exit(2) from e
+
+    return typer.main.get_command(config_app)
+
+
 def cli():
     """Entry point for the CLI."""
     app()
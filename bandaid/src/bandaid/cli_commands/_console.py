@@ -0,0 +1,22 @@
+"""Shared Rich console for CLI command implementations.
+
+The console is created on first use so that importing a command module
+does not pay for Rich's terminal detection.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: "Console | None" = None
+
+
+def get_console() -> "Console":
+    """Get the shared CLI console instance."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
@@ -0,0 +1,31 @@
+"""Filesystem helpers shared by the CLI commands."""
+
+import os
+from pathlib import Path
+
+
+def dir_size(root: Path) -> int:
+    """Total size in bytes of regular files below a directory.
+
+    Walks with os.scandir so file type checks come from the directory read
+    instead of a separate stat() per entry. Symlinks are not followed.
+
+    Args:
+        root: Directory to measure
+
+    Returns:
+        Combined size of all regular files
+    """
+    total = 0
+    stack: list[str | Path] = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
@@ -0,0 +1,38 @@
+"""Event loop helper for CLI commands that run one-shot async work."""
+
+import asyncio
+import functools
+import importlib.util
+import sys
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@functools.cache
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get uvloop's loop factory if it is installed (POSIX only)."""
+    if sys.platform == "win32" or importlib.util.find_spec("uvloop") is None:
+        return None
+
+    import uvloop
+
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, like asyncio.run.
+
+    Uses uvloop when available (installed with uvicorn[standard]) and the
+    default asyncio loop otherwise.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        return runner.run(main)
@@ -0,0 +1,16 @@
+"""Well-known locations under the Bandaid home directory (~/.bandaid).
+
+The BANDAID_HOME environment variable moves the whole directory.
+"""
+
+import os
+from pathlib import Path
+
+BANDAID_DIR = Path(os.environ.get("BANDAID_HOME") or Path.home() / ".bandaid")
+CONFIG_PATH = BANDAID_DIR / "config.toml"
+PID_FILE = BANDAID_DIR / "proxy.pid"
+LOG_DIR = BANDAID_DIR / "logs"
+LOG_FILE = LOG_DIR / "proxy.log"
+EVENTS_DB = BANDAID_DIR / "events.db"
+CHROMA_DIR = BANDAID_DIR / "chroma"
+KEY_FILE = BANDAID_DIR / ".encryption_key"
@@ -0,0 +1,18 @@
+"""PID file helpers shared by the proxy lifecycle commands."""
+
+from pathlib import Path
+
+
+def read_pid(pid_file: Path) -> int | None:
+    """Read the proxy PID from its PID file in a single open/read.
+
+    Args:
+        pid_file: Path to the PID file
+
+    Returns:
+        The PID, or None if the file is missing, unreadable, or invalid
+    """
+    try:
+        return int(pid_file.read_text().strip())
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,28 @@
+"""Port availability probe shared by the start and validate commands."""
+
+import socket
+
+
+def check_ports(ports: list[int]) -> dict[int, bool]:
+    """Check whether the proxy could bind each port on all interfaces.
+
+    Each port is bound on ("", port) with SO_REUSEADDR, the way uvicorn binds
+    host 0.0.0.0, and released immediately. A listener on any interface makes
+    the bind fail; connections lingering in TIME_WAIT do not.
+
+    Args:
+        ports: TCP ports to check
+
+    Returns:
+        Mapping of port to True if the port is free
+    """
+    results: dict[int, bool] = {}
+    for port in ports:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                s.bind(("", port))
+                results[port] = True
+            except OSError:
+                results[port] = False
+    return results
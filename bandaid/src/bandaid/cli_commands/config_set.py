@@ -1,21 +1,103 @@
 """Config set command implementation for Bandaid CLI."""
 
+import re
+import tomllib
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
-import toml
-from rich.console import Console
+import tomli_w
 
-console = Console()
+from bandaid.cli_commands._console import get_console
 
 # Keys that require proxy restart
-RESTART_REQUIRED_KEYS = {
-    "proxy_port",
-    "dashboard_port",
-    "model_device",
-    "confidence.high",
-    "confidence.medium_min",
+RESTART_REQUIRED_KEYS = frozenset(
+    {
+        "proxy_port",
+        "dashboard_port",
+        "model_device",
+        "confidence.high",
+        "confidence.medium_min",
+    }
+)
+
+_VALID_DEVICES = frozenset({"cpu", "cuda", "mps"})
+
+# Plain decimal such as "0.85", "1", or ".5"
+_DECIMAL_RE = re.compile(r"\d+(?:\.\d*)?|\.\d+")
+
+# Parsers return (parsed_value, error_message); error_message is None on success
+ParseResult = tuple[Any, str | None]
+
+
+def _parse_int_range(value: str, low: int, high: int, error: str) -> ParseResult:
+    """Parse a non-negative integer within [low, high]."""
+    if not (value.isascii() and value.isdigit()):
+        return None, error
+    number = int(value)
+    if not (low <= number <= high):
+        return None, error
+    return number, None
+
+
+def _parse_port(value: str) -> ParseResult:
+    """Parse a TCP port in the unprivileged range."""
+    return _parse_int_range(value, 1024, 65535, "Port must be between 1024 and 65535")
+
+
+def _parse_retention(value: str) -> ParseResult:
+    """Parse a log retention period in days."""
+    return _parse_int_range(value, 1, 365, "Retention days must be between 1 and 365")
+
+
+def _parse_device(value: str) -> ParseResult:
+    """Parse a model inference device."""
+    if value not in _VALID_DEVICES:
+        return None, "Device must be one of: cpu, cuda, mps"
+    return value, None
+
+
+def _parse_unit_float(value: str) -> ParseResult:
+    """Parse a confidence threshold between 0.0 and 1.0."""
+    if not _DECIMAL_RE.fullmatch(value):
+        return None, "Threshold must be between 0.0 and 1.0"
+    threshold = float(value)
+    if not (0.0 <= threshold <= 1.0):
+        return None, "Threshold must be between 0.0 and 1.0"
+    return threshold, None
+
+
+def _parse_sentry(value: str) -> ParseResult:
+    """Parse a Sentry DSN, treating none/null/empty as disabled."""
+    if value.lower() in ("none", "null", ""):
+        return "", None
+    return value, None
+
+
+# Supported keys: value parser and (table, field) location in the TOML file
+_VALIDATORS: dict[str, tuple[Callable[[str], ParseResult], tuple[str, str]]] = {
+    "proxy_port": (_parse_port, ("general", "proxy_port")),
+    "dashboard_port": (_parse_port, ("general", "dashboard_port")),
+    "log_retention_days": (_parse_retention, ("general", "log_retention_days")),
+    "model_device": (_parse_device, ("general", "model_device")),
+    "confidence.high": (_parse_unit_float, ("confidence_thresholds", "high")),
+    "confidence.medium_min": (_parse_unit_float, ("confidence_thresholds", "medium_min")),
+    "sentry_dsn": (_parse_sentry, ("observability", "sentry_dsn")),
 }
 
+# Pre-rendered help for unknown keys, printed in a single console call
+_UNKNOWN_KEY_HELP = "\n\n[dim]Supported keys:[/dim]\n" + "\n".join(
+    f"  • {supported_key}" for supported_key in _VALIDATORS
+)
+
+
+def _set_nested(data: dict[str, Any], path: tuple[str, ...], value: Any) -> None:
+    """Set a value in nested dicts, creating intermediate tables as needed."""
+    *tables, field = path
+    for table in tables:
+        data = data.setdefault(table, {})
+    data[field] = value
+
 
 def run_config_set(config_path: Path, key: str, value: str) -> int:
     """Update a configuration value.
@@ -28,14 +110,15 @@ def run_config_set(config_path: Path, key: str, value: str) -> int:
     Returns:
         Exit code (0 = success, 2 = invalid key/value)
     """
+    console = get_console()
+
     if not config_path.exists():
         console.print(f"[red]✗ Configuration file not found: {config_path}[/red]")
         console.print("[dim]Run setup first: guardrail setup[/dim]")
         return 2
 
     try:
-        with open(config_path) as f:
-            config_data = toml.load(f)
+        config_data = tomllib.loads(config_path.read_text())
     except Exception as e:
         console.print(f"[red]✗ Failed to load configuration: {e}[/red]")
         return 2
@@ -43,76 +126,21 @@ def run_config_set(config_path: Path, key: str, value: str) -> int:
     console.print("Updating configuration...")
 
     # Parse and validate key
-    try:
-        if key == "proxy_port":
-            port = int(value)
-            if not (1024 <= port <= 65535):
-                raise ValueError("Port must be between 1024 and 65535")
-            config_data["general"]["proxy_port"] = port
-
-        elif key == "dashboard_port":
-            port = int(value)
-            if not (1024 <= port <= 65535):
-                raise ValueError("Port must be between 1024 and 65535")
-            config_data["general"]["dashboard_port"] = port
-
-        elif key == "log_retention_days":
-            days = int(value)
-            if not (1 <= days <= 365):
-                raise ValueError("Retention days must be between 1 and 365")
-            config_data["general"]["log_retention_days"] = days
-
-        elif key == "model_device":
-            if value not in ("cpu", "cuda", "mps"):
-                raise ValueError("Device must be one of: cpu, cuda, mps")
-            config_data["general"]["model_device"] = value
-
-        elif key == "confidence.high":
-            threshold = float(value)
-            if not (0.0 <= threshold <= 1.0):
-                raise ValueError("Threshold must be between 0.0 and 1.0")
-            if "confidence_thresholds" not in config_data:
-                config_data["confidence_thresholds"] = {}
-            config_data["confidence_thresholds"]["high"] = threshold
-
-        elif key == "confidence.medium_min":
-            threshold = float(value)
-            if not (0.0 <= threshold <= 1.0):
-                raise ValueError("Threshold must be between 0.0 and 1.0")
-            if "confidence_thresholds" not in config_data:
-                config_data["confidence_thresholds"] = {}
-            config_data["confidence_thresholds"]["medium_min"] = threshold
-
-        elif key == "sentry_dsn":
-            if value.lower() in ("none", "null", ""):
-                if "observability" not in config_data:
-                    config_data["observability"] = {}
-                config_data["observability"]["sentry_dsn"] = ""
-            else:
-                if "observability" not in config_data:
-                    config_data["observability"] = {}
-                config_data["observability"]["sentry_dsn"] = value
-
-        else:
-            console.print(f"[red]✗ Unknown configuration key: {key}[/red]")
-            console.print("\n[dim]Supported keys:[/dim]")
-            console.print("  • proxy_port")
-            console.print("  • dashboard_port")
-            console.print("  • log_retention_days")
-            console.print("  • model_device")
-            console.print("  • confidence.high")
-            console.print("  • confidence.medium_min")
-            console.print("  • sentry_dsn")
-            return 2
-
-    except ValueError as e:
-        console.print(f"[red]✗ Invalid value for {key}: {e}[/red]")
+    if key not in _VALIDATORS:
+        console.print(f"[red]✗ Unknown configuration key: {key}[/red]" + _UNKNOWN_KEY_HELP)
+        return 2
+
+    parser, path = _VALIDATORS[key]
+    parsed, error = parser(value)
+    if error is not None:
+        console.print(f"[red]✗ Invalid value for {key}: {error}[/red]")
         return 2
+    _set_nested(config_data, path, parsed)
 
     # Write updated configuration
     try:
-        with open(config_path, "w") as f:
-            toml.dump(config_data, f)
+        with open(config_path, "wb") as f:
+            tomli_w.dump(config_data, f)
         console.print(f"✓ Set [cyan]{key}[/cyan] = [green]{value}[/green]")
     except Exception as e:
         console.print(f"[red]✗ Failed to write configuration: {e}[/red]")
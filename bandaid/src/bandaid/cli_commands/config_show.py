@@ -1,10 +1,12 @@
 """Config show command implementation for Bandaid CLI."""
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
+from bandaid.cli_commands._console import get_console
 
-console = Console()
+if TYPE_CHECKING:
+    from bandaid.config import Config
 
 
 def run_config_show(
@@ -22,11 +24,15 @@ def run_config_show(
     Returns:
         Exit code (0 = success, 2 = config not found/invalid)
     """
+    console = get_console()
+
     if not config_path.exists():
         console.print(f"[red]✗ Configuration file not found: {config_path}[/red]")
         console.print("[dim]Run setup first: guardrail setup[/dim]")
         return 2
 
+    # Every format validates first (with ${VAR} interpolation), so an invalid
+    # config exits 2 regardless of output format
     try:
         from bandaid.config import load_config
 
@@ -37,117 +43,123 @@ def run_config_show(
 
     if output_format == "json":
         # Output as JSON
-        config_dict = {
-            "general": {
-                "config_file": str(config_path),
-                "proxy_port": config.proxy.port,
-                "dashboard_port": config.dashboard.port,
-                "log_retention_days": config.storage.sqlite.retention_days,
-                "model_device": config.models.device,
-            },
-            "providers": [
-                {
-                    "provider": p.provider,
-                    "configured": bool(p.api_key),
-                    "api_key": _mask_key(p.api_key) if show_keys and p.api_key else None,
-                    "default": p.default,
-                }
-                for p in config.providers
-            ],
-            "confidence_thresholds": {
-                "high": config.security.confidence.high,
-                "medium_min": config.security.confidence.medium_min,
-            },
-            "disabled_checks": config.disabled_checks if config.disabled_checks else [],
-            "sentry": {
-                "enabled": bool(config.observability and config.observability.sentry.dsn),
-                "dsn": _mask_dsn(config.observability.sentry.dsn)
-                if config.observability and config.observability.sentry.dsn
-                else None,
-            },
-        }
-        console.print_json(data=config_dict)
+        console.print_json(data=_config_dict(config, config_path, show_keys))
         return 0
 
     elif output_format == "yaml":
         # Output as YAML (using TOML library for simplicity)
         console.print("[dim]YAML output not implemented, showing TOML:[/dim]\n")
-        with open(config_path) as f:
-            console.print(f.read())
+        console.print(config_path.read_text(), markup=False, highlight=False)
         return 0
 
-    else:  # table format (default)
-        console.print("[bold]Bandaid Configuration[/bold]")
-        console.print("=" * 50 + "\n")
+    # Table format (default), rendered in a single pass
+    from rich.console import Group
+    from rich.text import Text
 
-        # General
-        console.print("[bold]General[/bold]")
-        console.print("-" * 50)
-        console.print(f"Config File: {config_path}")
-        console.print(f"Proxy Port: {config.proxy.port}")
-        console.print(f"Dashboard Port: {config.dashboard.port}")
-        console.print(f"Log Retention: {config.storage.sqlite.retention_days} days")
-        console.print(f"Model Device: {config.models.device}")
+    confidence = config.security.confidence
+    sentry_dsn = config.observability.sentry.dsn if config.observability else ""
+    rule = Text("-" * 50)
+    none = Text("(none)", style="dim")
 
+    lines: list[Text] = [
+        Text("Bandaid Configuration", style="bold"),
+        Text("=" * 50 + "\n"),
+        # General
+        Text("General", style="bold"),
+        rule,
+        Text(f"Config File: {config_path}"),
+        Text(f"Proxy Port: {config.proxy.port}"),
+        Text(f"Dashboard Port: {config.dashboard.port}"),
+        Text(f"Log Retention: {config.storage.sqlite.retention_days} days"),
+        Text(f"Model Device: {config.models.device}"),
         # Providers
-        console.print("\n[bold]Providers[/bold]")
-        console.print("-" * 50)
-        if config.providers:
-            for provider in config.providers:
-                if provider.api_key:
-                    key_display = _mask_key(provider.api_key) if show_keys else "***"
-                    default_marker = " [default]" if provider.default else ""
-                    console.print(
-                        f"{provider.provider.capitalize()}: Configured ({key_display}){default_marker}"
-                    )
-                else:
-                    console.print(f"{provider.provider.capitalize()}: Not configured")
+        Text("\nProviders", style="bold"),
+        rule,
+    ]
+    for provider in config.providers:
+        name = provider.provider.capitalize()
+        if provider.api_key:
+            key_display = _mask_key(provider.api_key) if show_keys else "***"
+            default_marker = " [default]" if provider.default else ""
+            lines.append(Text(f"{name}: Configured ({key_display}){default_marker}"))
         else:
-            console.print("[dim](none)[/dim]")
+            lines.append(Text(f"{name}: Not configured"))
+    if not config.providers:
+        lines.append(none)
+
+    # Confidence Thresholds
+    lines += [
+        Text("\nConfidence Thresholds", style="bold"),
+        rule,
+        Text(f"High: ≥ {confidence.high} (block immediately)"),
+        Text(f"Medium: {confidence.medium_min} - {confidence.high - 0.01:.2f} (log warning)"),
+        Text(f"Low: < {confidence.medium_min} (allow)"),
+        # Disabled Checks
+        Text("\nDisabled Checks", style="bold"),
+        rule,
+    ]
+    lines.extend([Text(f"• {check}") for check in config.disabled_checks] or [none])
 
-        # Confidence Thresholds
-        console.print("\n[bold]Confidence Thresholds[/bold]")
-        console.print("-" * 50)
-        console.print(f"High: ≥ {config.security.confidence.high} (block immediately)")
-        console.print(
-            f"Medium: {config.security.confidence.medium_min} - {config.security.confidence.high - 0.01:.2f} (log warning)"
-        )
-        console.print(f"Low: < {config.security.confidence.medium_min} (allow)")
+    # Sentry
+    lines += [Text("\nSentry", style="bold"), rule]
+    if sentry_dsn:
+        lines.append(Text("Enabled: Yes"))
+        lines.append(Text(f"DSN: {_mask_dsn(sentry_dsn)}" if show_keys else "DSN: ***"))
+    else:
+        lines.append(Text("Enabled: No"))
 
-        # Disabled Checks
-        console.print("\n[bold]Disabled Checks[/bold]")
-        console.print("-" * 50)
-        if config.disabled_checks:
-            for check in config.disabled_checks:
-                console.print(f"• {check}")
-        else:
-            console.print("[dim](none)[/dim]")
-
-        # Sentry
-        console.print("\n[bold]Sentry[/bold]")
-        console.print("-" * 50)
-        if config.observability and config.observability.sentry and config.observability.sentry.dsn:
-            console.print("Enabled: Yes")
-            if show_keys:
-                console.print(f"DSN: {_mask_dsn(config.observability.sentry.dsn)}")
-            else:
-                console.print("DSN: ***")
-        else:
-            console.print("Enabled: No")
+    console.print(Group(*lines))
+    return 0
 
-        return 0
+
+def _config_dict(config: "Config", config_path: Path, show_keys: bool) -> dict[str, Any]:
+    """Build the sanitized JSON view of a validated configuration.
+
+    Args:
+        config: Loaded configuration
+        config_path: Path to configuration file
+        show_keys: Include masked API keys
+
+    Returns:
+        Sanitized configuration dictionary
+    """
+    sentry_dsn = config.observability.sentry.dsn if config.observability else ""
+
+    return {
+        "general": {
+            "config_file": str(config_path),
+            "proxy_port": config.proxy.port,
+            "dashboard_port": config.dashboard.port,
+            "log_retention_days": config.storage.sqlite.retention_days,
+            "model_device": config.models.device,
+        },
+        "providers": [
+            {
+                "provider": p.provider,
+                "configured": bool(p.api_key),
+                "api_key": _mask_key(p.api_key) if show_keys and p.api_key else None,
+                "default": p.default,
+            }
+            for p in config.providers
+        ],
+        "confidence_thresholds": {
+            "high": config.security.confidence.high,
+            "medium_min": config.security.confidence.medium_min,
+        },
+        "disabled_checks": config.disabled_checks or [],
+        "sentry": {
+            "enabled": bool(sentry_dsn),
+            "dsn": _mask_dsn(sentry_dsn) if sentry_dsn else None,
+        },
+    }
 
 
 def _mask_key(key: str) -> str:
     """Mask an API key for display."""
-    if len(key) > 11:
-        return f"{key[:8]}...{key[-3:]}"
-    return "***"
+    return f"{key[:8]}...{key[-3:]}" if len(key) > 11 else "***"
 
 
 def _mask_dsn(dsn: str) -> str:
     """Mask a Sentry DSN for display."""
-    if "@" in dsn:
-        parts = dsn.split("@")
-        return f"https://***@{parts[-1]}"
-    return "***"
+    idx = dsn.rfind("@")
+    return "https://***@" + dsn[idx + 1 :] if idx != -1 else "***"
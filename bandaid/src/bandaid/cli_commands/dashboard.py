@@ -1,12 +1,108 @@
 """Dashboard command implementation for Bandaid CLI."""
 
+import functools
 import os
-import webbrowser
+import sys
+import tomllib
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
+from bandaid.cli_commands._console import get_console
+from bandaid.cli_commands._paths import CONFIG_PATH, PID_FILE
 
-console = Console()
+if TYPE_CHECKING:
+    import webbrowser
+
+DEFAULT_DASHBOARD_PORT = 8001
+
+# Rich styling only pays off on a terminal; piped output uses plain print()
+_USE_RICH = sys.stdout.isatty()
+
+
+def _say(msg_plain: str, msg_rich: str | None = None) -> None:
+    """Print a status line, with Rich markup only when writing to a terminal.
+
+    Args:
+        msg_plain: Message without markup
+        msg_rich: Message with Rich markup (defaults to msg_plain)
+    """
+    if _USE_RICH:
+        get_console().print(msg_rich or msg_plain)
+    else:
+        print(msg_plain)
+
+
+def _is_running_proc(pid: int) -> bool:
+    """Check process liveness via /proc (Linux)."""
+    return os.path.exists(f"/proc/{pid}")
+
+
+def _is_running_kill(pid: int) -> bool:
+    """Check process liveness with a null signal (POSIX)."""
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _is_running_win32(pid: int) -> bool:
+    """Check process liveness by opening a query handle (Windows).
+
+    os.kill(pid, 0) terminates the target process on Windows, so it cannot
+    be used as a probe there.
+    """
+    import ctypes
+
+    process_query_limited_information = 0x1000
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    handle = kernel32.OpenProcess(process_query_limited_information, False, pid)
+    if not handle:
+        return False
+    kernel32.CloseHandle(handle)
+    return True
+
+
+def _pick_liveness_check() -> Callable[[int], bool]:
+    """Select the process liveness check for the current platform."""
+    if sys.platform == "linux":
+        return _is_running_proc
+    if sys.platform == "win32":
+        return _is_running_win32
+    return _is_running_kill
+
+
+_is_running = _pick_liveness_check()
+
+
+@functools.cache
+def _browser() -> "webbrowser.BaseBrowser":
+    """Resolve the default browser controller once per process."""
+    import webbrowser
+
+    return webbrowser.get()
+
+
+def _read_dashboard_port(config_path: Path) -> int:
+    """Read the dashboard port directly from the raw TOML file.
+
+    Skips full Config model construction since only one field is needed.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Configured dashboard port (or the default if unset)
+
+    Raises:
+        ValueError: If the port is not an integer in 1..65535
+    """
+    raw_config = tomllib.loads(config_path.read_bytes().decode())
+    port = int(raw_config.get("dashboard", {}).get("port", DEFAULT_DASHBOARD_PORT))
+    if not 1 <= port <= 65535:
+        raise ValueError(f"Invalid dashboard port: {port}")
+    return port
 
 
 def run_dashboard(port_override: int | None = None, no_open: bool = False) -> int:
@@ -19,50 +115,62 @@ def run_dashboard(port_override: int | None = None, no_open: bool = False) -> in
     Returns:
         Exit code (0 = success, 7 = not running)
     """
-    from bandaid.config import load_config
-
-    pid_file = Path.home() / ".bandaid" / "proxy.pid"
-    config_path = Path.home() / ".bandaid" / "config.toml"
+    _say("Opening Bandaid Dashboard...")
 
-    console.print("Opening Bandaid Dashboard...")
-
-    # Check if proxy is running
-    if not pid_file.exists():
-        console.print("[yellow]⚠ Proxy is not running[/yellow]")
-        console.print("[dim]ℹ Start the proxy first: guardrail start[/dim]")
-        console.print("[red]✗ Cannot open dashboard[/red]")
+    # Check if proxy is running (single read; a missing file means not started)
+    pid: int | None
+    try:
+        pid = int(PID_FILE.read_bytes())
+    except FileNotFoundError:
+        _say("⚠ Proxy is not running", "[yellow]⚠ Proxy is not running[/yellow]")
+        _say(
+            "ℹ Start the proxy first: guardrail start",
+            "[dim]ℹ Start the proxy first: guardrail start[/dim]",
+        )
+        _say("✗ Cannot open dashboard", "[red]✗ Cannot open dashboard[/red]")
         return 7
+    except (ValueError, OSError):
+        pid = None
 
-    try:
-        pid = int(pid_file.read_text().strip())
-        os.kill(pid, 0)  # Check if process exists
-        console.print(f"✓ Proxy is running (PID: [cyan]{pid}[/cyan])")
-    except (ProcessLookupError, ValueError, OSError):
-        console.print("[yellow]⚠ Proxy is not running[/yellow]")
-        console.print("[dim]Stale PID file detected[/dim]")
+    if pid is None or not _is_running(pid):
+        _say("⚠ Proxy is not running", "[yellow]⚠ Proxy is not running[/yellow]")
+        _say("Stale PID file detected", "[dim]Stale PID file detected[/dim]")
         return 7
 
+    _say(f"✓ Proxy is running (PID: {pid})", f"✓ Proxy is running (PID: [cyan]{pid}[/cyan])")
+
     # Determine dashboard port
     if port_override:
         dashboard_port = port_override
-    elif config_path.exists():
+    elif CONFIG_PATH.exists():
         try:
-            config = load_config(config_path)
-            dashboard_port = config.dashboard.port
+            dashboard_port = _read_dashboard_port(CONFIG_PATH)
         except Exception:
-            dashboard_port = 8001  # Default
+            # Fall back to full config loading (env interpolation, validation)
+            try:
+                from bandaid.config import load_config
+
+                dashboard_port = load_config(CONFIG_PATH).dashboard.port
+            except Exception:
+                dashboard_port = DEFAULT_DASHBOARD_PORT
     else:
-        dashboard_port = 8001  # Default
+        dashboard_port = DEFAULT_DASHBOARD_PORT
 
     dashboard_url = f"http://localhost:{dashboard_port}/dashboard"
-    console.print(f"✓ Dashboard available at [cyan]{dashboard_url}[/cyan]")
+    _say(
+        f"✓ Dashboard available at {dashboard_url}",
+        f"✓ Dashboard available at [cyan]{dashboard_url}[/cyan]",
+    )
 
     if not no_open:
-        console.print("🌐 Opening in default browser...")
+        _say("🌐 Opening in default browser...")
         try:
-            webbrowser.open(dashboard_url)
+            _browser().open(dashboard_url)
         except Exception as e:
-            console.print(f"[yellow]⚠ Failed to open browser: {e}[/yellow]")
-            console.print(f"[dim]Open manually: {dashboard_url}[/dim]")
+            _say(
+                f"⚠ Failed to open browser: {e}",
+                f"[yellow]⚠ Failed to open browser: {e}[/yellow]",
+            )
+            _say(f"Open manually: {dashboard_url}", f"[dim]Open manually: {dashboard_url}[/dim]")
 
     return 0
@@ -3,16 +3,40 @@
 Interactive wizard for initial configuration with API key encryption and model downloads.
 """
 
+import contextlib
+import functools
+import importlib.util
+import os
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
-import toml
+import tomli_w
 import typer
-from cryptography.fernet import Fernet
 from rich.console import Console
 from rich.prompt import Confirm, IntPrompt, Prompt
 
+from bandaid.cli_commands._paths import KEY_FILE
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
 console = Console()
 
+# Encryptor shared by every provider key configured in this run
+_fernet: "Fernet | None" = None
+
+
+def _print_lines(*lines: str) -> None:
+    """Print a block of lines in a single console write.
+
+    Args:
+        *lines: Lines of Rich markup
+    """
+    console.print("\n".join(lines))
+
 
 def run_setup(
     config_path: Path,
@@ -24,25 +48,31 @@ def run_setup(
 
     Args:
         config_path: Path to configuration file
-        non_interactive: Skip wizard, use defaults
+        non_interactive: Skip wizard, use defaults (implied when stdin is not a terminal)
         force: Overwrite existing configuration
         model_device: Set model device (cpu, cuda, mps)
 
     Raises:
         typer.Exit: On completion or error
     """
-    # Check if config exists
+    # Prompts need a terminal; piped/scripted runs take the defaults
+    stdin_is_tty = sys.stdin.isatty()
+    interactive = not non_interactive and stdin_is_tty
+
+    # Check if config exists (without a terminal, keep the default of not overwriting)
     if config_path.exists() and not force:
         console.print(f"[yellow]⚠ Configuration already exists: {config_path}[/yellow]")
-        if not Confirm.ask("Overwrite existing configuration?", default=False):
+        if not stdin_is_tty or not Confirm.ask("Overwrite existing configuration?", default=False):
             console.print("[dim]Setup cancelled[/dim]")
             raise typer.Exit(0)
 
     # Welcome screen
-    if not non_interactive:
-        console.print("\n[bold cyan]Welcome to Bandaid Security Proxy Setup![/bold cyan]\n")
-        console.print("This wizard will guide you through initial configuration.")
-        console.print(f"You can change these settings later by editing {config_path}\n")
+    if interactive:
+        _print_lines(
+            "\n[bold cyan]Welcome to Bandaid Security Proxy Setup![/bold cyan]\n",
+            "This wizard will guide you through initial configuration.",
+            f"You can change these settings later by editing {config_path}\n",
+        )
 
         if not Confirm.ask("Press Enter to continue", default=True):
             console.print("[dim]Setup cancelled[/dim]")
@@ -70,11 +100,13 @@ def run_setup(
     }
 
     # Proxy port configuration
-    if not non_interactive:
-        console.print("\n[bold]Proxy Server Port[/bold]")
-        console.print("-" * 50)
-        console.print("Your applications will send requests to this port.\n")
-        console.print(f"Default port: [cyan]{config['general']['proxy_port']}[/cyan]")
+    if interactive:
+        _print_lines(
+            "\n[bold]Proxy Server Port[/bold]",
+            "-" * 50,
+            "Your applications will send requests to this port.\n",
+            f"Default port: [cyan]{config['general']['proxy_port']}[/cyan]",
+        )
 
         proxy_port = IntPrompt.ask(
             "Enter port (1024-65535) or press Enter for default",
@@ -88,11 +120,13 @@ def run_setup(
         config["general"]["proxy_port"] = proxy_port
 
     # Dashboard port configuration
-    if not non_interactive:
-        console.print("\n[bold]Dashboard Port[/bold]")
-        console.print("-" * 50)
-        console.print("The web dashboard will be available at http://localhost:PORT/dashboard\n")
-        console.print(f"Default port: [cyan]{config['general']['dashboard_port']}[/cyan]")
+    if interactive:
+        _print_lines(
+            "\n[bold]Dashboard Port[/bold]",
+            "-" * 50,
+            "The web dashboard will be available at http://localhost:PORT/dashboard\n",
+            f"Default port: [cyan]{config['general']['dashboard_port']}[/cyan]",
+        )
 
         dashboard_port = IntPrompt.ask(
             "Enter port (1024-65535, must differ from proxy port) or press Enter for default",
@@ -110,12 +144,12 @@ def run_setup(
         config["general"]["dashboard_port"] = dashboard_port
 
     # Provider configuration
-    if not non_interactive:
-        console.print("\n[bold]LLM Provider Setup[/bold]")
-        console.print("-" * 50)
-        console.print("Configure at least one LLM provider. You can add more later.\n")
-        console.print(
-            "Available providers: [cyan]OpenAI, Anthropic, Google (Gemini), Cohere[/cyan]\n"
+    if interactive:
+        _print_lines(
+            "\n[bold]LLM Provider Setup[/bold]",
+            "-" * 50,
+            "Configure at least one LLM provider. You can add more later.\n",
+            "Available providers: [cyan]OpenAI, Anthropic, Google (Gemini), Cohere[/cyan]\n",
         )
 
         providers_configured = _configure_providers()
@@ -129,10 +163,12 @@ def run_setup(
         console.print("[dim]Skipping provider setup (non-interactive mode)[/dim]")
 
     # Sentry configuration
-    if not non_interactive:
-        console.print("\n[bold]Sentry Integration (Optional)[/bold]")
-        console.print("-" * 50)
-        console.print("Send security events to Sentry for centralized monitoring.\n")
+    if interactive:
+        _print_lines(
+            "\n[bold]Sentry Integration (Optional)[/bold]",
+            "-" * 50,
+            "Send security events to Sentry for centralized monitoring.\n",
+        )
 
         if Confirm.ask("Enable Sentry?", default=False):
             sentry_dsn = Prompt.ask("Sentry DSN")
@@ -143,17 +179,18 @@ def run_setup(
     # Model device selection
     if model_device:
         config["general"]["model_device"] = model_device
-    elif not non_interactive:
-        console.print("\n[bold]ML Model Device[/bold]")
-        console.print("-" * 50)
-        console.print("Choose where to run security models:")
-        console.print("  • [cyan]cpu[/cyan]: Universal, slower (~1200ms for Guard)")
-        console.print("  • [cyan]cuda[/cyan]: NVIDIA GPU, faster (~300ms for Guard)")
-        console.print("  • [cyan]mps[/cyan]: Apple Silicon GPU, faster (~400ms for Guard)\n")
-
+    elif interactive:
         # Detect available hardware
         detected = _detect_device()
-        console.print(f"Detected hardware: [cyan]{detected}[/cyan]\n")
+        _print_lines(
+            "\n[bold]ML Model Device[/bold]",
+            "-" * 50,
+            "Choose where to run security models:",
+            "  • [cyan]cpu[/cyan]: Universal, slower (~1200ms for Guard)",
+            "  • [cyan]cuda[/cyan]: NVIDIA GPU, faster (~300ms for Guard)",
+            "  • [cyan]mps[/cyan]: Apple Silicon GPU, faster (~400ms for Guard)\n",
+            f"Detected hardware: [cyan]{detected}[/cyan]\n",
+        )
 
         device = Prompt.ask(
             "Select device",
@@ -163,24 +200,26 @@ def run_setup(
         config["general"]["model_device"] = device
 
     # Configuration summary
-    if not non_interactive:
-        console.print("\n[bold]Configuration Summary[/bold]")
-        console.print("-" * 50)
-        console.print(f"Proxy Port: {config['general']['proxy_port']}")
-        console.print(f"Dashboard Port: {config['general']['dashboard_port']}")
-
+    if interactive:
         if config["providers"]:
             provider_names = [
                 f"{p['provider'].capitalize()}{' (default)' if p.get('default') else ''}"
                 for p in config["providers"]
             ]
-            console.print(f"Providers: {', '.join(provider_names)}")
+            providers_line = f"Providers: {', '.join(provider_names)}"
         else:
-            console.print("Providers: (none)")
+            providers_line = "Providers: (none)"
 
         sentry_status = "Enabled" if config["observability"]["sentry_dsn"] else "Disabled"
-        console.print(f"Sentry: {sentry_status}")
-        console.print(f"Model Device: {config['general']['model_device']}\n")
+        _print_lines(
+            "\n[bold]Configuration Summary[/bold]",
+            "-" * 50,
+            f"Proxy Port: {config['general']['proxy_port']}",
+            f"Dashboard Port: {config['general']['dashboard_port']}",
+            providers_line,
+            f"Sentry: {sentry_status}",
+            f"Model Device: {config['general']['model_device']}\n",
+        )
 
         if not Confirm.ask("Save configuration?", default=True):
             console.print("[dim]Setup cancelled[/dim]")
@@ -189,27 +228,55 @@ def run_setup(
     # Save configuration
     try:
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w") as f:
-            toml.dump(config, f)
+        with _replace_atomically(config_path) as f:
+            tomli_w.dump(config, f)
         console.print(f"\n✓ Configuration saved to [cyan]{config_path}[/cyan]")
     except Exception as e:
         console.print(f"[red]✗ Failed to save configuration: {e}[/red]")
         raise typer.Exit(2) from e
 
     # Model download
-    if not non_interactive:
+    if interactive:
         console.print("\n[bold]Downloading ML Models...[/bold]")
         _download_models(config["general"]["model_device"])
 
     # Completion
-    console.print("\n[bold green]✓ Setup Complete![/bold green]\n")
-    console.print("[bold]Next Steps:[/bold]")
-    console.print("  1. Start the proxy: [cyan]guardrail start[/cyan]")
-    console.print("  2. View the dashboard: [cyan]guardrail dashboard[/cyan]")
-    console.print(
-        "  3. Test integration: Change your LLM API endpoint to [cyan]http://localhost:8000/v1[/cyan]\n"
+    _print_lines(
+        "\n[bold green]✓ Setup Complete![/bold green]\n",
+        "[bold]Next Steps:[/bold]",
+        "  1. Start the proxy: [cyan]guardrail start[/cyan]",
+        "  2. View the dashboard: [cyan]guardrail dashboard[/cyan]",
+        "  3. Test integration: Change your LLM API endpoint to "
+        "[cyan]http://localhost:8000/v1[/cyan]\n",
+        "For help, run: [cyan]guardrail --help[/cyan]\n",
     )
-    console.print("For help, run: [cyan]guardrail --help[/cyan]\n")
+
+
+@contextlib.contextmanager
+def _replace_atomically(path: Path) -> Iterator[BinaryIO]:
+    """Open a temporary file that replaces ``path`` only once fully written.
+
+    The data is fsynced and then renamed over the target, so an interrupted
+    write never leaves a truncated file behind. The file is created with
+    owner-only permissions since both the config and the key are sensitive.
+
+    Args:
+        path: Destination file
+
+    Yields:
+        Binary file handle for the new contents
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def _configure_providers() -> list[dict]:
@@ -239,8 +306,7 @@ def _configure_providers() -> list[dict]:
                 choices=available,
             )
 
-        console.print(f"\n[bold]{provider_name.capitalize()} Configuration[/bold]")
-        console.print("-" * 50)
+        _print_lines(f"\n[bold]{provider_name.capitalize()} Configuration[/bold]", "-" * 50)
 
         api_key = Prompt.ask("API Key", password=True)
 
@@ -274,30 +340,41 @@ def _encrypt_api_key(api_key: str) -> str:
     Returns:
         Encrypted API key (base64 encoded)
     """
-    # Generate or load encryption key
-    key_file = Path.home() / ".bandaid" / ".encryption_key"
+    global _fernet
+    if _fernet is None:
+        from cryptography.fernet import Fernet
 
-    if key_file.exists():
-        key = key_file.read_bytes()
-    else:
-        key = Fernet.generate_key()
-        key_file.parent.mkdir(parents=True, exist_ok=True)
-        key_file.write_bytes(key)
-        key_file.chmod(0o600)  # Restrict permissions
-
-    fernet = Fernet(key)
-    encrypted = fernet.encrypt(api_key.encode())
+        # Load encryption key, generating it on first use
+        try:
+            key = KEY_FILE.read_bytes()
+        except FileNotFoundError:
+            key = Fernet.generate_key()
+            KEY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with _replace_atomically(KEY_FILE) as f:
+                f.write(key)
+        _fernet = Fernet(key)
+
+    encrypted = _fernet.encrypt(api_key.encode())
     return encrypted.decode()
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_device() -> str:
     """Detect available hardware acceleration.
 
+    Hardware presence does not change within a process, so the result is cached.
+
     Returns:
         Device name (cpu, cuda, or mps)
     """
     try:
-        import torch
+        # Reuse torch if something already imported it; otherwise only pay the
+        # (slow) import when torch is actually installed
+        torch = sys.modules.get("torch")
+        if torch is None:
+            if importlib.util.find_spec("torch") is None:
+                return "cpu"
+            import torch
 
         if torch.cuda.is_available():
             return "cuda"
@@ -309,13 +386,33 @@ def _detect_device() -> str:
     return "cpu"
 
 
+def _fetch_model(model_id: str) -> None:
+    """Download a single model into the HuggingFace cache.
+
+    Args:
+        model_id: HuggingFace model identifier
+    """
+    if "sentence-transformers" in model_id:
+        from sentence_transformers import SentenceTransformer
+
+        SentenceTransformer(model_id)
+    else:
+        from transformers import AutoModelForTokenClassification, AutoTokenizer
+
+        AutoTokenizer.from_pretrained(model_id)
+        AutoModelForTokenClassification.from_pretrained(model_id)
+
+
 def _download_models(device: str):
     """Download required ML models.
 
+    Downloads are network/disk bound and independent, so they run concurrently
+    with a live spinner per model until each one finishes.
+
     Args:
         device: Device for model loading (cpu, cuda, mps)
     """
-    from transformers import AutoModelForTokenClassification, AutoTokenizer
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
     models_to_download = [
         ("dslim/bert-base-NER", "NER Model"),
@@ -323,19 +420,35 @@ def _download_models(device: str):
         ("sentence-transformers/all-MiniLM-L6-v2", "Embedding Model"),
     ]
 
-    for model_id, model_name in models_to_download:
-        try:
-            console.print(f"⏳ Downloading {model_name}...")
-
-            if "sentence-transformers" in model_id:
-                from sentence_transformers import SentenceTransformer
-
-                SentenceTransformer(model_id)
-            else:
-                AutoTokenizer.from_pretrained(model_id)
-                AutoModelForTokenClassification.from_pretrained(model_id)
-
-            console.print(f"✓ {model_name} downloaded")
-        except Exception as e:
-            console.print(f"[yellow]⚠ Failed to download {model_name}: {e}[/yellow]")
-            console.print("[dim]Models will be downloaded on first use[/dim]")
+    with (
+        Progress(
+            SpinnerColumn(finished_text=" "),
+            TextColumn("{task.description}"),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress,
+        ThreadPoolExecutor(max_workers=len(models_to_download)) as executor,
+    ):
+        futures = {
+            executor.submit(_fetch_model, model_id): (
+                model_name,
+                progress.add_task(f"Downloading {model_name}...", total=1),
+            )
+            for model_id, model_name in models_to_download
+        }
+        failed = False
+        for future in as_completed(futures):
+            model_name, task_id = futures[future]
+            try:
+                future.result()
+                progress.update(task_id, description=f"✓ {model_name} downloaded", completed=1)
+            except Exception as e:
+                failed = True
+                progress.update(
+                    task_id,
+                    description=f"[yellow]⚠ Failed to download {model_name}: {e}[/yellow]",
+                    completed=1,
+                )
+
+    if failed:
+        console.print("[dim]Models will be downloaded on first use[/dim]")
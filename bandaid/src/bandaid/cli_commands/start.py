@@ -3,12 +3,23 @@
 import os
 from pathlib import Path
 
-import uvicorn
 from rich.console import Console
 
+from bandaid.cli_commands._loop import run as run_async
+from bandaid.cli_commands._paths import LOG_DIR, LOG_FILE, PID_FILE
+from bandaid.cli_commands._pid import read_pid
+from bandaid.cli_commands._ports import check_ports
+
 console = Console()
 
 
+async def _init_db() -> None:
+    """Initialize the events database."""
+    from bandaid.storage.events_db import get_events_db
+
+    await get_events_db()
+
+
 def run_start(
     config_path: Path,
     foreground: bool = False,
@@ -28,24 +39,20 @@ def run_start(
     Returns:
         Exit code (0 = success, 2 = config error, 3 = model error, 5 = port in use, 6 = already running)
     """
-    from bandaid.config import load_config
-
-    pid_file = Path.home() / ".bandaid" / "proxy.pid"
-    log_dir = Path.home() / ".bandaid" / "logs"
-    log_file = log_dir / "proxy.log"
+    from bandaid.config import get_config_manager, load_config
 
     # Check if already running
-    if pid_file.exists():
+    pid = read_pid(PID_FILE)
+    if pid is not None:
         try:
-            pid = int(pid_file.read_text().strip())
             os.kill(pid, 0)  # Check if process exists
             console.print("[yellow]⚠ Proxy is already running[/yellow]")
             console.print(f"[dim]PID: {pid}[/dim]")
             console.print("[dim]Stop it first: guardrail stop[/dim]")
             return 6
-        except (ProcessLookupError, ValueError, OSError):
+        except OSError:
             # Stale PID file - remove it
-            pid_file.unlink(missing_ok=True)
+            PID_FILE.unlink(missing_ok=True)
 
     # Load and validate configuration
     console.print("Starting Bandaid Security Proxy...")
@@ -55,6 +62,9 @@ def run_start(
         console.print("[dim]Run setup first: guardrail setup[/dim]")
         return 2
 
+    # start writes runtime state anyway, so it is the command that refreshes the
+    # on-disk config cache that read-only commands then reuse
+    get_config_manager().cache_writes = True
     try:
         config = load_config(config_path)
         console.print(f"✓ Configuration loaded from {config_path}")
@@ -66,82 +76,75 @@ def run_start(
     proxy_port = port_override or config.proxy.port
     dashboard_port = dashboard_port_override or config.dashboard.port
 
-    # Check if ports are available
-    import socket
-
-    def is_port_available(port: int) -> bool:
-        """Check if port is available."""
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            try:
-                s.bind(("", port))
-                return True
-            except OSError:
-                return False
+    port_free = check_ports([proxy_port, dashboard_port])
 
-    if not is_port_available(proxy_port):
+    if not port_free[proxy_port]:
         console.print(f"[red]✗ Proxy port {proxy_port} is already in use[/red]")
         console.print(f"[dim]Try a different port: guardrail start --port {proxy_port + 1}[/dim]")
         return 5
 
-    if not is_port_available(dashboard_port):
+    if not port_free[dashboard_port]:
         console.print(f"[red]✗ Dashboard port {dashboard_port} is already in use[/red]")
         console.print(
             f"[dim]Try a different port: guardrail start --dashboard-port {dashboard_port + 1}[/dim]"
         )
         return 5
 
-    # Initialize database
+    # Only once both ports are free, so a start that exits with code 5 leaves
+    # the events database untouched
     try:
-        import asyncio
-
-        from bandaid.storage.events_db import get_events_db
-
-        asyncio.run(get_events_db())
-        console.print("✓ Database initialized (~/.bandaid/events.db, ~/.bandaid/chroma/)")
+        run_async(_init_db())
     except Exception as e:
         console.print(f"[red]✗ Failed to initialize database: {e}[/red]")
         return 2
+    console.print("✓ Database initialized (~/.bandaid/events.db, ~/.bandaid/chroma/)")
 
     # Test model loading (lazy-load in production)
     console.print("✓ Models configured (NER: lazy-load, Guard: lazy-load, Embeddings: lazy-load)")
 
     # Create log directory
-    log_dir.mkdir(parents=True, exist_ok=True)
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
 
     # Prepare to start server
     console.print(f"✓ Proxy server will listen on http://localhost:{proxy_port}")
     console.print(f"✓ Dashboard will be available at http://localhost:{dashboard_port}/dashboard")
 
     # Write PID file
-    pid_file.parent.mkdir(parents=True, exist_ok=True)
-    pid_file.write_text(str(os.getpid()))
-    console.print(f"\nPID: [cyan]{os.getpid()}[/cyan] (written to {pid_file})")
+    PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+    PID_FILE.write_text(str(os.getpid()))
+    console.print(f"\nPID: [cyan]{os.getpid()}[/cyan] (written to {PID_FILE})")
 
     if not foreground:
-        console.print(f"\nLogs: {log_file}")
+        console.print(f"\nLogs: {LOG_FILE}")
         console.print("\n[dim]Press Ctrl+C to stop or run: guardrail stop[/dim]\n")
 
-    # Start Uvicorn server
-    try:
-        # Import main FastAPI app
-        from bandaid.main import app
+    # Single process unless proxy.workers opts in: each extra worker runs its
+    # own scheduler, ChromaDB client, pattern index and models, so pattern
+    # learning is not shared between workers. Reload runs are always single-process.
+    workers = 1 if reload else config.proxy.workers
 
-        # Configure Uvicorn
+    # Start Uvicorn server (imported here so other commands don't pay for it)
+    import uvicorn
+
+    try:
+        # The app is passed as an import string, which uvicorn requires for
+        # both reload and multiple workers
         uvicorn.run(
-            app,
+            "bandaid.main:app",
             host="0.0.0.0",
             port=proxy_port,
             reload=reload,
+            workers=workers,
             log_level="info" if foreground else "warning",
             access_log=foreground,
         )
     except KeyboardInterrupt:
         console.print("\n[yellow]Proxy stopped by user[/yellow]")
-        pid_file.unlink(missing_ok=True)
+        PID_FILE.unlink(missing_ok=True)
         return 0
     except Exception as e:
         console.print(f"[red]✗ Failed to start proxy: {e}[/red]")
-        pid_file.unlink(missing_ok=True)
+        PID_FILE.unlink(missing_ok=True)
         return 1
 
     return 0
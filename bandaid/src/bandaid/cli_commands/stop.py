@@ -1,14 +1,63 @@
 """Stop command implementation for Bandaid CLI."""
 
 import os
+import select
 import signal
 import time
-from pathlib import Path
 
 from rich.console import Console
 
+from bandaid.cli_commands._paths import PID_FILE
+from bandaid.cli_commands._pid import read_pid
+
 console = Console()
 
+# How long to wait for the kernel to reap the process after SIGKILL
+_KILL_TIMEOUT = 2.0
+
+
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait for a process to exit.
+
+    On Linux a pidfd is used so the wait returns as soon as the process exits.
+    Elsewhere (or if pidfd_open is unavailable) the process is polled with
+    a back-off capped at 100 ms.
+
+    Args:
+        pid: Process ID to wait for
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the process exited within the timeout
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pass  # e.g. kernel without pidfd support; fall back to polling
+        else:
+            try:
+                readable, _, _ = select.select([pidfd], [], [], timeout)
+                return bool(readable)
+            finally:
+                os.close(pidfd)
+
+    # Poll with a short, growing back-off so quick exits are noticed quickly
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
+        try:
+            os.kill(pid, 0)  # Check if still alive
+        except ProcessLookupError:
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.1)
+
 
 def run_stop(force: bool = False, timeout: int = 30) -> int:
     """Stop the Bandaid proxy server gracefully.
@@ -20,21 +69,18 @@ def run_stop(force: bool = False, timeout: int = 30) -> int:
     Returns:
         Exit code (0 = success, 7 = not running, 1 = error)
     """
-    pid_file = Path.home() / ".bandaid" / "proxy.pid"
 
-    # Check if PID file exists
-    if not pid_file.exists():
-        console.print("[yellow]⚠ Proxy is not running[/yellow]")
-        console.print("[dim]PID file not found[/dim]")
-        return 7
+    # Read PID (a missing file is the common "not running" case)
+    pid = read_pid(PID_FILE)
+    if pid is None:
+        if not PID_FILE.exists():
+            console.print("[yellow]⚠ Proxy is not running[/yellow]")
+            console.print("[dim]PID file not found[/dim]")
+            return 7
 
-    # Read PID
-    try:
-        pid = int(pid_file.read_text().strip())
-    except (ValueError, OSError) as e:
-        console.print(f"[red]✗ Invalid PID file: {e}[/red]")
+        console.print(f"[red]✗ Invalid PID file: {PID_FILE}[/red]")
         # Clean up invalid PID file
-        pid_file.unlink(missing_ok=True)
+        PID_FILE.unlink(missing_ok=True)
         return 7
 
     # Verify process exists
@@ -44,7 +90,7 @@ def run_stop(force: bool = False, timeout: int = 30) -> int:
         console.print("[yellow]⚠ Proxy is not running[/yellow]")
         console.print(f"[dim]PID {pid} not found (stale PID file)[/dim]")
         # Clean up stale PID file
-        pid_file.unlink(missing_ok=True)
+        PID_FILE.unlink(missing_ok=True)
         return 7
     except PermissionError:
         console.print(f"[red]✗ Cannot access process {pid} (permission denied)[/red]")
@@ -60,33 +106,21 @@ def run_stop(force: bool = False, timeout: int = 30) -> int:
 
             # Wait for process to exit
             console.print(f"⏳ Waiting for shutdown (timeout: {timeout}s)...")
-            start_time = time.time()
-
-            while time.time() - start_time < timeout:
-                try:
-                    os.kill(pid, 0)  # Check if still alive
-                    time.sleep(0.5)
-                except ProcessLookupError:
-                    # Process has exited
-                    break
 
-            # Check if process is still alive
-            try:
-                os.kill(pid, 0)
-                # Still alive - force kill if requested, otherwise error
-                if force:
-                    console.print("[yellow]⚠ Graceful shutdown timed out[/yellow]")
-                else:
-                    console.print(f"[red]✗ Process did not stop within {timeout}s[/red]")
-                    console.print("[dim]Use --force to force kill[/dim]")
-                    return 1
-            except ProcessLookupError:
-                # Process has exited
+            if _wait_for_exit(pid, timeout):
                 console.print("[green]✓ Process stopped[/green]")
-                pid_file.unlink(missing_ok=True)
+                PID_FILE.unlink(missing_ok=True)
                 console.print("✓ PID file removed")
                 return 0
 
+            # Still alive - force kill if requested, otherwise error
+            if force:
+                console.print("[yellow]⚠ Graceful shutdown timed out[/yellow]")
+            else:
+                console.print(f"[red]✗ Process did not stop within {timeout}s[/red]")
+                console.print("[dim]Use --force to force kill[/dim]")
+                return 1
+
         except PermissionError:
             console.print(f"[red]✗ Cannot send signal to process {pid}[/red]")
             return 1
@@ -99,18 +133,16 @@ def run_stop(force: bool = False, timeout: int = 30) -> int:
         try:
             console.print("✓ Sent SIGKILL (force kill)")
             os.kill(pid, signal.SIGKILL)
-            time.sleep(0.5)  # Give it a moment
 
-            # Verify process is dead
-            try:
-                os.kill(pid, 0)
+            # Verify process is dead (returns as soon as the kernel reaps it)
+            if not _wait_for_exit(pid, _KILL_TIMEOUT):
                 console.print("[red]✗ Failed to kill process[/red]")
                 return 1
-            except ProcessLookupError:
-                console.print("[green]✓ Process terminated[/green]")
-                pid_file.unlink(missing_ok=True)
-                console.print("✓ PID file removed")
-                return 0
+
+            console.print("[green]✓ Process terminated[/green]")
+            PID_FILE.unlink(missing_ok=True)
+            console.print("✓ PID file removed")
+            return 0
 
         except PermissionError:
             console.print(f"[red]✗ Cannot kill process {pid}[/red]")
@@ -1,11 +1,177 @@
 """Validate command implementation for Bandaid CLI."""
 
-import socket
+import asyncio
+import contextlib
+import os
+import shutil
+import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-from rich.console import Console
+from bandaid.cli_commands._console import get_console
+from bandaid.cli_commands._fs import dir_size
+from bandaid.cli_commands._loop import run as run_async
+from bandaid.cli_commands._paths import BANDAID_DIR, CHROMA_DIR, EVENTS_DB
+from bandaid.cli_commands._ports import check_ports
 
-console = Console()
+if TYPE_CHECKING:
+    from bandaid.config import Config
+
+
+class _StorageReport(NamedTuple):
+    """Sizes of the Bandaid data stores and free disk space, in bytes."""
+
+    db_size: int | None
+    chroma_size: int | None
+    free_bytes: int
+
+
+def _storage_report(root: Path) -> _StorageReport:
+    """Measure the events database, ChromaDB directory and free space together.
+
+    A single scandir of the Bandaid directory finds both stores (the entry's
+    cached stat is reused for the database), and free space comes from one
+    statvfs call.
+
+    Args:
+        root: Bandaid data directory (~/.bandaid)
+
+    Returns:
+        Storage report; sizes are None for stores that do not exist yet
+    """
+    db_size = chroma_size = None
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.name == EVENTS_DB.name and entry.is_file():
+                    db_size = entry.stat().st_size
+                elif entry.name == CHROMA_DIR.name and entry.is_dir():
+                    chroma_size = dir_size(Path(entry.path))
+    except OSError:
+        pass
+
+    # Free space of the filesystem holding the data (home if not created yet)
+    disk_root = root if root.exists() else Path.home()
+    if hasattr(os, "statvfs"):
+        fs = os.statvfs(disk_root)
+        free_bytes = fs.f_bavail * fs.f_frsize
+    else:
+        free_bytes = shutil.disk_usage(disk_root).free
+
+    return _StorageReport(db_size, chroma_size, free_bytes)
+
+
+def _load_ner_model(device: str) -> None:
+    """Initialize the NER validator."""
+    from bandaid.security.ner_validator import get_ner_validator
+
+    get_ner_validator(device=device).initialize()
+
+
+def _load_guard_model(device: str) -> None:
+    """Initialize the Guard validator."""
+    from bandaid.security.guard_validator import get_guard_validator
+
+    get_guard_validator(device=device).initialize()
+
+
+def _load_embedding_model(device: str) -> None:
+    """Initialize the sentence embedder (device is chosen by the embedder)."""
+    from bandaid.learning.embedder import get_sentence_embedder
+
+    get_sentence_embedder().initialize()
+
+
+def _timed_load(loader: Callable[[str], None], device: str) -> float:
+    """Run a model loader and return how long it took in seconds."""
+    start = time.perf_counter()
+    loader(device)
+    return time.perf_counter() - start
+
+
+class _Section(NamedTuple):
+    """Rendered lines of one report section plus the problems it found."""
+
+    lines: list[str]
+    warnings: list[str]
+    errors: list[str]
+
+
+async def _port_section(proxy_port: int, dashboard_port: int) -> _Section:
+    """Check that the proxy and dashboard ports are free."""
+    port_free = await asyncio.to_thread(check_ports, [proxy_port, dashboard_port])
+    section = _Section([], [], [])
+    for label, port in (("Proxy", proxy_port), ("Dashboard", dashboard_port)):
+        if port_free[port]:
+            section.lines.append(f"✓ {label} port {port} is available")
+        else:
+            section.lines.append(f"[yellow]⚠ {label} port {port} is in use[/yellow]")
+            section.warnings.append(f"Port {port} in use")
+    return section
+
+
+async def _storage_section() -> _Section:
+    """Report the size of the data stores and the free disk space."""
+    storage = await asyncio.to_thread(_storage_report, BANDAID_DIR)
+    lines = ["\n[bold]Storage[/bold]", "-" * 50]
+
+    if storage.db_size is not None:
+        size_mb = storage.db_size / (1024 * 1024)
+        lines.append(f"✓ SQLite database: {EVENTS_DB} ({size_mb:.1f} MB)")
+    else:
+        lines.append("[dim]ℹ SQLite database: Not initialized yet[/dim]")
+
+    if storage.chroma_size is not None:
+        size_mb = storage.chroma_size / (1024 * 1024)
+        lines.append(f"✓ ChromaDB directory: {CHROMA_DIR} ({size_mb:.1f} MB)")
+    else:
+        lines.append("[dim]ℹ ChromaDB directory: Not initialized yet[/dim]")
+
+    # Disk space
+    free_gb = storage.free_bytes / (1024**3)
+    lines.append(f"[dim]ℹ Disk space available: {free_gb:.0f} GB[/dim]")
+    return _Section(lines, [], [])
+
+
+# Model checks: name -> (display label, loader)
+_MODEL_CHECKS: dict[str, tuple[str, Callable[[str], None]]] = {
+    "NER": ("NER model (dslim/bert-base-NER)", _load_ner_model),
+    "Guard": ("Guard model (meta-llama/Llama-Guard-3-8B)", _load_guard_model),
+    "Embedding": ("Embedding model (all-MiniLM-L6-v2)", _load_embedding_model),
+}
+
+
+async def _model_section(device: str) -> _Section:
+    """Load every ML model concurrently and report how long each took."""
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_timed_load, loader, device) for _, loader in _MODEL_CHECKS.values()),
+        return_exceptions=True,
+    )
+    section = _Section(["\n[bold]ML Models (--check-models)[/bold]", "-" * 50], [], [])
+    for (name, (label, _)), result in zip(_MODEL_CHECKS.items(), results, strict=True):
+        if isinstance(result, BaseException):
+            section.lines.append(f"[red]✗ {name} model failed to load: {result}[/red]")
+            section.errors.append(f"{name} model")
+        else:
+            section.lines.append(f"✓ {label}: Loaded in {result:.1f}s")
+    return section
+
+
+async def _run_checks(config: "Config", check_models: bool) -> list[_Section]:
+    """Run the port, storage and (optionally) model checks concurrently.
+
+    Args:
+        config: Loaded configuration
+        check_models: Also load all ML models
+
+    Returns:
+        Port, storage and (if requested) model sections, in that order
+    """
+    checks = [_port_section(config.proxy.port, config.dashboard.port), _storage_section()]
+    if check_models:
+        checks.append(_model_section(config.models.device))
+    return list(await asyncio.gather(*checks))
 
 
 def run_validate(
@@ -25,200 +191,110 @@ def run_validate(
     """
     from bandaid.config import load_config
 
-    console.print("[bold]Bandaid Configuration Validation[/bold]")
-    console.print("=" * 50 + "\n")
+    console = get_console()
 
-    warnings = []
-    errors = []
+    # The report is collected here and rendered in one print
+    out = ["[bold]Bandaid Configuration Validation[/bold]", "=" * 50 + "\n"]
+
+    warnings: list[str] = []
+    errors: list[str] = []
 
     # Configuration File
-    console.print("[bold]Configuration File[/bold]")
-    console.print("-" * 50)
+    out += ["[bold]Configuration File[/bold]", "-" * 50]
 
     if not config_path.exists():
-        console.print(f"[red]✗ File not found: {config_path}[/red]")
-        console.print("[dim]Run setup first: guardrail setup[/dim]")
+        out += [
+            f"[red]✗ File not found: {config_path}[/red]",
+            "[dim]Run setup first: guardrail setup[/dim]",
+        ]
+        console.print("\n".join(out))
         return 2
 
-    console.print(f"✓ File exists: {config_path}")
+    out.append(f"✓ File exists: {config_path}")
 
     try:
         config = load_config(config_path)
-        console.print("✓ Valid TOML syntax")
-        console.print("✓ All required fields present")
+        out += ["✓ Valid TOML syntax", "✓ All required fields present"]
     except Exception as e:
-        console.print(f"[red]✗ Configuration invalid: {e}[/red]")
+        out.append(f"[red]✗ Configuration invalid: {e}[/red]")
+        console.print("\n".join(out))
         return 2
 
-    # Port availability
-    def is_port_available(port: int) -> bool:
-        """Check if port is available."""
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            try:
-                s.bind(("", port))
-                return True
-            except OSError:
-                return False
-
-    if is_port_available(config.proxy.port):
-        console.print(f"✓ Proxy port {config.proxy.port} is available")
-    else:
-        console.print(f"[yellow]⚠ Proxy port {config.proxy.port} is in use[/yellow]")
-        warnings.append(f"Port {config.proxy.port} in use")
+    # Port, storage and model checks are independent, so they run together;
+    # each section is rendered below in the usual order
+    status = console.status("Loading models...") if check_models else contextlib.nullcontext()
+    with status:
+        ports, storage, *models = run_async(_run_checks(config, check_models))
 
-    if is_port_available(config.dashboard.port):
-        console.print(f"✓ Dashboard port {config.dashboard.port} is available")
-    else:
-        console.print(f"[yellow]⚠ Dashboard port {config.dashboard.port} is in use[/yellow]")
-        warnings.append(f"Port {config.dashboard.port} in use")
+    out += ports.lines
+    warnings += ports.warnings
 
     # Confidence thresholds
     high = config.security.confidence.high
     medium = config.security.confidence.medium_min
-    console.print(
-        f"✓ Confidence thresholds valid (high: {high}, medium: {medium}-{high - 0.01:.2f})"
-    )
+    out.append(f"✓ Confidence thresholds valid (high: {high}, medium: {medium}-{high - 0.01:.2f})")
 
     # Provider Configuration
-    console.print("\n[bold]Provider Configuration[/bold]")
-    console.print("-" * 50)
+    out += ["\n[bold]Provider Configuration[/bold]", "-" * 50]
 
     if not config.providers:
-        console.print("[red]✗ No providers configured[/red]")
+        out.append("[red]✗ No providers configured[/red]")
         errors.append("No providers")
     else:
-        default_found = False
         for provider in config.providers:
-            has_key = bool(provider.api_key)
-            is_default = provider.default
+            name = provider.provider.capitalize()
+            api_key = provider.api_key
 
-            if is_default:
-                default_found = True
-
-            if has_key:
+            if api_key:
                 # Mask the API key for display
-                masked_key = (
-                    f"{provider.api_key[:8]}...{provider.api_key[-3:]}"
-                    if len(provider.api_key) > 11
-                    else "***"
-                )
-                default_marker = " [default]" if is_default else ""
-                console.print(
-                    f"✓ {provider.provider.capitalize()}: API key configured ({masked_key}){default_marker}"
-                )
+                masked_key = f"{api_key[:8]}...{api_key[-3:]}" if len(api_key) > 11 else "***"
+                default_marker = " [default]" if provider.default else ""
+                out.append(f"✓ {name}: API key configured ({masked_key}){default_marker}")
             else:
-                console.print(
-                    f"[yellow]⚠ {provider.provider.capitalize()}: API key not configured (provider disabled)[/yellow]"
-                )
+                out.append(f"[yellow]⚠ {name}: API key not configured (provider disabled)[/yellow]")
                 warnings.append(f"{provider.provider} not configured")
 
-        if not default_found:
-            console.print("[red]✗ No default provider set[/red]")
+        if config._default_index < 0:
+            out.append("[red]✗ No default provider set[/red]")
             errors.append("No default provider")
 
     # ML Models (optional check)
-    if check_models:
-        console.print("\n[bold]ML Models (--check-models)[/bold]")
-        console.print("-" * 50)
-
-        import time
-
-        # NER Model
-        try:
-            from bandaid.security.ner_validator import get_ner_validator
-
-            start = time.time()
-            ner = get_ner_validator(device=config.models.device)
-            ner.initialize()
-            elapsed = time.time() - start
-            console.print(f"✓ NER model (dslim/bert-base-NER): Loaded in {elapsed:.1f}s")
-        except Exception as e:
-            console.print(f"[red]✗ NER model failed to load: {e}[/red]")
-            errors.append("NER model")
-
-        # Guard Model
-        try:
-            from bandaid.security.guard_validator import get_guard_validator
-
-            start = time.time()
-            guard = get_guard_validator(device=config.models.device)
-            guard.initialize()
-            elapsed = time.time() - start
-            console.print(f"✓ Guard model (meta-llama/Llama-Guard-3-8B): Loaded in {elapsed:.1f}s")
-        except Exception as e:
-            console.print(f"[red]✗ Guard model failed to load: {e}[/red]")
-            errors.append("Guard model")
-
-        # Embedding Model
-        try:
-            from bandaid.learning.embedder import get_sentence_embedder
-
-            start = time.time()
-            embedder = get_sentence_embedder()
-            embedder.initialize()
-            elapsed = time.time() - start
-            console.print(f"✓ Embedding model (all-MiniLM-L6-v2): Loaded in {elapsed:.1f}s")
-        except Exception as e:
-            console.print(f"[red]✗ Embedding model failed to load: {e}[/red]")
-            errors.append("Embedding model")
+    for section in models:
+        out += section.lines
+        errors += section.errors
 
     # Storage
-    console.print("\n[bold]Storage[/bold]")
-    console.print("-" * 50)
-
-    events_db = Path.home() / ".bandaid" / "events.db"
-    chroma_dir = Path.home() / ".bandaid" / "chroma"
-
-    if events_db.exists():
-        size_mb = events_db.stat().st_size / (1024 * 1024)
-        # Count events (approximate)
-        console.print(f"✓ SQLite database: {events_db} ({size_mb:.1f} MB)")
-    else:
-        console.print("[dim]ℹ SQLite database: Not initialized yet[/dim]")
-
-    if chroma_dir.exists():
-        total_size = sum(f.stat().st_size for f in chroma_dir.rglob("*") if f.is_file())
-        size_mb = total_size / (1024 * 1024)
-        console.print(f"✓ ChromaDB directory: {chroma_dir} ({size_mb:.1f} MB)")
-    else:
-        console.print("[dim]ℹ ChromaDB directory: Not initialized yet[/dim]")
-
-    # Disk space
-    import shutil
-
-    total, used, free = shutil.disk_usage(Path.home())
-    free_gb = free / (1024**3)
-    console.print(f"[dim]ℹ Disk space available: {free_gb:.0f} GB[/dim]")
+    out += storage.lines
 
     # Provider Connectivity (optional check)
     if check_providers:
-        console.print("\n[bold]Provider Connectivity (--check-providers)[/bold]")
-        console.print("-" * 50)
-        console.print("[dim]Provider connectivity checks not implemented yet[/dim]")
+        out += [
+            "\n[bold]Provider Connectivity (--check-providers)[/bold]",
+            "-" * 50,
+            "[dim]Provider connectivity checks not implemented yet[/dim]",
+        ]
 
     # Warnings and Summary
     if warnings:
-        console.print("\n[bold]Warnings[/bold]")
-        console.print("-" * 50)
-        for warning in warnings:
-            console.print(f"[yellow]⚠ {warning}[/yellow]")
+        out += ["\n[bold]Warnings[/bold]", "-" * 50]
+        out += [f"[yellow]⚠ {warning}[/yellow]" for warning in warnings]
 
         if config.models.device == "cpu":
-            console.print("[yellow]⚠ Running on CPU (consider GPU for better performance)[/yellow]")
+            out.append("[yellow]⚠ Running on CPU (consider GPU for better performance)[/yellow]")
 
-    console.print("\n[bold]Summary[/bold]")
-    console.print("-" * 50)
+    out += ["\n[bold]Summary[/bold]", "-" * 50]
 
     if errors:
-        console.print(f"[red]Status: FAILED ({len(errors)} errors)[/red]")
-        for error in errors:
-            console.print(f"  [red]• {error}[/red]")
+        out.append(f"[red]Status: FAILED ({len(errors)} errors)[/red]")
+        out += [f"  [red]• {error}[/red]" for error in errors]
+        console.print("\n".join(out))
         return 3 if "model" in str(errors).lower() else 2
     elif warnings:
-        console.print(f"[green]Status: HEALTHY[/green] [yellow]({len(warnings)} warnings)[/yellow]")
+        out.append(f"[green]Status: HEALTHY[/green] [yellow]({len(warnings)} warnings)[/yellow]")
     else:
-        console.print("[green]Status: HEALTHY[/green]")
+        out.append("[green]Status: HEALTHY[/green]")
 
-    console.print("\n[dim]Configuration is valid. Run 'guardrail start' to begin.[/dim]")
+    out.append("\n[dim]Configuration is valid. Run 'guardrail start' to begin.[/dim]")
+    console.print("\n".join(out))
 
     return 0
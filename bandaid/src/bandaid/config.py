@@ -4,13 +4,107 @@ Loads configuration from TOML file with environment variable interpolation,
 validates using Pydantic models, and provides type-safe access to settings.
 """
 
+import functools
+import hashlib
+import hmac
+import json
 import os
-import tomllib
+import platform
+import re
+import sys
+import threading
+from collections.abc import Callable
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, get_args, get_origin
 
-from cryptography.fernet import Fernet
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+if TYPE_CHECKING:
+    import httpx
+    from cryptography.fernet import Fernet
+
+# ${VAR_NAME} references in string config values
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _env_var_value(match: re.Match[str]) -> str:
+    """Resolve an environment variable reference (empty string if unset)."""
+    return os.environ.get(match.group(1), "")
+
+
+@functools.cache
+def _toml_parser() -> Callable[[str], dict[str, Any]]:
+    """Pick the TOML parser: rtoml (Rust) when installed, else stdlib tomllib."""
+    try:
+        import rtoml
+
+        return rtoml.loads  # type: ignore[no-any-return]
+    except ImportError:
+        import tomllib
+
+        return tomllib.loads
+
+
+# Bandaid home directory, resolved once at import; BANDAID_HOME overrides ~/.bandaid
+BANDAID_HOME = Path(os.environ.get("BANDAID_HOME") or Path.home() / ".bandaid")
+
+# API key encryption key, shared by every ConfigManager in the process
+_KEY_PATH = BANDAID_HOME / ".key"
+_key_lock = threading.Lock()
+
+
+@functools.cache
+def _load_encryption_key() -> bytes:
+    """Read the API key encryption key, generating it on first use.
+
+    Cached for the life of the process; the lock keeps concurrent first
+    callers from generating two different keys.
+    """
+    with _key_lock:
+        try:
+            return _KEY_PATH.read_bytes()
+        except FileNotFoundError:
+            pass
+
+        # Deferred: cryptography loads OpenSSL bindings, which most config
+        # reads never need
+        from cryptography.fernet import Fernet
+
+        key = Fernet.generate_key()
+        _KEY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _KEY_PATH.write_bytes(key)
+        _KEY_PATH.chmod(0o600)  # Restrict permissions
+        return key
+
+
+@functools.cache
+def _shared_fernet() -> "Fernet":
+    """Get the Fernet cipher for the encryption key (built once per process)."""
+    from cryptography.fernet import Fernet
+
+    return Fernet(_load_encryption_key())
+
+
+@functools.cache
+def _package_version() -> str:
+    """Get the installed bandaid version (keys the on-disk config cache)."""
+    try:
+        return version("bandaid")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _config_tag(data: bytes) -> str:
+    """Compute the HMAC-SHA256 tag for the cached config JSON.
+
+    The cache is only trusted if this installation wrote it.
+
+    The MAC key is derived from the API key encryption key rather than
+    reusing it directly.
+    """
+    mac_key = hmac.new(_load_encryption_key(), b"bandaid-config-tag", hashlib.sha256).digest()
+    return hmac.new(mac_key, data, hashlib.sha256).hexdigest()
 
 
 class ProxyConfig(BaseModel):
@@ -18,7 +112,14 @@ class ProxyConfig(BaseModel):
 
     host: str = Field(default="0.0.0.0", description="Proxy server host")
     port: int = Field(default=8000, ge=1024, le=65535, description="Proxy server port")
-    workers: int = Field(default=1, ge=1, description="Number of workers")
+    workers: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of uvicorn worker processes. Values above 1 are incompatible with "
+            "pattern learning and the cleanup scheduler (each worker keeps its own state)"
+        ),
+    )
     reload: bool = Field(default=False, description="Enable auto-reload for development")
 
 
@@ -197,18 +298,66 @@ class Config(BaseModel):
             raise ValueError("Proxy and dashboard ports must be different")
         return self
 
+    # Index of the default provider in providers (-1 if none), set by
+    # validate_default_provider
+    _default_index: int = PrivateAttr(default=-1)
+
     @model_validator(mode="after")
     def validate_default_provider(self) -> "Config":
         """Ensure exactly one provider is marked as default if providers exist."""
-        if self.providers:
-            default_count = sum(1 for p in self.providers if p.default)
-            if default_count == 0:
-                # Auto-mark first provider as default
-                self.providers[0].default = True
-            elif default_count > 1:
-                raise ValueError("Only one provider can be marked as default")
+        self._index_default_provider()
         return self
 
+    def _index_default_provider(self) -> None:
+        """Find the default provider (auto-marking the first) and record its index."""
+        default_index = -1
+        for index, provider in enumerate(self.providers):
+            if provider.default:
+                if default_index >= 0:
+                    raise ValueError("Only one provider can be marked as default")
+                default_index = index
+
+        if default_index < 0 and self.providers:
+            # Auto-mark first provider as default
+            self.providers[0].default = True
+            default_index = 0
+
+        self._default_index = default_index
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _construct_trusted(model: type[_ModelT], data: dict[str, Any]) -> _ModelT:
+    """Build a model from already-validated data without running validators.
+
+    model_construct() only builds the top level, so nested model fields (and
+    lists of models) are constructed recursively here. Missing fields get
+    their defaults.
+
+    Args:
+        model: Model class to build
+        data: Field values, as produced by model_dump()
+
+    Returns:
+        Model instance
+    """
+    values: dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        if name not in data:
+            continue
+        value = data[name]
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if isinstance(value, dict):
+                value = _construct_trusted(annotation, value)
+        elif get_origin(annotation) is list and isinstance(value, list):
+            (item_type,) = get_args(annotation)
+            if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+                value = [_construct_trusted(item_type, item) for item in value]
+        values[name] = value
+    return model.model_construct(**values)
+
 
 class ConfigManager:
     """Configuration manager with encryption support."""
@@ -217,32 +366,26 @@ class ConfigManager:
         """Initialize configuration manager.
 
         Args:
-            config_path: Path to configuration file (defaults to ~/.bandaid/config.toml)
+            config_path: Path to configuration file (defaults to $BANDAID_HOME/config.toml)
         """
-        self.config_path = config_path or Path.home() / ".bandaid" / "config.toml"
+        self.config_path = config_path or BANDAID_HOME / "config.toml"
         self._config: Config | None = None
-        self._fernet: Fernet | None = None
+        self.cache_enabled = True
+        # Only commands that already write state (start) refresh the on-disk
+        # cache; read-only commands use it but never write it
+        self.cache_writes = False
+        # In-process memo of validated configs: path -> (content digest, config)
+        self._loaded: dict[Path, tuple[str, Config]] = {}
+        # Decrypted API keys by ciphertext
+        self._decrypted_keys: dict[str, str] = {}
 
     def _get_encryption_key(self) -> bytes:
         """Get or create encryption key for API keys."""
-        key_path = Path.home() / ".bandaid" / ".key"
-        key_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if key_path.exists():
-            return key_path.read_bytes()
-
-        # Generate new key
-        key = Fernet.generate_key()
-        key_path.write_bytes(key)
-        key_path.chmod(0o600)  # Restrict permissions
-        return key
+        return _load_encryption_key()
 
-    def _get_fernet(self) -> Fernet:
+    def _get_fernet(self) -> "Fernet":
         """Get Fernet cipher for encryption/decryption."""
-        if self._fernet is None:
-            key = self._get_encryption_key()
-            self._fernet = Fernet(key)
-        return self._fernet
+        return _shared_fernet()
 
     def encrypt_api_key(self, api_key: str) -> str:
         """Encrypt API key for storage.
@@ -266,35 +409,56 @@ class ConfigManager:
         Returns:
             Decrypted API key
         """
-        fernet = self._get_fernet()
-        decrypted = fernet.decrypt(encrypted_key.encode())
-        return decrypted.decode()
+        # Ciphertext -> plaintext is fixed for a given key, so cache it
+        decrypted = self._decrypted_keys.get(encrypted_key)
+        if decrypted is None:
+            fernet = self._get_fernet()
+            decrypted = fernet.decrypt(encrypted_key.encode()).decode()
+            self._decrypted_keys[encrypted_key] = decrypted
+        return decrypted
 
-    def _interpolate_env_vars(self, value: Any) -> Any:
-        """Recursively interpolate environment variables in configuration values.
+    def _interpolate_env_vars(self, config: dict[str, Any]) -> bool:
+        """Interpolate environment variables in configuration values, in place.
 
-        Replaces ${VAR_NAME} with environment variable value.
+        Replaces each ${VAR_NAME} inside a string value with the variable's
+        value (empty string if unset). Walks the tree iteratively and only
+        rewrites strings that contain a reference.
 
         Args:
-            value: Configuration value (can be dict, list, string, etc.)
+            config: Parsed configuration (modified in place)
 
         Returns:
-            Value with environment variables interpolated
+            True if any value referenced an environment variable
         """
-        if isinstance(value, str):
-            if value.startswith("${") and value.endswith("}"):
-                env_var = value[2:-1]
-                return os.getenv(env_var, "")
-            return value
-        elif isinstance(value, dict):
-            return {k: self._interpolate_env_vars(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self._interpolate_env_vars(item) for item in value]
-        return value
+        found = False
+        stack: list[dict[str, Any] | list[Any]] = [config]
+        while stack:
+            container = stack.pop()
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                if isinstance(value, str):
+                    if "${" in value:
+                        value, count = _ENV_VAR_RE.subn(_env_var_value, value)
+                        if count:
+                            container[key] = value  # type: ignore[index]
+                            found = True
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        return found
 
     def load_config(self, config_path: Path | None = None) -> Config:
         """Load configuration from TOML file.
 
+        A validated copy is cached as JSON under $BANDAID_HOME/cache and reused
+        while the file's path and contents (SHA-256) and the bandaid version are
+        unchanged, so edits by any writer invalidate it; repeated loads in the
+        same process are answered from memory. The cache is HMAC-tagged with a
+        key derived from the API key encryption key and ignored if the tag does
+        not match. It is only written when cache_writes is set, so read-only
+        commands never write to disk. Configurations that interpolate
+        environment variables are never cached, so resolved secrets are not
+        written to disk.
+
         Args:
             config_path: Path to configuration file (overrides default)
 
@@ -307,26 +471,112 @@ class ConfigManager:
         """
         path = config_path or self.config_path
 
-        if not path.exists():
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found: {path}\n"
                 f"Run 'guardrail setup' to create configuration."
-            )
+            ) from None
 
-        with open(path, "rb") as f:
-            raw_config = tomllib.load(f)
+        cache_key = hashlib.sha256(data).hexdigest()
+        if self.cache_enabled:
+            loaded = self._loaded.get(path)
+            if loaded is not None and loaded[0] == cache_key:
+                self._config = loaded[1]
+                return loaded[1]
+
+            cached = self._read_config_cache(path, cache_key)
+            if cached is not None:
+                self._loaded[path] = (cache_key, cached)
+                self._config = cached
+                return cached
+
+        raw_config = _toml_parser()(data.decode("utf-8"))
 
         # Interpolate environment variables
-        interpolated_config = self._interpolate_env_vars(raw_config)
+        uses_env = self._interpolate_env_vars(raw_config)
 
         # Validate and create Config model
         try:
-            config = Config(**interpolated_config)
-            self._config = config
-            return config
+            config = Config(**raw_config)
         except Exception as e:
             raise ValueError(f"Invalid configuration: {e}") from e
 
+        self._config = config
+        if self.cache_enabled and not uses_env:
+            self._loaded[path] = (cache_key, config)
+            if self.cache_writes:
+                self._write_config_cache(path, cache_key, config)
+        return config
+
+    @staticmethod
+    def _config_cache_path(config_path: Path) -> Path:
+        """Get the cache file path for a configuration file."""
+        digest = hashlib.sha256(os.path.abspath(config_path).encode()).hexdigest()[:16]
+        return BANDAID_HOME / "cache" / f"config-{digest}.json"
+
+    def _read_config_cache(self, config_path: Path, cache_key: str) -> Config | None:
+        """Read a cached configuration if it matches the file's current contents.
+
+        Args:
+            config_path: Path to configuration file
+            cache_key: SHA-256 hex digest of the configuration file
+
+        Returns:
+            Cached configuration, or None if missing, stale, tampered with, or unreadable
+        """
+        if not _KEY_PATH.exists():
+            # No key means no cache this installation tagged; don't create one on a read
+            return None
+        try:
+            tag, _, payload = self._config_cache_path(config_path).read_bytes().partition(b"\n")
+        except OSError:
+            return None
+        if not hmac.compare_digest(tag, _config_tag(payload).encode()):
+            return None
+
+        try:
+            cached = json.loads(payload)
+        except ValueError:
+            return None
+        if not isinstance(cached, dict) or cached.get("key") != [
+            _package_version(),
+            os.path.abspath(config_path),
+            cache_key,
+        ]:
+            return None
+
+        # Tagged by this installation from a validated Config, so skip validation
+        config = _construct_trusted(Config, cached["config"])
+        config._index_default_provider()
+        return config
+
+    def _write_config_cache(self, config_path: Path, cache_key: str, config: Config) -> None:
+        """Write a validated configuration to the cache file (best effort).
+
+        Args:
+            config_path: Path to configuration file
+            cache_key: SHA-256 hex digest of the configuration file
+            config: Validated configuration
+        """
+        payload = json.dumps(
+            {
+                "key": [_package_version(), os.path.abspath(config_path), cache_key],
+                "config": config.model_dump(mode="json"),
+            }
+        ).encode()
+        cache_path = self._config_cache_path(config_path)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_config_tag(payload).encode() + b"\n" + payload)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
     def save_config(self, config: Config, config_path: Path | None = None) -> None:
         """Save configuration to TOML file.
 
@@ -340,60 +590,12 @@ class ConfigManager:
         # Convert config to dict (Pydantic model_dump)
         config_dict = config.model_dump(exclude_none=True)
 
-        # Convert to TOML format (manual serialization since tomllib only loads)
-        toml_str = self._dict_to_toml(config_dict)
+        import tomli_w
 
-        path.write_text(toml_str)
+        with open(path, "wb") as f:
+            tomli_w.dump(config_dict, f)
         path.chmod(0o600)  # Restrict permissions
-
-    def _dict_to_toml(self, data: dict[str, Any], prefix: str = "") -> str:
-        """Convert dictionary to TOML format string.
-
-        Args:
-            data: Dictionary to convert
-            prefix: Prefix for nested tables
-
-        Returns:
-            TOML formatted string
-        """
-        lines = []
-
-        # Simple values first
-        for key, value in data.items():
-            if not isinstance(value, (dict, list)):
-                lines.append(f"{key} = {self._value_to_toml(value)}")
-
-        # Then tables
-        for key, value in data.items():
-            if isinstance(value, dict) and not self._is_array_of_tables(value):
-                table_name = f"{prefix}.{key}" if prefix else key
-                lines.append(f"\n[{table_name}]")
-                lines.append(self._dict_to_toml(value, table_name))
-            elif isinstance(value, list) and value and isinstance(value[0], dict):
-                # Array of tables
-                for item in value:
-                    table_name = f"{prefix}.{key}" if prefix else key
-                    lines.append(f"\n[[{table_name}]]")
-                    lines.append(self._dict_to_toml(item, ""))
-
-        return "\n".join(lines)
-
-    def _is_array_of_tables(self, value: Any) -> bool:
-        """Check if value should be serialized as array of tables."""
-        return bool(isinstance(value, list) and value and isinstance(value[0], dict))
-
-    def _value_to_toml(self, value: Any) -> str:
-        """Convert Python value to TOML representation."""
-        if isinstance(value, bool):
-            return str(value).lower()
-        elif isinstance(value, str):
-            return f'"{value}"'
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, list):
-            items = [self._value_to_toml(item) for item in value]
-            return f"[{', '.join(items)}]"
-        return str(value)
+        self._decrypted_keys.clear()
 
     @property
     def config(self) -> Config:
@@ -448,14 +650,35 @@ def get_config() -> Config:
     return manager.config
 
 
+def _has_gpu_hardware() -> bool:
+    """Cheaply check whether this machine has a GPU torch could use.
+
+    Looks for the NVIDIA driver (or the ROCm kernel driver, which torch also
+    exposes as "cuda") and for Apple Silicon, without importing torch.
+    """
+    if sys.platform == "darwin":
+        return platform.machine() == "arm64"
+    return any(
+        os.path.exists(path) for path in ("/proc/driver/nvidia/version", "/dev/nvidia0", "/dev/kfd")
+    )
+
+
+@functools.cache
 def detect_device() -> Literal["cpu", "cuda", "mps"]:
     """Auto-detect best available device for model inference.
 
+    Importing torch takes most of a second, so the hardware is probed first
+    and torch is only consulted when a GPU is present (to confirm the
+    installed build can use it). The result is cached for the process.
+
     Returns:
         Detected device: "cuda" if NVIDIA GPU available,
                         "mps" if Apple Silicon GPU available,
                         "cpu" otherwise
     """
+    if not _has_gpu_hardware():
+        return "cpu"
+
     try:
         import torch
 
@@ -492,12 +715,78 @@ def get_device() -> Literal["cpu", "cuda", "mps"]:
         return detect_device()
 
 
-async def validate_provider_config(provider: ProviderConfig, timeout: int = 10) -> dict[str, Any]:
+# Upper bound on how much of a provider's model list is downloaded during validation
+_MAX_PROBE_BODY = 64 * 1024
+
+
+async def _read_capped(response: "httpx.Response", limit: int = _MAX_PROBE_BODY) -> bytes | None:
+    """Read a streamed response body, giving up once it exceeds limit bytes.
+
+    Args:
+        response: Streamed response
+        limit: Maximum number of bytes to read
+
+    Returns:
+        The body, or None if it is larger than limit (the rest is not downloaded)
+    """
+    chunks = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def _probe_model_list(
+    client: "httpx.AsyncClient",
+    url: str,
+    result: dict[str, Any],
+    *,
+    list_key: str,
+    id_key: str,
+    headers: dict[str, str] | None = None,
+    params: dict[str, Any] | None = None,
+) -> None:
+    """Check a provider's model list endpoint and record the outcome in result.
+
+    A 200 status is enough to validate the key; the first five model ids are
+    added when the (size-capped) body could be read in full.
+
+    Args:
+        client: HTTP client
+        url: Model list endpoint
+        result: Validation result to update
+        list_key: JSON key holding the model list
+        id_key: Model field to report
+        headers: Request headers
+        params: Query parameters
+    """
+    async with client.stream("GET", url, headers=headers, params=params) as response:
+        body = await _read_capped(response)
+
+    if response.status_code == 200:
+        if body is not None:
+            data = json.loads(body)
+            result["models"] = [m[id_key] for m in data.get(list_key, [])[:5]]  # First 5 models
+        result["valid"] = True
+    else:
+        text = body.decode(errors="replace") if body is not None else ""
+        result["error"] = f"HTTP {response.status_code}: {text[:100]}"
+
+
+async def validate_provider_config(
+    provider: ProviderConfig,
+    client: "httpx.AsyncClient | None" = None,
+    timeout: int = 10,
+) -> dict[str, Any]:
     """Validate provider configuration by testing API connectivity.
 
     Args:
         provider: Provider configuration to validate
-        timeout: Request timeout in seconds
+        client: Shared HTTP client (a temporary one is created if omitted)
+        timeout: Request timeout in seconds (used when creating a client)
 
     Returns:
         Dictionary with validation results:
@@ -510,6 +799,10 @@ async def validate_provider_config(provider: ProviderConfig, timeout: int = 10)
     """
     import httpx
 
+    if client is None:
+        async with httpx.AsyncClient(timeout=timeout) as own_client:
+            return await validate_provider_config(provider, own_client, timeout)
+
     result = {"valid": False, "provider": provider.provider, "error": None, "models": []}
 
     try:
@@ -523,15 +816,9 @@ async def validate_provider_config(provider: ProviderConfig, timeout: int = 10)
             url = provider.base_url or "https://api.openai.com/v1"
             headers = {"Authorization": f"Bearer {api_key}"}
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(f"{url}/models", headers=headers)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    result["valid"] = True
-                    result["models"] = [m["id"] for m in data.get("data", [])[:5]]  # First 5 models
-                else:
-                    result["error"] = f"HTTP {response.status_code}: {response.text[:100]}"
+            await _probe_model_list(
+                client, f"{url}/models", result, list_key="data", id_key="id", headers=headers
+            )
 
         elif provider.provider.lower() == "anthropic":
             # Test Anthropic API
@@ -539,55 +826,53 @@ async def validate_provider_config(provider: ProviderConfig, timeout: int = 10)
             headers = {"x-api-key": api_key, "anthropic-version": "2023-06-01"}
 
             # Anthropic doesn't have a models endpoint, so we make a small completion request
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    f"{url}/messages",
-                    headers=headers,
-                    json={
-                        "model": "claude-3-haiku-20240307",
-                        "max_tokens": 1,
-                        "messages": [{"role": "user", "content": "test"}],
-                    },
-                )
-
-                if response.status_code in [200, 201]:
-                    result["valid"] = True
-                    result["models"] = [
-                        "claude-3-haiku-20240307",
-                        "claude-3-sonnet-20240229",
-                        "claude-3-opus-20240229",
-                    ]
-                else:
-                    result["error"] = f"HTTP {response.status_code}: {response.text[:100]}"
+            response = await client.post(
+                f"{url}/messages",
+                headers=headers,
+                json={
+                    "model": "claude-3-haiku-20240307",
+                    "max_tokens": 1,
+                    "messages": [{"role": "user", "content": "test"}],
+                },
+            )
+
+            if response.status_code in [200, 201]:
+                result["valid"] = True
+                result["models"] = [
+                    "claude-3-haiku-20240307",
+                    "claude-3-sonnet-20240229",
+                    "claude-3-opus-20240229",
+                ]
+            else:
+                result["error"] = f"HTTP {response.status_code}: {response.text[:100]}"
 
         elif provider.provider.lower() == "google":
             # Test Google Gemini API
             url = provider.base_url or "https://generativelanguage.googleapis.com/v1"
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(f"{url}/models?key={api_key}")
-
-                if response.status_code == 200:
-                    data = response.json()
-                    result["valid"] = True
-                    result["models"] = [m["name"] for m in data.get("models", [])[:5]]
-                else:
-                    result["error"] = f"HTTP {response.status_code}: {response.text[:100]}"
+            await _probe_model_list(
+                client,
+                f"{url}/models",
+                result,
+                list_key="models",
+                id_key="name",
+                params={"key": api_key, "pageSize": 5},
+            )
 
         elif provider.provider.lower() == "cohere":
             # Test Cohere API
             url = provider.base_url or "https://api.cohere.ai/v1"
             headers = {"Authorization": f"Bearer {api_key}"}
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(f"{url}/models", headers=headers)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    result["valid"] = True
-                    result["models"] = [m["name"] for m in data.get("models", [])[:5]]
-                else:
-                    result["error"] = f"HTTP {response.status_code}: {response.text[:100]}"
+            await _probe_model_list(
+                client,
+                f"{url}/models",
+                result,
+                list_key="models",
+                id_key="name",
+                headers=headers,
+                params={"page_size": 5},
+            )
 
         else:
             # Unknown provider - skip validation
@@ -602,3 +887,33 @@ async def validate_provider_config(provider: ProviderConfig, timeout: int = 10)
         result["error"] = f"Validation error: {str(e)}"
 
     return result
+
+
+async def validate_all_providers(
+    providers: list[ProviderConfig], timeout: int = 10
+) -> list[dict[str, Any]]:
+    """Validate several providers concurrently over one HTTP client.
+
+    Sharing the client pools connections (and the TLS setup behind them)
+    across probes; HTTP/2 is used when the optional h2 package is installed.
+
+    Args:
+        providers: Provider configurations to validate
+        timeout: Request timeout in seconds
+
+    Returns:
+        Validation results in the same order as providers
+    """
+    import asyncio
+    import importlib.util
+
+    import httpx
+
+    async with httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=timeout,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    ) as client:
+        return list(
+            await asyncio.gather(*(validate_provider_config(p, client, timeout) for p in providers))
+        )
@@ -4,19 +4,37 @@ Provides REST API endpoints for the dashboard UI to fetch statistics,
 events, and learned patterns.
 """
 
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query
+import msgspec
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from bandaid.config import get_config
+from bandaid.config import Config, get_config
 from bandaid.observability.logger import get_logger
 from bandaid.storage.events_db import get_events_db
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = datetime.fromisoformat
+
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api", tags=["dashboard"])
 
+# Serialized /api/config body for the config object it was built from; a
+# reload replaces the Config instance, which invalidates the entry
+_config_response_cache: tuple[Config, bytes] | None = None
+
 
 # Response Models
 class StatsResponse(BaseModel):
@@ -44,6 +62,30 @@ class EventItem(BaseModel):
     model: str | None
 
 
+class EventRow(msgspec.Struct, frozen=True):
+    """Wire form of EventItem, encoded directly by msgspec.
+
+    get_events serializes these instead of EventItem; the Pydantic models stay
+    as the documented response_model (OpenAPI schema). Field order and types
+    must match EventItem.
+    """
+
+    id: str
+    timestamp: str
+    event_type: str
+    threat_type: str | None
+    confidence_level: float | None
+    request_id: str
+    redacted_content: str
+    severity_level: str
+    detection_layer: str | None
+    provider: str | None
+    model: str | None
+
+
+_json_encoder = msgspec.json.Encoder()
+
+
 class EventsResponse(BaseModel):
     """Events response model."""
 
@@ -85,6 +127,93 @@ class ConfigResponse(BaseModel):
     sentry_enabled: bool
 
 
+def _event_row(row: dict) -> EventRow:
+    """Build an EventRow from a security_events row.
+
+    msgspec does not validate on construction. Rows come from our own schema,
+    whose column types already match EventItem (test_events_db.py checks this).
+    """
+    return EventRow(
+        row["id"],
+        row["timestamp"],
+        row["event_type"],
+        row.get("threat_type"),
+        row.get("confidence_level"),
+        row["request_id"],
+        row["redacted_content"],
+        row["severity_level"],
+        row.get("detection_layer"),
+        row.get("provider"),
+        row.get("model"),
+    )
+
+
+async def _events_body(
+    first: dict | None,
+    rows: AsyncGenerator[dict, None],
+    count: int,
+    page: int,
+    per_page: int,
+) -> AsyncIterator[bytes]:
+    """Encode an EventsResponse body incrementally, one event row at a time.
+
+    The first row and the total are read before the response starts, so
+    database errors surface as a 500; the remaining rows are encoded as the
+    cursor reads them.
+
+    Args:
+        first: First event row (None if the page is empty)
+        rows: Remaining event rows from EventsDatabase.stream_events
+        count: count_events result for the same filters
+        page: Page number
+        per_page: Items per page
+
+    Yields:
+        JSON chunks with the same shape as EventsResponse
+    """
+    try:
+        yield b'{"events":['
+        if first is not None:
+            yield _json_encoder.encode(_event_row(first))
+            async for row in rows:
+                yield b"," + _json_encoder.encode(_event_row(row))
+
+        total_pages = (count + per_page - 1) // per_page
+        yield b'],"total":%d,"page":%d,"per_page":%d,"total_pages":%d}' % (
+            count,
+            page,
+            per_page,
+            total_pages,
+        )
+    except Exception as e:
+        # Headers are already sent, so this can only abort the response
+        logger.error("failed to stream events", error=str(e), exc_info=True)
+        raise
+    finally:
+        await rows.aclose()
+
+
+def _pattern_item(row: dict) -> PatternItem:
+    """Build a PatternItem from an attack_pattern_metadata row without validation.
+
+    Rows come from our own schema, whose column types already match the model
+    (tests/unit/storage/test_events_db.py checks this), so per-field
+    validation is skipped on this hot path.
+    """
+    threat_types = row["threat_types"]
+    return PatternItem.model_construct(
+        id=row["id"],
+        # Stored as a JSON array (see EventsDatabase.insert_pattern_metadata)
+        threat_types=json_loads(threat_types)
+        if isinstance(threat_types, (str, bytes))
+        else threat_types,
+        detection_count=row["detection_count"],
+        first_seen=row["first_seen"],
+        last_seen=row["last_seen"],
+        redacted_text=row["redacted_text"],
+    )
+
+
 @router.get("/stats", response_model=StatsResponse)
 async def get_stats():
     """Get aggregate statistics for dashboard.
@@ -135,14 +264,23 @@ async def get_events(
         db = await get_events_db()
 
         # Parse timestamps
-        start_dt = datetime.fromisoformat(start_time) if start_time else None
-        end_dt = datetime.fromisoformat(end_time) if end_time else None
+        start_dt = parse_datetime(start_time) if start_time else None
+        end_dt = parse_datetime(end_time) if end_time else None
 
         # Calculate offset
         offset = (page - 1) * per_page
 
-        # Fetch events
-        events = await db.get_events(
+        # Count on one pooled connection while the page streams from another
+        count_task = asyncio.ensure_future(
+            db.count_events(
+                event_type=event_type,
+                threat_type=threat_type,
+                severity=severity,
+                start_time=start_dt,
+                end_time=end_dt,
+            )
+        )
+        rows = db.stream_events(
             event_type=event_type,
             threat_type=threat_type,
             severity=severity,
@@ -152,35 +290,19 @@ async def get_events(
             offset=offset,
         )
 
-        # Get total count (approximate - could be optimized with separate count query)
-        # For now, if we get a full page, assume there might be more
-        total = offset + len(events) + (per_page if len(events) == per_page else 0)
-        total_pages = (total + per_page - 1) // per_page
-
-        # Convert to response models
-        event_items = [
-            EventItem(
-                id=e["id"],
-                timestamp=e["timestamp"],
-                event_type=e["event_type"],
-                threat_type=e.get("threat_type"),
-                confidence_level=e.get("confidence_level"),
-                request_id=e["request_id"],
-                redacted_content=e["redacted_content"],
-                severity_level=e["severity_level"],
-                detection_layer=e.get("detection_layer"),
-                provider=e.get("provider"),
-                model=e.get("model"),
-            )
-            for e in events
-        ]
-
-        return EventsResponse(
-            events=event_items,
-            total=total,
-            page=page,
-            per_page=per_page,
-            total_pages=total_pages,
+        # Wait for the first row and the count before sending headers, so a
+        # failing query is still reported as an error status
+        try:
+            first = await anext(rows, None)
+            count = await count_task
+        except BaseException:
+            count_task.cancel()
+            await asyncio.gather(count_task, return_exceptions=True)
+            await rows.aclose()
+            raise
+
+        return StreamingResponse(
+            _events_body(first, rows, count, page, per_page), media_type="application/json"
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid timestamp format: {e}") from e
@@ -206,19 +328,7 @@ async def get_patterns(
         patterns = await db.get_top_patterns(limit=limit)
 
         # Convert to response models
-        pattern_items = [
-            PatternItem(
-                id=p["id"],
-                threat_types=eval(p["threat_types"])
-                if isinstance(p["threat_types"], str)
-                else p["threat_types"],
-                detection_count=p["detection_count"],
-                first_seen=p["first_seen"],
-                last_seen=p["last_seen"],
-                redacted_text=p["redacted_text"],
-            )
-            for p in patterns
-        ]
+        pattern_items = [_pattern_item(p) for p in patterns]
 
         return PatternsResponse(
             patterns=pattern_items,
@@ -234,13 +344,20 @@ async def get_config_status():
     """Get current configuration status (T074).
 
     Returns non-sensitive configuration information for dashboard display.
+    The JSON body is built once per loaded configuration and reused.
 
     Returns:
         ConfigResponse with current configuration
     """
+    global _config_response_cache
+
     try:
         config = get_config()
 
+        cached = _config_response_cache
+        if cached is not None and cached[0] is config:
+            return Response(content=cached[1], media_type="application/json")
+
         # Build providers list (sanitized - no API keys)
         providers_list = [
             {
@@ -266,7 +383,7 @@ async def get_config_status():
             config.observability and config.observability.sentry and config.observability.sentry.dsn
         )
 
-        return ConfigResponse(
+        response = ConfigResponse(
             proxy_port=config.proxy.port,
             dashboard_port=config.dashboard.port,
             log_retention_days=config.storage.sqlite.retention_days,
@@ -276,6 +393,9 @@ async def get_config_status():
             disabled_checks=disabled,
             sentry_enabled=sentry_enabled,
         )
+        body = response.model_dump_json().encode()
+        _config_response_cache = (config, body)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error("failed to get config", error=str(e), exc_info=True)
@@ -0,0 +1,103 @@
+"""Static file serving for the dashboard with precompressed assets.
+
+Serves ``<file>.br`` / ``<file>.gz`` siblings (created by ``just compress-static``)
+to clients that accept them, and falls back to the plain file otherwise.
+"""
+
+import os
+import stat
+from functools import lru_cache
+from mimetypes import guess_type
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# Preferred first
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Parse an Accept-Encoding header into the encodings it allows.
+
+    Args:
+        header: Accept-Encoding header value
+
+    Returns:
+        Lowercased encoding names, excluding any sent with q=0
+    """
+    accepted = set()
+    for item in header.split(","):
+        encoding, _, params = item.partition(";")
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(encoding.strip().lower())
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves precompressed variants and caches path lookups.
+
+    The dashboard assets ship with the package and do not change while the
+    server runs, so each path's stat result is looked up once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize static file app (same arguments as StaticFiles)."""
+        super().__init__(*args, **kwargs)
+        self._cached_lookup = lru_cache(maxsize=256)(super().lookup_path)
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        """Resolve a request path to a file and its stat result (cached).
+
+        Args:
+            path: Path relative to the static directory
+
+        Returns:
+            Tuple of (full_path, stat_result), stat_result None if not found
+        """
+        return self._cached_lookup(path)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve the best precompressed variant the client accepts, else the file.
+
+        Args:
+            path: Path relative to the static directory
+            scope: ASGI scope
+
+        Returns:
+            HTTP response
+        """
+        request_headers = Headers(scope=scope)
+        accept_encoding = request_headers.get("accept-encoding")
+
+        if accept_encoding and scope["method"] in ("GET", "HEAD"):
+            accepted = _accepted_encodings(accept_encoding)
+            for encoding, suffix in _ENCODINGS:
+                if encoding not in accepted:
+                    continue
+                try:
+                    full_path, stat_result = self.lookup_path(path + suffix)
+                except (OSError, ValueError):
+                    # Invalid path; let StaticFiles produce the error response
+                    break
+                if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+                    encoded = FileResponse(
+                        full_path,
+                        stat_result=stat_result,
+                        media_type=guess_type(path)[0] or "text/plain",
+                        headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+                    )
+                    if self.is_not_modified(encoded.headers, request_headers):
+                        return NotModifiedResponse(encoded.headers)
+                    return encoded
+
+        response = await super().get_response(path, scope)
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
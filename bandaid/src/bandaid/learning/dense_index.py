@@ -0,0 +1,164 @@
+"""Exact in-memory index over attack pattern embeddings.
+
+Fallback for :mod:`bandaid.learning.faiss_index` when the optional ``faiss``
+extra is not installed, so similarity queries still run in-process instead of
+going through ChromaDB.
+"""
+
+import threading
+
+import numpy as np
+import numpy.typing as npt
+
+from bandaid.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DensePatternIndex:
+    """Brute-force cosine index backed by a contiguous float32 matrix.
+
+    Rows are L2-normalized on insert, so scoring a query is one matrix-vector
+    product (a multithreaded BLAS sgemv) followed by ``np.argpartition`` for
+    the top k. Deleted rows are filled by moving the last row into their
+    slot, keeping the live rows contiguous. Same interface as
+    FaissPatternIndex.
+    """
+
+    def __init__(self, dim: int = 384, capacity: int = 1024):
+        """Initialize an empty index.
+
+        Args:
+            dim: Embedding dimension
+            capacity: Initial number of rows to allocate
+        """
+        self.dim = dim
+        self._vectors = np.empty((capacity, dim), dtype=np.float32)
+        self._ids: list[str] = []  # row -> pattern ID
+        self._positions: dict[str, int] = {}  # pattern ID -> row
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of patterns in the index."""
+        return len(self._ids)
+
+    def add(self, ids: list[str], embeddings: npt.ArrayLike) -> None:
+        """Add pattern embeddings to the index.
+
+        Args:
+            ids: Pattern IDs
+            embeddings: Embedding vectors, one per ID (list of lists or (N, dim) array)
+        """
+        if not ids:
+            return
+
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(len(ids), self.dim)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.maximum(norms, 1e-12)
+
+        with self._lock:
+            for pattern_id, vector in zip(ids, vectors, strict=True):
+                row = self._positions.get(pattern_id)
+                if row is None:
+                    row = len(self._ids)
+                    if row == len(self._vectors):
+                        self._grow()
+                    self._ids.append(pattern_id)
+                    self._positions[pattern_id] = row
+                # A re-added ID overwrites its previous vector
+                self._vectors[row] = vector
+
+    def _grow(self) -> None:
+        """Double the row capacity (caller holds the lock)."""
+        grown = np.empty((max(2 * len(self._vectors), 1), self.dim), dtype=np.float32)
+        grown[: len(self._ids)] = self._vectors[: len(self._ids)]
+        self._vectors = grown
+
+    def remove(self, ids: list[str]) -> None:
+        """Remove patterns from the index.
+
+        Args:
+            ids: Pattern IDs to remove
+        """
+        with self._lock:
+            for pattern_id in ids:
+                row = self._positions.pop(pattern_id, None)
+                if row is None:
+                    continue
+                last = len(self._ids) - 1
+                last_id = self._ids.pop()
+                if row != last:
+                    self._vectors[row] = self._vectors[last]
+                    self._ids[row] = last_id
+                    self._positions[last_id] = row
+
+    def search(self, query_embedding: npt.ArrayLike, k: int) -> list[tuple[str, float]]:
+        """Find the patterns most similar to a query embedding.
+
+        Args:
+            query_embedding: Query vector
+            k: Maximum number of results
+
+        Returns:
+            (pattern_id, cosine similarity) pairs, most similar first
+        """
+        return self.search_batch(np.asarray(query_embedding).reshape(1, self.dim), k)[0]
+
+    def search_batch(
+        self, query_embeddings: npt.ArrayLike, k: int
+    ) -> list[list[tuple[str, float]]]:
+        """Find the patterns most similar to each of several query embeddings.
+
+        All queries are scored with one matrix-matrix product (BLAS sgemm).
+
+        Args:
+            query_embeddings: Query matrix, shape (B, dim)
+            k: Maximum number of results per query
+
+        Returns:
+            One list of (pattern_id, cosine similarity) pairs per query, most similar first
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(-1, self.dim)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.maximum(norms, 1e-12)
+
+        with self._lock:
+            total = len(self._ids)
+            if total == 0 or k <= 0:
+                return [[] for _ in range(len(queries))]
+            scores = queries @ self._vectors[:total].T  # (B, total)
+            ids = list(self._ids)
+
+        if k < total:
+            top = np.argpartition(scores, total - k, axis=1)[:, total - k :]
+        else:
+            top = np.broadcast_to(np.arange(total), scores.shape)
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        return [
+            [(ids[row], float(score)) for row, score in zip(rows, row_scores, strict=True)]
+            for rows, row_scores in zip(top, top_scores, strict=True)
+        ]
+
+    @classmethod
+    def from_embeddings(
+        cls, ids: list[str], embeddings: npt.ArrayLike | None, dim: int = 384
+    ) -> "DensePatternIndex":
+        """Build an index from stored pattern embeddings.
+
+        Args:
+            ids: Pattern IDs
+            embeddings: Embedding vectors, one per ID (None if none were stored)
+            dim: Embedding dimension
+
+        Returns:
+            Populated DensePatternIndex
+        """
+        index = cls(dim=dim, capacity=max(len(ids), 1024))
+        if ids and embeddings is not None:
+            index.add(ids, embeddings)
+
+        logger.info("dense pattern index built", patterns=len(index))
+        return index
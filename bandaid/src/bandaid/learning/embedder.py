@@ -4,42 +4,113 @@ Uses sentence-transformers/all-MiniLM-L6-v2 to generate 384-dimensional embeddin
 for attack patterns, enabling semantic similarity search and self-learning.
 """
 
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
 from bandaid.observability.logger import get_logger
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import numpy as np
+
 logger = get_logger(__name__)
 
 
+# Longest input (in tokens) the ONNX path embeds; matches all-MiniLM-L6-v2's
+# max_seq_length so vectors line up with ones from the PyTorch model
+_ONNX_MAX_LENGTH = 256
+
+
 class SentenceEmbedder:
-    """Sentence transformer embedder for generating semantic embeddings."""
+    """Sentence transformer embedder for generating semantic embeddings.
 
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+    On CPU, when optimum[onnxruntime] is installed, the model is exported to
+    ONNX once, dynamically quantized to int8 and cached under ~/.bandaid/models;
+    encoding then runs through ONNX Runtime with mean pooling and L2
+    normalization done in numpy. GPUs, and CPUs without optimum, use the
+    PyTorch SentenceTransformer (FP16 on CUDA).
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        quantize: bool = True,
+        device: str | None = None,
+    ):
         """Initialize embedder (lazy-loaded).
 
         Args:
             model_name: HuggingFace model identifier
+            quantize: Use the int8 ONNX model on CPU when optimum[onnxruntime] is installed
+            device: Inference device (default: resolved from config on load)
         """
         self.model_name = model_name
+        self.quantize = quantize
+        self.device = device
         self.model = None
+        self.session = None
+        self.tokenizer = None
+        self._input_names: list[str] = []
         self._initialized = False
+        self._init_lock = threading.Lock()
 
     def initialize(self) -> None:
         """Load the sentence transformer model.
 
-        Loads model from HuggingFace transformers library.
+        Prefers the cached int8 ONNX model (exporting it on first use) and
+        falls back to the PyTorch model from HuggingFace. Safe to call from
+        several threads at once: callers that arrive while the model is
+        loading wait for it instead of loading a second copy.
         """
         if self._initialized:
             logger.debug("embedder already initialized")
             return
 
+        with self._init_lock:
+            if not self._initialized:
+                self._load()
+
+    def _load(self) -> None:
+        """Load the model (caller holds the init lock)."""
+        if self.device is None:
+            from bandaid.config import get_device
+
+            self.device = get_device()
+
+        # The int8 model only runs on ONNX Runtime's CPU provider; GPUs keep
+        # the PyTorch model
+        if self.quantize and self.device == "cpu":
+            try:
+                self._load_quantized()
+                self._initialized = True
+                return
+            except ImportError:
+                logger.debug("optimum[onnxruntime] not installed, using PyTorch embedder")
+            except Exception as e:
+                logger.warning(
+                    "int8 ONNX embedder unavailable, using PyTorch embedder", error=str(e)
+                )
+
         try:
             from sentence_transformers import SentenceTransformer
 
             logger.info("loading sentence transformer", model=self.model_name)
 
-            self.model = SentenceTransformer(self.model_name)
+            self.model = SentenceTransformer(self.model_name, device=self.device)
+            if self.model.device.type == "cuda":
+                # FP16 halves weight/activation bandwidth and runs on tensor
+                # cores; the drift in cosine scores (~1e-3) is far below the
+                # matching thresholds
+                self.model.half()
             self._initialized = True
 
-            logger.info("sentence transformer loaded", model=self.model_name)
+            logger.info(
+                "sentence transformer loaded",
+                model=self.model_name,
+                device=str(self.model.device),
+            )
 
         except ImportError:
             logger.error("sentence-transformers not installed")
@@ -50,6 +121,95 @@ class SentenceEmbedder:
             logger.error("failed to load sentence transformer", error=str(e), exc_info=True)
             raise
 
+    def _quantized_model_dir(self) -> "Path":
+        """Get the cache directory for this model's int8 ONNX export."""
+        from bandaid.config import BANDAID_HOME
+
+        return BANDAID_HOME / "models" / f"{self.model_name.rsplit('/', 1)[-1]}-int8"
+
+    def _load_quantized(self) -> None:
+        """Load the int8 ONNX model and tokenizer, exporting them if not cached.
+
+        Raises:
+            ImportError: If optimum[onnxruntime] is not installed
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        model_dir = self._quantized_model_dir()
+        model_path = model_dir / "model_quantized.onnx"
+        if not model_path.exists():
+            self._export_quantized(model_dir)
+
+        logger.info("loading int8 ONNX embedder", model=self.model_name, path=str(model_path))
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.session = ort.InferenceSession(str(model_path), providers=["CPUExecutionProvider"])
+        self._input_names = [i.name for i in self.session.get_inputs()]
+
+        logger.info("int8 ONNX embedder loaded", model=self.model_name)
+
+    def _export_quantized(self, model_dir: "Path") -> None:
+        """Export the model to ONNX and quantize it to int8 (one-time).
+
+        Weights are quantized to QInt8 ahead of time; activations are
+        quantized dynamically (QUInt8) at inference, so no calibration data
+        is needed. The VNNI configuration uses int8 dot-product instructions
+        where the CPU has them and still runs correctly where it does not.
+
+        Args:
+            model_dir: Directory to write the quantized model and tokenizer to
+        """
+        import tempfile
+
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        logger.info("exporting int8 ONNX embedder", model=self.model_name, path=str(model_dir))
+
+        model_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=model_dir) as export_dir:
+            ORTModelForFeatureExtraction.from_pretrained(
+                self.model_name, export=True
+            ).save_pretrained(export_dir)
+            quantizer = ORTQuantizer.from_pretrained(export_dir)
+            quantizer.quantize(
+                save_dir=model_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(
+                    is_static=False, per_channel=False
+                ),
+            )
+        AutoTokenizer.from_pretrained(self.model_name).save_pretrained(model_dir)
+
+    def _encode_onnx(self, texts: list[str]) -> "np.ndarray":
+        """Embed texts with the int8 ONNX model.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Array of L2-normalized embeddings, shape (len(texts), 384)
+        """
+        import numpy as np
+
+        inputs = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=_ONNX_MAX_LENGTH,
+            return_tensors="np",
+        )
+        feed = {name: inputs[name].astype(np.int64) for name in self._input_names}
+        token_embeddings = self.session.run(None, feed)[0]
+
+        # Mean-pool over real (non-padding) tokens, then L2-normalize
+        mask = inputs["attention_mask"].astype(np.float32)
+        pooled = np.einsum("bsd,bs->bd", token_embeddings, mask)
+        pooled /= np.clip(mask.sum(axis=1, keepdims=True), 1e-9, None)
+        norms = np.sqrt(np.einsum("bd,bd->b", pooled, pooled))[:, None]
+        return pooled / np.clip(norms, 1e-12, None)
+
     def is_initialized(self) -> bool:
         """Check if embedder is initialized.
 
@@ -58,14 +218,14 @@ class SentenceEmbedder:
         """
         return self._initialized
 
-    def encode(self, text: str) -> list[float]:
+    def encode(self, text: str) -> "np.ndarray":
         """Generate embedding vector for text.
 
         Args:
             text: Input text to embed
 
         Returns:
-            384-dimensional embedding vector
+            float32 embedding vector, shape (384,)
 
         Raises:
             RuntimeError: If embedder not initialized
@@ -74,24 +234,25 @@ class SentenceEmbedder:
             raise RuntimeError("Embedder not initialized. Call initialize() first.")
 
         try:
-            # Generate embedding
-            embedding = self.model.encode(text, convert_to_tensor=False)
+            if self.session is not None:
+                return self._encode_onnx([text])[0]
 
-            # Convert to list for serialization
-            return embedding.tolist()
+            # Generate embedding (FP16 on CUDA, so normalize the dtype)
+            embedding = self.model.encode(text, convert_to_tensor=False)
+            return embedding.astype("float32", copy=False)
 
         except Exception as e:
             logger.error("embedding generation failed", error=str(e), exc_info=True)
             raise
 
-    def encode_batch(self, texts: list[str]) -> list[list[float]]:
+    def encode_batch(self, texts: list[str]) -> "np.ndarray":
         """Generate embeddings for multiple texts (batched for efficiency).
 
         Args:
             texts: List of input texts
 
         Returns:
-            List of 384-dimensional embedding vectors
+            float32 embedding matrix, shape (len(texts), 384)
 
         Raises:
             RuntimeError: If embedder not initialized
@@ -100,11 +261,12 @@ class SentenceEmbedder:
             raise RuntimeError("Embedder not initialized. Call initialize() first.")
 
         try:
+            if self.session is not None:
+                return self._encode_onnx(texts)
+
             # Generate embeddings in batch
             embeddings = self.model.encode(texts, convert_to_tensor=False, show_progress_bar=False)
-
-            # Convert to list of lists
-            return [emb.tolist() for emb in embeddings]
+            return embeddings.astype("float32", copy=False)
 
         except Exception as e:
             logger.error("batch embedding generation failed", error=str(e), exc_info=True)
@@ -134,6 +296,112 @@ def get_sentence_embedder(
     return _embedder_instance
 
 
+class PatternEmbeddingBatcher:
+    """Coalesces concurrent embedding requests into batched forward passes.
+
+    Texts submitted within a short window (or until the batch is full) are
+    embedded with a single encode_batch call in the default executor, which
+    is much cheaper per text than one encode call each. Bound to the event
+    loop it was created on.
+    """
+
+    def __init__(
+        self,
+        embedder: SentenceEmbedder,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 20.0,
+    ):
+        """Initialize batcher.
+
+        Args:
+            embedder: Embedder used for the batched encode calls
+            max_batch_size: Flush as soon as this many texts are pending
+            max_wait_ms: Flush at the latest this long after the first pending text
+        """
+        self.embedder = embedder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.loop = asyncio.get_running_loop()
+        self._pending: list[tuple[str, asyncio.Future[np.ndarray]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def embed(self, text: str) -> "np.ndarray":
+        """Queue a text for the next batch and wait for its embedding.
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            float32 embedding vector, shape (384,)
+        """
+        future: asyncio.Future[np.ndarray] = self.loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Hand the pending texts to a batch task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            # Keep a reference so the task is not garbage collected mid-flight
+            task = self.loop.create_task(self.process_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def process_batch(self, batch: "list[tuple[str, asyncio.Future[np.ndarray]]]") -> None:
+        """Embed a batch of texts and resolve each waiter with its vector.
+
+        Args:
+            batch: (text, future) pairs, in submission order
+        """
+        texts = [text for text, _ in batch]
+        try:
+            embeddings = await self.loop.run_in_executor(None, self._encode, texts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings, strict=True):
+            if not future.done():
+                future.set_result(embedding)
+
+    def _encode(self, texts: list[str]) -> "np.ndarray":
+        """Embed texts on a worker thread, loading the model on first use."""
+        if not self.embedder.is_initialized():
+            self.embedder.initialize()
+        return self.embedder.encode_batch(texts)
+
+
+# Global batcher instance (one per event loop)
+_batcher_instance: PatternEmbeddingBatcher | None = None
+
+
+def get_pattern_batcher() -> PatternEmbeddingBatcher:
+    """Get or create the embedding batcher for the running event loop.
+
+    Returns:
+        PatternEmbeddingBatcher instance
+    """
+    global _batcher_instance
+
+    if _batcher_instance is None or _batcher_instance.loop is not asyncio.get_running_loop():
+        _batcher_instance = PatternEmbeddingBatcher(get_sentence_embedder())
+
+    return _batcher_instance
+
+
 async def learn_pattern_async(
     text: str,
     threat_types: list,
@@ -155,26 +423,24 @@ async def learn_pattern_async(
     Returns:
         Pattern ID if learned (str), None if duplicate or error
     """
-    import asyncio
     from datetime import datetime
     from uuid import uuid4
 
     from bandaid.models.patterns import AttackPattern
 
     try:
-        # Run in thread pool to avoid blocking (embedding is CPU-intensive)
-        loop = asyncio.get_event_loop()
-
-        def _generate_embedding_and_learn():
-            try:
-                # Get embedder
-                embedder = get_sentence_embedder()
-                if not embedder.is_initialized():
-                    embedder.initialize()
+        # Embeddings for concurrently learned patterns share one batched forward pass
+        embedding = await get_pattern_batcher().embed(text)
+    except Exception as e:
+        logger.error("pattern embedding failed", error=str(e), exc_info=True)
+        return None
 
-                # Generate embedding
-                embedding = embedder.encode(text)
+    try:
+        # Run in thread pool to avoid blocking (ChromaDB calls are synchronous)
+        loop = asyncio.get_running_loop()
 
+        def _store_pattern():
+            try:
                 # Check for duplicate (similarity > 0.95)
                 duplicate = pattern_store.check_duplicate(
                     query_embedding=embedding,
@@ -182,39 +448,27 @@ async def learn_pattern_async(
                 )
 
                 if duplicate:
-                    pattern_id, similarity = duplicate
+                    pattern_id, similarity, _ = duplicate
                     logger.info(
                         "duplicate pattern detected, incrementing count",
                         pattern_id=str(pattern_id),
                         similarity=similarity,
                     )
 
-                    # Get existing pattern and increment detection count
-                    results = pattern_store.query_similar(
-                        query_embedding=embedding,
-                        n_results=1,
-                        similarity_threshold=0.95,
-                    )
-
-                    if results:
-                        _, _, existing_pattern = results[0]
-                        pattern_store.update_pattern(
-                            pattern_id=pattern_id,
-                            detection_count=existing_pattern.detection_count + 1,
-                            last_seen=datetime.utcnow().isoformat(),
-                        )
+                    pattern_store.increment_detection(pattern_id, datetime.utcnow().isoformat())
 
                     return None  # Duplicate, not a new pattern
 
-                # Create new attack pattern
+                # Create new attack pattern (first and last seen share one clock read)
+                now = datetime.utcnow()
                 pattern = AttackPattern(
                     id=uuid4(),
                     pattern_text=text[:500],  # Truncate long texts
                     threat_types=threat_types,
                     confidence_level=confidence,
                     detection_count=1,
-                    first_seen=datetime.utcnow(),
-                    last_seen=datetime.utcnow(),
+                    first_seen=now,
+                    last_seen=now,
                 )
 
                 # Store pattern with embedding
@@ -234,7 +488,7 @@ async def learn_pattern_async(
                 return None
 
         # Run in thread pool
-        pattern_id = await loop.run_in_executor(None, _generate_embedding_and_learn)
+        pattern_id = await loop.run_in_executor(None, _store_pattern)
         return pattern_id
 
     except Exception as e:
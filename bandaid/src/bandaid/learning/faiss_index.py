@@ -0,0 +1,162 @@
+"""In-memory FAISS index over attack pattern embeddings.
+
+ChromaDB remains the durable store; this index is rebuilt from it at startup
+and kept in sync on writes so similarity queries run in-process. Requires the
+optional ``faiss`` extra (faiss-cpu).
+"""
+
+import threading
+
+import faiss
+import numpy as np
+import numpy.typing as npt
+
+from bandaid.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FaissPatternIndex:
+    """HNSW inner-product index over L2-normalized pattern embeddings.
+
+    Inner product of unit vectors is cosine similarity, so scores match the
+    ``1 - cosine distance`` ChromaDB reports. Vectors are stored as FP16
+    (768 bytes per 384-d pattern instead of 1536), which FAISS decodes with
+    SIMD during the scan; at the 0.85/0.95 thresholds the rounding error
+    (~1e-4) does not change any match. FAISS labels are insertion
+    positions; a sidecar list maps them back to pattern IDs. HNSW cannot
+    remove vectors, so deletions are tombstoned and filtered out of results.
+    """
+
+    def __init__(self, dim: int = 384, m: int = 32):
+        """Initialize an empty index.
+
+        Args:
+            dim: Embedding dimension
+            m: HNSW graph degree (neighbors per node)
+        """
+        self.dim = dim
+        self.m = m
+        # The FP16 scalar quantizer needs no training data
+        self._index = faiss.IndexHNSWSQ(
+            dim,
+            faiss.ScalarQuantizer.QT_fp16,  # type: ignore[arg-type]  # SWIG stub is wrong
+            m,
+            faiss.METRIC_INNER_PRODUCT,
+        )
+        self._ids: list[str | None] = []  # position -> pattern ID (None if deleted)
+        self._positions: dict[str, int] = {}  # pattern ID -> position
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of live (non-deleted) patterns in the index."""
+        return len(self._positions)
+
+    def add(self, ids: list[str], embeddings: npt.ArrayLike) -> None:
+        """Add pattern embeddings to the index.
+
+        Args:
+            ids: Pattern IDs
+            embeddings: Embedding vectors, one per ID (list of lists or (N, dim) array)
+        """
+        if not ids:
+            return
+
+        # Copy: normalize_L2 works in place and must not touch the caller's arrays
+        vectors = np.array(embeddings, dtype=np.float32).reshape(len(ids), self.dim)
+        faiss.normalize_L2(vectors)
+
+        with self._lock:
+            start = len(self._ids)
+            self._index.add(vectors)
+            for offset, pattern_id in enumerate(ids):
+                # A re-added ID shadows its previous vector
+                previous = self._positions.get(pattern_id)
+                if previous is not None:
+                    self._ids[previous] = None
+                self._ids.append(pattern_id)
+                self._positions[pattern_id] = start + offset
+
+    def remove(self, ids: list[str]) -> None:
+        """Drop patterns from search results.
+
+        Args:
+            ids: Pattern IDs to remove
+        """
+        with self._lock:
+            for pattern_id in ids:
+                position = self._positions.pop(pattern_id, None)
+                if position is not None:
+                    self._ids[position] = None
+
+    def search(self, query_embedding: npt.ArrayLike, k: int) -> list[tuple[str, float]]:
+        """Find the patterns most similar to a query embedding.
+
+        Args:
+            query_embedding: Query vector
+            k: Maximum number of results
+
+        Returns:
+            (pattern_id, cosine similarity) pairs, most similar first
+        """
+        return self.search_batch(np.asarray(query_embedding).reshape(1, self.dim), k)[0]
+
+    def search_batch(
+        self, query_embeddings: npt.ArrayLike, k: int
+    ) -> list[list[tuple[str, float]]]:
+        """Find the patterns most similar to each of several query embeddings.
+
+        Args:
+            query_embeddings: Query matrix, shape (B, dim)
+            k: Maximum number of results per query
+
+        Returns:
+            One list of (pattern_id, cosine similarity) pairs per query, most similar first
+        """
+        queries = np.array(query_embeddings, dtype=np.float32).reshape(-1, self.dim)  # Copy
+        faiss.normalize_L2(queries)
+
+        with self._lock:
+            total = len(self._ids)
+            if total == 0 or not self._positions:
+                return [[] for _ in range(len(queries))]
+            # Over-fetch by the number of tombstones so k live results survive
+            search_k = min(k + total - len(self._positions), total)
+            scores, labels = self._index.search(queries, search_k)
+            ids = self._ids
+
+            results = []
+            for row_scores, row_labels in zip(scores, labels, strict=True):
+                hits = []
+                for score, label in zip(row_scores, row_labels, strict=True):
+                    if label < 0:
+                        continue
+                    pattern_id = ids[label]
+                    if pattern_id is not None:
+                        # FP16 rounding can push a self-match slightly above 1
+                        hits.append((pattern_id, min(float(score), 1.0)))
+                        if len(hits) == k:
+                            break
+                results.append(hits)
+        return results
+
+    @classmethod
+    def from_embeddings(
+        cls, ids: list[str], embeddings: npt.ArrayLike | None, dim: int = 384
+    ) -> "FaissPatternIndex":
+        """Build an index from stored pattern embeddings.
+
+        Args:
+            ids: Pattern IDs
+            embeddings: Embedding vectors, one per ID (None if none were stored)
+            dim: Embedding dimension
+
+        Returns:
+            Populated FaissPatternIndex
+        """
+        index = cls(dim=dim)
+        if ids and embeddings is not None:
+            index.add(ids, embeddings)
+
+        logger.info("faiss pattern index built", patterns=len(index))
+        return index
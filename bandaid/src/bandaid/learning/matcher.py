@@ -3,6 +3,15 @@
 Performs semantic similarity search against learned attack patterns stored in ChromaDB.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+import numpy as np
+
 from bandaid.learning.embedder import get_sentence_embedder
 from bandaid.learning.pattern_store import PatternStore
 from bandaid.models.patterns import AttackPattern
@@ -11,6 +20,16 @@ from bandaid.observability.logger import get_logger
 logger = get_logger(__name__)
 
 
+class _CachedMatch(NamedTuple):
+    """Cached embedding and query results for one normalized input text."""
+
+    expires_at: float
+    embedding: np.ndarray
+    generation: int  # PatternStore.generation the results were read at
+    top_k: int
+    matches: list[tuple[AttackPattern, float]]
+
+
 class PatternMatcher:
     """Semantic pattern matcher using embeddings and cosine similarity."""
 
@@ -28,6 +47,15 @@ class PatternMatcher:
         self.pattern_store = pattern_store
         self.similarity_threshold = similarity_threshold
         self.embedder = get_sentence_embedder()
+        # Repeated prompts (retries, fuzzing lists) skip both the embedding and
+        # the ChromaDB query; results are dropped once the store is written to
+        self.cache_size = 4096
+        self.cache_ttl = 300.0
+        self._cache: OrderedDict[bytes, _CachedMatch] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Bound once by initialize() so the per-request path skips the lookups
+        self._encode: Callable[[str], np.ndarray] | None = None
+        self._query: Callable[..., list[tuple]] | None = None
 
     def initialize(self) -> None:
         """Initialize pattern store and embedder."""
@@ -37,6 +65,13 @@ class PatternMatcher:
         if not self.embedder.is_initialized():
             self.embedder.initialize()
 
+        self._query = self.pattern_store.query_similar
+        self._encode = self.embedder.encode
+
+    def is_initialized(self) -> bool:
+        """Check if the matcher is ready to serve queries."""
+        return self._encode is not None
+
     def find_similar_patterns(
         self,
         text: str,
@@ -56,15 +91,37 @@ class PatternMatcher:
         Raises:
             RuntimeError: If matcher not initialized
         """
-        if not self.embedder.is_initialized():
+        encode = self._encode
+        query = self._query
+        if encode is None or query is None:
             raise RuntimeError("Matcher not initialized. Call initialize() first.")
 
-        try:
-            # Generate embedding for input text
-            query_embedding = self.embedder.encode(text)
+        # The embedding model is uncased and ignores surrounding whitespace
+        key = hashlib.blake2b(text.strip().lower().encode(), digest_size=16).digest()
+        now = time.monotonic()
+        generation = self.pattern_store.generation
+
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached.expires_at <= now:
+                del self._cache[key]
+                cached = None
+            if cached is not None:
+                self._cache.move_to_end(key)
+                # Results are sorted by similarity, so a larger cached top_k
+                # also answers a smaller one
+                if cached.generation == generation and cached.top_k >= top_k:
+                    return cached.matches[:top_k]
 
-            # Search ChromaDB for similar patterns
-            results = self.pattern_store.query_similar(
+        try:
+            # Generate embedding for input text (reused from the cache if present)
+            if cached is not None:
+                query_embedding = cached.embedding
+            else:
+                query_embedding = encode(text)
+
+            # Search the pattern store for similar patterns
+            results = query(
                 query_embedding=query_embedding,
                 n_results=top_k,
                 similarity_threshold=self.similarity_threshold,
@@ -81,12 +138,23 @@ class PatternMatcher:
                 threshold=self.similarity_threshold,
             )
 
+            self._cache_put(
+                key, _CachedMatch(now + self.cache_ttl, query_embedding, generation, top_k, matches)
+            )
             return matches
 
         except Exception as e:
             logger.error("pattern matching failed", error=str(e), exc_info=True)
             return []
 
+    def _cache_put(self, key: bytes, entry: _CachedMatch) -> None:
+        """Store a cache entry, evicting the least recently used beyond cache_size."""
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
     def is_similar_to_known_pattern(self, text: str) -> tuple[bool, AttackPattern | None, float]:
         """Check if text matches any known attack pattern.
 
@@ -132,9 +200,9 @@ def get_pattern_matcher(
     if _matcher_instance is None:
         if pattern_store is None:
             # Create default pattern store
-            from pathlib import Path
+            from bandaid.config import BANDAID_HOME
 
-            store_path = Path.home() / ".bandaid" / "chroma"
+            store_path = BANDAID_HOME / "chroma"
             pattern_store = PatternStore(persist_directory=str(store_path))
 
         _matcher_instance = PatternMatcher(
@@ -3,15 +3,26 @@
 Manages vector embeddings of attack patterns using ChromaDB in embedded/persistent mode.
 """
 
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
 from bandaid.models.patterns import AttackPattern, PatternMetadata
 from bandaid.observability.logger import get_logger
 
+if TYPE_CHECKING:
+    from bandaid.learning.dense_index import DensePatternIndex
+    from bandaid.learning.faiss_index import FaissPatternIndex
+
 logger = get_logger(__name__)
 
 
@@ -22,17 +33,72 @@ class PatternStore:
         self,
         persist_directory: str = "./data/chroma",
         collection_name: str = "attack_patterns",
+        hnsw_m: int = 24,
+        hnsw_construction_ef: int = 128,
+        hnsw_search_ef: int = 100,
+        hnsw_num_threads: int | None = None,
+        batch_size: int = 128,
     ):
         """Initialize pattern store.
 
+        New patterns are buffered in memory and written to ChromaDB in batches
+        of batch_size (and by the scheduler's periodic flush), so patterns
+        learned in the last few seconds are lost if the process is killed
+        before a flush. batch_size=1 writes every pattern immediately.
+
+        The HNSW parameters are stored on the collection when it is created;
+        ChromaDB ignores them for a collection that already exists, so changing
+        them takes effect only after reset() (or recreating the collection).
+
         Args:
             persist_directory: Directory for persistent ChromaDB storage
             collection_name: Name of the ChromaDB collection
+            hnsw_m: HNSW graph degree (ChromaDB default: 16)
+            hnsw_construction_ef: HNSW candidate list size while building (default: 100)
+            hnsw_search_ef: HNSW candidate list size while querying (default: 10)
+            hnsw_num_threads: Threads used to build the graph (None for all CPUs)
+            batch_size: Buffered patterns that trigger a ChromaDB write
         """
         self.persist_directory = Path(persist_directory)
         self.collection_name = collection_name
+        self.hnsw_m = hnsw_m
+        self.hnsw_construction_ef = hnsw_construction_ef
+        self.hnsw_search_ef = hnsw_search_ef
+        self.hnsw_num_threads = hnsw_num_threads or os.cpu_count() or 1
         self.client: chromadb.PersistentClient | None = None
         self.collection: chromadb.Collection | None = None
+        # Bumped on every write so callers can tell when cached query results are stale
+        self.generation = 0
+        # In-memory copy of the embeddings (FAISS when installed, else exact numpy)
+        self.index: FaissPatternIndex | DensePatternIndex | None = None
+        # Held by add_pattern while it inserts and by rebuilds while they read the
+        # collection and swap self.index, so no add lands in a discarded index
+        self._index_lock = threading.Lock()
+        # Serializes read-modify-write metadata updates (ChromaDB has no atomic increment)
+        self._update_lock = threading.Lock()
+        # New patterns are buffered (id -> (embedding, metadata)) and written with
+        # one collection.add per batch; the in-memory index has them immediately.
+        # A flush moves the batch to _flushing and writes it without holding
+        # _pending_lock, so adds never wait on ChromaDB I/O; _flushing is only
+        # cleared once the write returns, so a reader that finds an ID in
+        # neither can rely on it being in ChromaDB. _flush_lock serializes
+        # flushes with deletes, in-place metadata updates and index rebuilds
+        # (lock order: _index_lock, _flush_lock, _pending_lock).
+        self.batch_size = batch_size
+        self._pending: dict[str, tuple[np.ndarray, dict]] = {}
+        self._flushing: dict[str, tuple[np.ndarray, dict]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # Rebuilt AttackPatterns by ID (LRU), so repeat hits skip both the
+        # metadata read and model validation; entries are evicted on write
+        self.pattern_cache_size = 4096
+        self._pattern_cache: OrderedDict[str, tuple[UUID, AttackPattern]] = OrderedDict()
+        self._pattern_cache_lock = threading.Lock()
+        # Raw float32 embedding bytes -> pattern ID, so re-learning a verbatim
+        # duplicate is a dict lookup instead of a similarity search
+        self._exact_index: dict[bytes, UUID] = {}
+        self._exact_keys: dict[str, bytes] = {}  # pattern ID -> key, for deletes
+        self._exact_lock = threading.Lock()
 
     def initialize(self) -> None:
         """Initialize ChromaDB client and collection."""
@@ -48,39 +114,210 @@ class PatternStore:
 
         self.collection = self.client.get_or_create_collection(
             name=self.collection_name,
-            metadata={
-                "hnsw:space": "cosine",
-                "description": "Learned attack pattern embeddings for self-learning threat detection",
-            },
+            metadata=self._collection_metadata(),
         )
 
+        # One read of the stored embeddings feeds both in-memory indexes
+        stored = self.collection.get(include=["embeddings"])
+        self.index = self._build_index(stored)
+        self._build_exact_index(stored)
+
         logger.info(
             "pattern store initialized",
             persist_directory=str(self.persist_directory),
             collection_name=self.collection_name,
         )
 
+    def _collection_metadata(self) -> dict:
+        """Collection metadata, including the HNSW build and search parameters."""
+        return {
+            "hnsw:space": "cosine",
+            "hnsw:M": self.hnsw_m,
+            "hnsw:construction_ef": self.hnsw_construction_ef,
+            "hnsw:search_ef": self.hnsw_search_ef,
+            "hnsw:num_threads": self.hnsw_num_threads,
+            "description": "Learned attack pattern embeddings for self-learning threat detection",
+        }
+
+    def _build_index(self, stored: dict | None = None) -> "FaissPatternIndex | DensePatternIndex":
+        """Load the collection's embeddings into an in-memory index.
+
+        Uses FAISS when the optional extra is installed, otherwise an exact
+        numpy index.
+
+        Args:
+            stored: Result of collection.get(include=["embeddings"]) (read if None)
+
+        Returns:
+            Populated index
+        """
+        if stored is None:
+            stored = self.collection.get(include=["embeddings"])
+
+        try:
+            from bandaid.learning.faiss_index import FaissPatternIndex
+        except ImportError:
+            from bandaid.learning.dense_index import DensePatternIndex
+
+            return DensePatternIndex.from_embeddings(stored["ids"], stored["embeddings"])
+
+        return FaissPatternIndex.from_embeddings(stored["ids"], stored["embeddings"])
+
+    def _rebuild_index(self) -> None:
+        """Replace self.index with one built from ChromaDB plus buffered patterns.
+
+        Caller holds _index_lock and _flush_lock, so no pattern is added or
+        flushed between the collection read and the swap.
+        """
+        index = self._build_index()
+        with self._pending_lock:
+            pending = list(self._pending.items())
+        if pending:
+            index.add(
+                [pattern_id for pattern_id, _ in pending],
+                np.stack([vector for _, (vector, _) in pending]),
+            )
+        self.index = index
+
+    def _build_exact_index(self, stored: dict) -> None:
+        """Rebuild the exact-match index from the embeddings stored in ChromaDB.
+
+        Args:
+            stored: Result of collection.get(include=["embeddings"])
+        """
+        embeddings = stored["embeddings"]
+        with self._exact_lock:
+            self._exact_index.clear()
+            self._exact_keys.clear()
+            if not stored["ids"] or embeddings is None:
+                return
+            for pattern_id, embedding in zip(stored["ids"], embeddings, strict=True):
+                key = np.asarray(embedding, dtype=np.float32).tobytes()
+                self._exact_index[key] = UUID(pattern_id)
+                self._exact_keys[pattern_id] = key
+
+    def _buffered(self, pattern_id: str) -> tuple[np.ndarray, dict] | None:
+        """Get a pattern that is not in ChromaDB yet (caller holds _pending_lock).
+
+        Args:
+            pattern_id: Pattern ID
+
+        Returns:
+            (embedding, metadata) if buffered or being flushed, else None
+        """
+        return self._pending.get(pattern_id) or self._flushing.get(pattern_id)
+
+    def _forget_exact(self, pattern_ids: list[str]) -> None:
+        """Drop deleted patterns from the exact-match index.
+
+        Args:
+            pattern_ids: Deleted pattern IDs
+        """
+        with self._exact_lock:
+            for pattern_id in pattern_ids:
+                key = self._exact_keys.pop(pattern_id, None)
+                if key is not None and self._exact_index.get(key) == UUID(pattern_id):
+                    del self._exact_index[key]
+
+    def _bump_generation(self, pattern_ids: list[str] | None = None) -> None:
+        """Record a write: bump the generation and evict the affected patterns.
+
+        Args:
+            pattern_ids: IDs whose cached patterns are now stale (None for all)
+        """
+        self.generation += 1
+        with self._pattern_cache_lock:
+            if pattern_ids is None:
+                self._pattern_cache.clear()
+            else:
+                for pattern_id in pattern_ids:
+                    self._pattern_cache.pop(pattern_id, None)
+
+    def _cached_patterns(
+        self, pattern_ids: set[str] | list[str]
+    ) -> dict[str, tuple[UUID, AttackPattern]]:
+        """Look up rebuilt patterns in the cache.
+
+        Args:
+            pattern_ids: Pattern IDs to look up
+
+        Returns:
+            (UUID, AttackPattern) for each ID that is cached
+        """
+        found = {}
+        with self._pattern_cache_lock:
+            for pattern_id in pattern_ids:
+                entry = self._pattern_cache.get(pattern_id)
+                if entry is not None:
+                    self._pattern_cache.move_to_end(pattern_id)
+                    found[pattern_id] = entry
+        return found
+
+    def _build_pattern(
+        self, pattern_id_str: str, metadata: dict, generation: int
+    ) -> tuple[UUID, AttackPattern]:
+        """Rebuild an AttackPattern from stored metadata and cache it.
+
+        Stored metadata was produced by PatternMetadata.from_attack_pattern
+        (already validated, primitives only), so it is loaded with
+        model_construct rather than validated again.
+
+        Args:
+            pattern_id_str: Pattern ID
+            metadata: Stored metadata for the pattern
+            generation: Store generation read before the metadata was fetched;
+                if a write happened since, the result is returned but not cached
+
+        Returns:
+            (UUID, AttackPattern)
+        """
+        pattern_id = UUID(pattern_id_str)
+        pattern_metadata = PatternMetadata.model_construct(**metadata)
+        entry = (pattern_id, pattern_metadata.to_attack_pattern(pattern_id))
+        with self._pattern_cache_lock:
+            if self.generation == generation:
+                self._pattern_cache[pattern_id_str] = entry
+                while len(self._pattern_cache) > self.pattern_cache_size:
+                    self._pattern_cache.popitem(last=False)
+        return entry
+
     def add_pattern(
         self,
         pattern: AttackPattern,
-        embedding: list[float],
+        embedding: np.ndarray,
     ) -> None:
         """Add a new attack pattern with its embedding.
 
         Args:
             pattern: AttackPattern to store
-            embedding: Vector embedding (384-dimensional)
+            embedding: float32 embedding vector, shape (384,)
+
+        Raises:
+            ValueError: If embedding is not a single vector
         """
         if not self.collection:
             raise RuntimeError("Pattern store not initialized")
 
-        metadata = PatternMetadata.from_attack_pattern(pattern)
-
-        self.collection.add(
-            ids=[str(pattern.id)],
-            embeddings=[embedding],
-            metadatas=[metadata.model_dump()],
-        )
+        vector = np.ascontiguousarray(embedding, dtype=np.float32)
+        if vector.ndim != 1:
+            raise ValueError(f"Expected a single embedding vector, got shape {vector.shape}")
+
+        pattern_id = str(pattern.id)
+        metadata = PatternMetadata.from_attack_pattern(pattern).model_dump()
+
+        with self._index_lock:
+            if self.index is not None:
+                self.index.add([pattern_id], vector[np.newaxis])
+            with self._pending_lock:
+                self._pending[pattern_id] = (vector, metadata)
+                batch_full = len(self._pending) >= self.batch_size
+        with self._exact_lock:
+            key = vector.tobytes()
+            self._exact_index[key] = pattern.id
+            self._exact_keys[pattern_id] = key
+        self._bump_generation([pattern_id])
+        if batch_full:
+            self.flush()
 
         logger.debug(
             "pattern added",
@@ -88,9 +325,50 @@ class PatternStore:
             threat_types=[t.value for t in pattern.threat_types],
         )
 
+    def flush(self) -> int:
+        """Write buffered patterns to ChromaDB in a single batched add.
+
+        Called when the buffer reaches batch_size, periodically by the
+        scheduler, before reads that go to ChromaDB, and on shutdown.
+
+        Returns:
+            Number of patterns written
+        """
+        if not self.collection:
+            raise RuntimeError("Pattern store not initialized")
+
+        with self._flush_lock:
+            with self._pending_lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending = self._pending, {}
+                self._flushing = batch
+
+            ids = list(batch)
+            entries = list(batch.values())
+            try:
+                self.collection.add(
+                    ids=ids,
+                    # One (N, 384) matrix converted in a single call (ChromaDB 0.4 wants lists)
+                    embeddings=np.stack([vector for vector, _ in entries]).tolist(),
+                    metadatas=[metadata for _, metadata in entries],
+                )
+            except BaseException:
+                # Keep the batch buffered (newer entries win) for the next flush
+                with self._pending_lock:
+                    self._pending = {**batch, **self._pending}
+                    self._flushing = {}
+                raise
+
+            with self._pending_lock:
+                self._flushing = {}
+
+        logger.debug("pending patterns flushed", count=len(ids))
+        return len(ids)
+
     def query_similar(
         self,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         n_results: int = 5,
         similarity_threshold: float = 0.85,
         threat_type_filter: str | None = None,
@@ -98,7 +376,7 @@ class PatternStore:
         """Query for similar attack patterns.
 
         Args:
-            query_embedding: Query vector embedding
+            query_embedding: float32 query vector, shape (384,)
             n_results: Maximum number of results to return
             similarity_threshold: Minimum similarity score (0.0-1.0)
             threat_type_filter: Optional filter by threat type
@@ -106,49 +384,152 @@ class PatternStore:
         Returns:
             List of tuples (pattern_id, similarity, pattern)
         """
+        return self.query_similar_batch(
+            np.asarray(query_embedding, dtype=np.float32)[np.newaxis],
+            n_results=n_results,
+            similarity_threshold=similarity_threshold,
+            threat_type_filter=threat_type_filter,
+        )[0]
+
+    def query_similar_batch(
+        self,
+        query_embeddings: np.ndarray,
+        n_results: int = 5,
+        similarity_threshold: float = 0.85,
+        threat_type_filter: str | None = None,
+    ) -> list[list[tuple[UUID, float, AttackPattern]]]:
+        """Query for patterns similar to each of several embeddings at once.
+
+        All queries share one index search (or, with a threat filter, one
+        ChromaDB query) and one metadata read, instead of a round trip each.
+
+        Args:
+            query_embeddings: float32 query matrix, shape (B, 384)
+            n_results: Maximum number of results per query
+            similarity_threshold: Minimum similarity score (0.0-1.0)
+            threat_type_filter: Optional filter by threat type
+
+        Returns:
+            One list of (pattern_id, similarity, pattern) tuples per query, in order
+        """
         if not self.collection:
             raise RuntimeError("Pattern store not initialized")
 
-        # Build where filter for threat type
-        where_filter = None
-        if threat_type_filter:
-            where_filter = {"threat_types": {"$contains": threat_type_filter}}
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[np.newaxis]
 
+        if self.index is not None and not threat_type_filter:
+            return self._query_index(queries, n_results, similarity_threshold)
+
+        self.flush()
+        generation = self.generation
+
+        # Only threat-filtered queries reach ChromaDB; the in-memory index
+        # answers the rest but has no metadata to filter on
         results = self.collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=queries.tolist(),
             n_results=n_results,
-            where=where_filter,
+            where={"threat_types": {"$contains": threat_type_filter}},
         )
 
-        if not results["ids"] or not results["ids"][0]:
-            return []
+        all_matches: list[list[tuple[UUID, float, AttackPattern]]] = []
+        for b in range(len(queries)):
+            matches = []
+            ids = results["ids"][b] if results["ids"] else []
+            for i, pattern_id_str in enumerate(ids):
+                # ChromaDB returns distance, convert to similarity (cosine)
+                # ChromaDB cosine distance = 1 - cosine_similarity
+                distance = results["distances"][b][i] if results["distances"] else 0.0
+                similarity = 1.0 - distance
 
-        matches = []
-        for i, pattern_id_str in enumerate(results["ids"][0]):
-            # ChromaDB returns distance, convert to similarity (cosine)
-            # ChromaDB cosine distance = 1 - cosine_similarity
-            distance = results["distances"][0][i] if results["distances"] else 0.0
-            similarity = 1.0 - distance
+                if similarity < similarity_threshold:
+                    continue
 
-            if similarity < similarity_threshold:
-                continue
+                # Convert metadata back to AttackPattern (cached across queries)
+                entry = self._cached_patterns([pattern_id_str]).get(pattern_id_str)
+                if entry is None:
+                    metadata = results["metadatas"][b][i]
+                    entry = self._build_pattern(pattern_id_str, metadata, generation)
 
-            pattern_id = UUID(pattern_id_str)
-            metadata = results["metadatas"][0][i]
+                matches.append((entry[0], similarity, entry[1]))
+            all_matches.append(matches)
 
-            # Convert metadata back to AttackPattern
-            pattern_metadata = PatternMetadata(**metadata)
-            pattern = pattern_metadata.to_attack_pattern(pattern_id)
+        logger.debug(
+            "pattern query completed",
+            queries=len(queries),
+            matches_found=sum(len(matches) for matches in all_matches),
+            similarity_threshold=similarity_threshold,
+        )
+
+        return all_matches
+
+    def _query_index(
+        self,
+        queries: np.ndarray,
+        n_results: int,
+        similarity_threshold: float,
+    ) -> list[list[tuple[UUID, float, AttackPattern]]]:
+        """Query the in-memory index, reading only hit metadata from ChromaDB.
 
-            matches.append((pattern_id, similarity, pattern))
+        Args:
+            queries: float32 query matrix, shape (B, 384)
+            n_results: Maximum number of results per query
+            similarity_threshold: Minimum similarity score (0.0-1.0)
+
+        Returns:
+            One list of (pattern_id, similarity, pattern) tuples per query
+        """
+        hits_per_query = [
+            [
+                (pattern_id, similarity)
+                for pattern_id, similarity in hits
+                if similarity >= similarity_threshold
+            ]
+            for hits in self.index.search_batch(queries, n_results)
+        ]
+        hit_ids = {pattern_id for hits in hits_per_query for pattern_id, _ in hits}
+        if not hit_ids:
+            return [[] for _ in hits_per_query]
+
+        # Cached patterns need no metadata read at all
+        generation = self.generation
+        patterns = self._cached_patterns(hit_ids)
+        missing = [pattern_id for pattern_id in hit_ids if pattern_id not in patterns]
+
+        if missing:
+            # Recently added patterns may still be buffered; the rest are in ChromaDB
+            with self._pending_lock:
+                buffered = {pattern_id: self._buffered(pattern_id) for pattern_id in missing}
+            metadata_by_id = {
+                pattern_id: entry[1] for pattern_id, entry in buffered.items() if entry is not None
+            }
+            stored_ids = [pattern_id for pattern_id in missing if pattern_id not in metadata_by_id]
+            if stored_ids:
+                result = self.collection.get(ids=stored_ids)
+                metadata_by_id.update(zip(result["ids"], result["metadatas"], strict=True))
+
+            # A pattern hit by several queries is rebuilt once
+            for pattern_id_str, metadata in metadata_by_id.items():
+                patterns[pattern_id_str] = self._build_pattern(pattern_id_str, metadata, generation)
+
+        all_matches = []
+        for hits in hits_per_query:
+            matches = []
+            for pattern_id_str, similarity in hits:
+                entry = patterns.get(pattern_id_str)
+                if entry is not None:
+                    matches.append((entry[0], similarity, entry[1]))
+            all_matches.append(matches)
 
         logger.debug(
             "pattern query completed",
-            matches_found=len(matches),
+            queries=len(queries),
+            matches_found=sum(len(matches) for matches in all_matches),
             similarity_threshold=similarity_threshold,
         )
 
-        return matches
+        return all_matches
 
     def update_pattern(
         self,
@@ -166,6 +547,8 @@ class PatternStore:
         if not self.collection:
             raise RuntimeError("Pattern store not initialized")
 
+        self.flush()
+
         # Get existing metadata
         result = self.collection.get(ids=[str(pattern_id)])
         if not result["ids"]:
@@ -181,6 +564,7 @@ class PatternStore:
             ids=[str(pattern_id)],
             metadatas=[existing_metadata],
         )
+        self._bump_generation([str(pattern_id)])
 
         logger.debug(
             "pattern metadata updated",
@@ -188,6 +572,54 @@ class PatternStore:
             detection_count=detection_count,
         )
 
+    def increment_detection(self, pattern_id: UUID, last_seen: str) -> int | None:
+        """Atomically bump a pattern's detection count and last seen time.
+
+        The count is read from the stored metadata under a lock, so concurrent
+        duplicate hits on the same pattern are never lost.
+
+        Args:
+            pattern_id: Pattern UUID
+            last_seen: Last seen timestamp (ISO 8601)
+
+        Returns:
+            New detection count, or None if the pattern does not exist
+        """
+        if not self.collection:
+            raise RuntimeError("Pattern store not initialized")
+
+        # _flush_lock keeps a flush from writing the metadata while it changes
+        with self._update_lock, self._flush_lock:
+            # Repeat hits on a just-learned pattern update it in the buffer
+            with self._pending_lock:
+                pending = self._pending.get(str(pattern_id))
+                if pending is not None:
+                    metadata = pending[1]
+                    metadata["detection_count"] += 1
+                    metadata["last_seen"] = last_seen
+                    self._bump_generation([str(pattern_id)])
+                    return metadata["detection_count"]
+
+            result = self.collection.get(ids=[str(pattern_id)])
+            if not result["ids"]:
+                logger.warning("pattern not found for update", pattern_id=str(pattern_id))
+                return None
+
+            metadata = result["metadatas"][0]
+            detection_count = metadata["detection_count"] + 1
+            metadata["detection_count"] = detection_count
+            metadata["last_seen"] = last_seen
+
+            self.collection.update(ids=[str(pattern_id)], metadatas=[metadata])
+            self._bump_generation([str(pattern_id)])
+
+        logger.debug(
+            "pattern detection count incremented",
+            pattern_id=str(pattern_id),
+            detection_count=detection_count,
+        )
+        return detection_count
+
     def get_pattern(self, pattern_id: UUID) -> AttackPattern | None:
         """Get a pattern by ID.
 
@@ -200,14 +632,23 @@ class PatternStore:
         if not self.collection:
             raise RuntimeError("Pattern store not initialized")
 
-        result = self.collection.get(ids=[str(pattern_id)])
+        pattern_id_str = str(pattern_id)
+        cached = self._cached_patterns([pattern_id_str]).get(pattern_id_str)
+        if cached is not None:
+            return cached[1]
+
+        generation = self.generation
+        with self._pending_lock:
+            pending = self._buffered(pattern_id_str)
+        if pending is not None:
+            return self._build_pattern(pattern_id_str, pending[1], generation)[1]
+
+        result = self.collection.get(ids=[pattern_id_str])
 
         if not result["ids"]:
             return None
 
-        metadata = result["metadatas"][0]
-        pattern_metadata = PatternMetadata(**metadata)
-        return pattern_metadata.to_attack_pattern(pattern_id)
+        return self._build_pattern(pattern_id_str, result["metadatas"][0], generation)[1]
 
     def delete_pattern(self, pattern_id: UUID) -> None:
         """Delete a pattern by ID.
@@ -218,7 +659,15 @@ class PatternStore:
         if not self.collection:
             raise RuntimeError("Pattern store not initialized")
 
-        self.collection.delete(ids=[str(pattern_id)])
+        # Under _flush_lock so an in-progress flush cannot re-add the pattern
+        with self._flush_lock:
+            with self._pending_lock:
+                self._pending.pop(str(pattern_id), None)
+            self.collection.delete(ids=[str(pattern_id)])
+        if self.index is not None:
+            self.index.remove([str(pattern_id)])
+        self._forget_exact([str(pattern_id)])
+        self._bump_generation([str(pattern_id)])
         logger.debug("pattern deleted", pattern_id=str(pattern_id))
 
     def delete_old_patterns(self, cutoff_date: str) -> int:
@@ -233,6 +682,8 @@ class PatternStore:
         if not self.collection:
             raise RuntimeError("Pattern store not initialized")
 
+        self.flush()
+
         # Query all patterns older than cutoff
         result = self.collection.get(
             where={"first_seen": {"$lt": cutoff_date}},
@@ -243,6 +694,12 @@ class PatternStore:
 
         deleted_count = len(result["ids"])
         self.collection.delete(ids=result["ids"])
+        if self.index is not None:
+            # Bulk deletes would leave mostly tombstones; rebuild from what remains
+            with self._index_lock, self._flush_lock:
+                self._rebuild_index()
+        self._forget_exact(result["ids"])
+        self._bump_generation(result["ids"])
 
         logger.info(
             "old patterns deleted",
@@ -252,6 +709,35 @@ class PatternStore:
 
         return deleted_count
 
+    def iter_patterns(self, page_size: int = 1000, offset: int = 0) -> Iterator[AttackPattern]:
+        """Iterate over stored patterns, reading ChromaDB one page at a time.
+
+        Only one page of metadata is held in memory, so large stores can be
+        scanned without loading the whole collection.
+
+        Args:
+            page_size: Number of patterns fetched per ChromaDB read
+            offset: Number of patterns to skip
+
+        Yields:
+            AttackPatterns in collection order
+        """
+        if not self.collection:
+            raise RuntimeError("Pattern store not initialized")
+
+        self.flush()
+
+        while True:
+            result = self.collection.get(limit=page_size, offset=offset)
+            for pattern_id_str, metadata in zip(result["ids"], result["metadatas"], strict=True):
+                # Trusted: written by add_pattern from validated metadata
+                pattern_metadata = PatternMetadata.model_construct(**metadata)
+                yield pattern_metadata.to_attack_pattern(UUID(pattern_id_str))
+
+            if len(result["ids"]) < page_size:
+                return
+            offset += page_size
+
     def get_all_patterns(
         self,
         limit: int | None = None,
@@ -266,23 +752,8 @@ class PatternStore:
         Returns:
             List of AttackPatterns
         """
-        if not self.collection:
-            raise RuntimeError("Pattern store not initialized")
-
-        result = self.collection.get(
-            limit=limit,
-            offset=offset,
-        )
-
-        patterns = []
-        for i, pattern_id_str in enumerate(result["ids"]):
-            pattern_id = UUID(pattern_id_str)
-            metadata = result["metadatas"][i]
-            pattern_metadata = PatternMetadata(**metadata)
-            pattern = pattern_metadata.to_attack_pattern(pattern_id)
-            patterns.append(pattern)
-
-        return patterns
+        page_size = min(limit, 1000) if limit else 1000
+        return list(islice(self.iter_patterns(page_size=page_size, offset=offset), limit))
 
     def count_patterns(self) -> int:
         """Get total number of patterns stored.
@@ -293,47 +764,61 @@ class PatternStore:
         if not self.collection:
             raise RuntimeError("Pattern store not initialized")
 
-        return self.collection.count()
+        with self._flush_lock, self._pending_lock:
+            return self.collection.count() + len(self._pending)
 
     def check_duplicate(
         self,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         similarity_threshold: float = 0.95,
-    ) -> tuple[UUID, float] | None:
+    ) -> tuple[UUID, float, AttackPattern] | None:
         """Check if a pattern is a duplicate (very high similarity).
 
+        An embedding identical to a stored one is answered from the exact-match
+        index; anything else falls back to a similarity query.
+
         Args:
-            query_embedding: Query vector embedding
+            query_embedding: float32 query vector, shape (384,)
             similarity_threshold: Minimum similarity to consider duplicate (default 0.95)
 
         Returns:
-            Tuple of (pattern_id, similarity) if duplicate found, None otherwise
+            Tuple of (pattern_id, similarity, pattern) if duplicate found, None otherwise
         """
+        key = np.ascontiguousarray(query_embedding, dtype=np.float32).tobytes()
+        with self._exact_lock:
+            pattern_id = self._exact_index.get(key)
+        if pattern_id is not None:
+            pattern = self.get_pattern(pattern_id)
+            if pattern is not None:
+                return (pattern_id, 1.0, pattern)
+
         matches = self.query_similar(
             query_embedding,
             n_results=1,
             similarity_threshold=similarity_threshold,
         )
 
-        if matches:
-            pattern_id, similarity, _ = matches[0]
-            return (pattern_id, similarity)
-
-        return None
+        return matches[0] if matches else None
 
     def reset(self) -> None:
         """Reset the collection (delete all patterns). Use with caution!"""
         if not self.client:
             raise RuntimeError("Pattern store not initialized")
 
-        self.client.delete_collection(name=self.collection_name)
-        self.collection = self.client.get_or_create_collection(
-            name=self.collection_name,
-            metadata={
-                "hnsw:space": "cosine",
-                "description": "Learned attack pattern embeddings for self-learning threat detection",
-            },
-        )
+        with self._index_lock, self._flush_lock:
+            with self._pending_lock:
+                self._pending.clear()
+            with self._exact_lock:
+                self._exact_index.clear()
+                self._exact_keys.clear()
+            self.client.delete_collection(name=self.collection_name)
+            self.collection = self.client.get_or_create_collection(
+                name=self.collection_name,
+                metadata=self._collection_metadata(),
+            )
+            if self.index is not None:
+                self._rebuild_index()
+        self._bump_generation()
 
         logger.warning("pattern store reset - all patterns deleted")
 
@@ -3,6 +3,7 @@
 Entry point for the security proxy server with middleware, CORS, and lifecycle management.
 """
 
+import asyncio
 import signal
 import sys
 from collections.abc import AsyncGenerator
@@ -12,10 +13,10 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
 
 from bandaid.config import load_config
 from bandaid.dashboard import api as dashboard_api
+from bandaid.dashboard.static_files import PrecompressedStaticFiles
 from bandaid.observability.logger import configure_logging, get_logger
 from bandaid.observability.sentry import initialize_sentry
 from bandaid.proxy import routes, server
@@ -26,6 +27,24 @@ from bandaid.storage.scheduler import shutdown_scheduler, start_scheduler
 logger = get_logger(__name__)
 
 
+def _warm_up_embedder() -> None:
+    """Load the sentence embedder and run one encode before traffic arrives.
+
+    The first encode allocates the runtime's buffers, so doing it here keeps
+    the model load and that one-off cost off the first (often hostile)
+    request.
+    """
+    from bandaid.learning.embedder import get_sentence_embedder
+
+    try:
+        embedder = get_sentence_embedder()
+        embedder.initialize()
+        embedder.encode("warmup")
+        logger.info("embedder warmed up")
+    except Exception as e:
+        logger.warning("embedder warmup failed, will load on first use", error=str(e))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """Lifecycle manager for FastAPI application.
@@ -75,6 +94,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         start_scheduler()
         logger.info("cleanup scheduler started")
 
+        # Load the embedder in the background; requests that need it before
+        # it is ready wait on the same load instead of starting another
+        if config.models.embeddings.enabled:
+            app.state.embedder_warmup = asyncio.create_task(asyncio.to_thread(_warm_up_embedder))
+
         logger.info("bandaid security proxy ready")
 
         yield
@@ -116,8 +140,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
             pattern_store = get_pattern_store()
             if pattern_store and hasattr(pattern_store, "client"):
-                # ChromaDB client cleanup (persist any pending operations)
-                logger.info("flushing chromadb operations")
+                # Write patterns still buffered for a batched add
+                flushed = pattern_store.flush()
+                logger.info("flushing chromadb operations", flushed=flushed)
         except Exception as chroma_err:
             logger.error("error closing chromadb", error=str(chroma_err))
 
@@ -154,7 +179,9 @@ app.include_router(dashboard_api.router)
 # Mount static files for dashboard
 dashboard_static_path = Path(__file__).parent / "dashboard" / "static"
 app.mount(
-    "/dashboard/static", StaticFiles(directory=str(dashboard_static_path)), name="dashboard_static"
+    "/dashboard/static",
+    PrecompressedStaticFiles(directory=str(dashboard_static_path)),
+    name="dashboard_static",
 )
 
 
@@ -5,43 +5,42 @@ Uses structlog for structured, JSON-formatted logging with context propagation.
 
 import logging
 import sys
+from importlib.metadata import PackageNotFoundError, version
 from typing import Any
 
 import structlog
-from structlog.types import EventDict, WrappedLogger
 
 
-def add_app_context(logger: WrappedLogger, method_name: str, event_dict: EventDict) -> EventDict:
-    """Add application context to log records.
+def _package_version() -> str:
+    """Get the installed bandaid version from package metadata."""
+    try:
+        return version("bandaid")
+    except PackageNotFoundError:
+        return "unknown"
 
-    Args:
-        logger: Wrapped logger instance
-        method_name: Name of the log method called
-        event_dict: Event dictionary
 
-    Returns:
-        Modified event dictionary with app context
-    """
-    event_dict["app"] = "bandaid"
-    event_dict["version"] = "0.1.0"  # TODO: Get from package metadata
-    return event_dict
+# Bound into every logger by get_logger, so no processor runs per event
+_APP_CONTEXT = {"app": "bandaid", "version": _package_version()}
 
+# Third-party loggers quieted to WARNING
+_NOISY_LOGGERS = ("chromadb", "transformers", "torch", "httpx", "httpcore")
 
-def drop_color_message_key(
-    logger: WrappedLogger, method_name: str, event_dict: EventDict
-) -> EventDict:
-    """Remove the 'color_message' key from event dict (used by dev console renderer).
+# Processor chains are built once; configure_logging only picks one
+_BASE_PROCESSORS: tuple[Any, ...] = (
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.processors.TimeStamper(fmt="iso", utc=True),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+)
 
-    Args:
-        logger: Wrapped logger instance
-        method_name: Name of the log method called
-        event_dict: Event dictionary
+# JSON output for production
+_JSON_PROCESSORS = (*_BASE_PROCESSORS, structlog.processors.JSONRenderer())
 
-    Returns:
-        Modified event dictionary
-    """
-    event_dict.pop("color_message", None)
-    return event_dict
+# Human-readable text output for development
+_TEXT_PROCESSORS = (*_BASE_PROCESSORS, structlog.dev.ConsoleRenderer(colors=False))
+_COLOR_TEXT_PROCESSORS = (*_BASE_PROCESSORS, structlog.dev.ConsoleRenderer(colors=True))
 
 
 def configure_logging(
@@ -65,40 +64,15 @@ def configure_logging(
     )
 
     # Disable noisy third-party loggers
-    logging.getLogger("chromadb").setLevel(logging.WARNING)
-    logging.getLogger("transformers").setLevel(logging.WARNING)
-    logging.getLogger("torch").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-
-    # Choose processors based on format
-    processors: list[Any] = [
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.processors.TimeStamper(fmt="iso", utc=True),
-        structlog.processors.StackInfoRenderer(),
-        add_app_context,
-    ]
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
 
     if log_format == "json":
-        # JSON output for production
-        processors.extend(
-            [
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                drop_color_message_key,
-                structlog.processors.JSONRenderer(),
-            ]
-        )
+        processors = _JSON_PROCESSORS
+    elif enable_colors:
+        processors = _COLOR_TEXT_PROCESSORS
     else:
-        # Human-readable text output for development
-        processors.extend(
-            [
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                structlog.dev.ConsoleRenderer(colors=enable_colors),
-            ]
-        )
+        processors = _TEXT_PROCESSORS
 
     # Configure structlog
     structlog.configure(
@@ -120,12 +94,9 @@ def get_logger(name: str | None = None, **initial_values: Any) -> structlog.stdl
     Returns:
         Structured logger instance with bound context
     """
-    logger: structlog.stdlib.BoundLogger = structlog.get_logger(name)
-
-    # Bind initial context if provided
-    if initial_values:
-        logger = logger.bind(**initial_values)
-
+    logger: structlog.stdlib.BoundLogger = structlog.get_logger(
+        name, **{**_APP_CONTEXT, **initial_values}
+    )
     return logger
 
 
@@ -179,6 +150,16 @@ class LoggerContext:
         unbind_context(*self.keys)
 
 
+# Security event severity -> logger method name
+_SEVERITY_LOG_METHODS = {
+    "critical": "error",
+    "high": "warning",
+    "medium": "info",
+    "low": "info",
+    "info": "info",
+}
+
+
 def log_security_event(
     logger: structlog.stdlib.BoundLogger,
     event_type: str,
@@ -199,14 +180,7 @@ def log_security_event(
         severity: Severity level (critical, high, medium, low, info)
         **extra: Additional context fields
     """
-    log_method = {
-        "critical": logger.error,
-        "high": logger.warning,
-        "medium": logger.info,
-        "low": logger.info,
-        "info": logger.info,
-    }.get(severity, logger.info)
-
+    log_method = getattr(logger, _SEVERITY_LOG_METHODS.get(severity, "info"))
     log_method(
         "security_event",
         event_type=event_type,
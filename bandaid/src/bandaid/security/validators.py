@@ -81,8 +81,9 @@ class ValidationOrchestrator:
             logger.info("lazy-loading validator", validator="guard", device=self.device)
             self.guard_validator.initialize()
 
-        if self.pattern_matcher and not self.pattern_matcher.embedder.is_initialized():
+        if self.pattern_matcher and not self.pattern_matcher.is_initialized():
             logger.info("lazy-loading validator", validator="embedding_matcher")
+            self.pattern_matcher.initialize()
 
     async def validate(
         self,
@@ -4,7 +4,10 @@ Handles creation, schema management, and CRUD operations for security events and
 attack pattern metadata.
 """
 
+import asyncio
 import json
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -41,6 +44,8 @@ CREATE INDEX IF NOT EXISTS idx_events_timestamp ON security_events(timestamp);
 CREATE INDEX IF NOT EXISTS idx_events_type ON security_events(event_type);
 CREATE INDEX IF NOT EXISTS idx_events_threat ON security_events(threat_type);
 CREATE INDEX IF NOT EXISTS idx_events_time_type ON security_events(timestamp, event_type);
+-- Holds every dashboard filter column, so filtered counts never touch the table
+CREATE INDEX IF NOT EXISTS idx_events_filter ON security_events(timestamp DESC, event_type, threat_type, severity_level);
 
 -- Attack Pattern Metadata Table (synced with ChromaDB)
 CREATE TABLE IF NOT EXISTS attack_pattern_metadata (
@@ -68,15 +73,24 @@ CREATE TABLE IF NOT EXISTS schema_version (
 class EventsDatabase:
     """Database manager for security events and attack patterns."""
 
-    def __init__(self, db_path: str = "./data/events.db"):
+    def __init__(self, db_path: str = "./data/events.db", pool_size: int = 8):
         """Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file
+            pool_size: Maximum number of pooled read connections
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._connection: aiosqlite.Connection | None = None
+        # Every :memory: connection is a separate database, so those never pool
+        self._in_memory = str(db_path) == ":memory:"
+        # Long-lived read connections (keep SQLite's page cache warm between
+        # dashboard requests and let reads run alongside writes under WAL)
+        self.pool_size = pool_size
+        self._readers: set[aiosqlite.Connection] = set()  # Every open reader, idle or borrowed
+        self._idle_readers: list[aiosqlite.Connection] = []
+        self._reader_slots = asyncio.Semaphore(pool_size)
 
     async def initialize(self) -> None:
         """Initialize database schema if not exists."""
@@ -104,8 +118,51 @@ class EventsDatabase:
         if self._connection is None:
             self._connection = await aiosqlite.connect(self.db_path)
             self._connection.row_factory = aiosqlite.Row
+            if not self._in_memory:
+                # WAL lets pooled readers proceed while this connection writes
+                await self._connection.execute("PRAGMA journal_mode=WAL")
         return self._connection
 
+    async def _open_reader(self) -> aiosqlite.Connection:
+        """Open a pooled read connection."""
+        conn = await aiosqlite.connect(self.db_path, isolation_level=None)
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        self._readers.add(conn)
+        return conn
+
+    async def _discard_reader(self, conn: aiosqlite.Connection) -> None:
+        """Close a read connection instead of returning it to the pool."""
+        if conn in self._readers:
+            self._readers.discard(conn)
+            await conn.close()
+
+    @asynccontextmanager
+    async def read_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a connection for read-only queries.
+
+        Connections are opened on demand up to pool_size and returned to the
+        pool afterwards, unless the caller raised or close() ran while the
+        connection was borrowed. In-memory databases use the main connection.
+
+        Yields:
+            Async database connection
+        """
+        if self._in_memory:
+            yield await self.get_connection()
+            return
+
+        async with self._reader_slots:
+            conn = self._idle_readers.pop() if self._idle_readers else await self._open_reader()
+            try:
+                yield conn
+            except BaseException:
+                # A failed or cancelled read may leave a statement open; don't reuse it
+                await self._discard_reader(conn)
+                raise
+            if conn in self._readers:  # Not closed by close() while borrowed
+                self._idle_readers.append(conn)
+
     async def flush_pending(self) -> None:
         """Flush any pending database writes.
 
@@ -119,7 +176,16 @@ class EventsDatabase:
                 logger.error("error flushing database", error=str(e))
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Close database connections (every pooled reader and the main connection).
+
+        Readers still borrowed (e.g. by a running event stream) are closed too
+        and are not returned to the pool afterwards.
+        """
+        readers, self._readers = self._readers, set()
+        self._idle_readers.clear()
+        for conn in readers:
+            await conn.close()
+
         if self._connection:
             # Ensure pending writes are committed
             await self.flush_pending()
@@ -205,6 +271,44 @@ class EventsDatabase:
         await conn.commit()
         logger.debug("security events batch inserted", count=len(events))
 
+    @staticmethod
+    def _event_filters(
+        event_type: str | None,
+        threat_type: str | None,
+        severity: str | None,
+        start_time: datetime | None,
+        end_time: datetime | None,
+    ) -> tuple[str, list[str | int]]:
+        """Build the WHERE clause shared by get_events and count_events.
+
+        Returns:
+            (where_clause, params) for security_events
+        """
+        where = "WHERE 1=1"
+        params: list[str | int] = []
+
+        if event_type:
+            where += " AND event_type = ?"
+            params.append(event_type)
+
+        if threat_type:
+            where += " AND threat_type = ?"
+            params.append(threat_type)
+
+        if severity:
+            where += " AND severity_level = ?"
+            params.append(severity)
+
+        if start_time:
+            where += " AND timestamp >= ?"
+            params.append(start_time.isoformat())
+
+        if end_time:
+            where += " AND timestamp <= ?"
+            params.append(end_time.isoformat())
+
+        return where, params
+
     async def get_events(
         self,
         event_type: str | None = None,
@@ -229,71 +333,111 @@ class EventsDatabase:
         Returns:
             List of event dictionaries
         """
-        conn = await self.get_connection()
-
-        query = "SELECT * FROM security_events WHERE 1=1"
-        params: list[str | int] = []
-
-        if event_type:
-            query += " AND event_type = ?"
-            params.append(event_type)
+        where, params = self._event_filters(event_type, threat_type, severity, start_time, end_time)
+        query = f"SELECT * FROM security_events {where} ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
 
-        if threat_type:
-            query += " AND threat_type = ?"
-            params.append(threat_type)
+        async with self.read_connection() as conn, conn.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
 
-        if severity:
-            query += " AND severity_level = ?"
-            params.append(severity)
+    async def stream_events(
+        self,
+        event_type: str | None = None,
+        threat_type: str | None = None,
+        severity: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> AsyncGenerator[dict, None]:
+        """Yield security events matching the filters as the cursor reads them.
 
-        if start_time:
-            query += " AND timestamp >= ?"
-            params.append(start_time.isoformat())
+        Same query as get_events, but rows are fetched in chunks and yielded
+        one at a time instead of being collected into a list. The read
+        connection is held until the iterator is exhausted or closed.
 
-        if end_time:
-            query += " AND timestamp <= ?"
-            params.append(end_time.isoformat())
+        Args:
+            event_type: Filter by event type
+            threat_type: Filter by threat type
+            severity: Filter by severity level
+            start_time: Filter by start time (inclusive)
+            end_time: Filter by end time (inclusive)
+            limit: Maximum number of events to return
+            offset: Number of events to skip
 
-        query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+        Yields:
+            Event dictionaries, newest first
+        """
+        where, params = self._event_filters(event_type, threat_type, severity, start_time, end_time)
+        query = f"SELECT * FROM security_events {where} ORDER BY timestamp DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        async with conn.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        async with self.read_connection() as conn, conn.execute(query, params) as cursor:
+            async for row in cursor:
+                yield dict(row)
 
-    async def get_stats(self) -> dict[str, Any]:
-        """Get aggregate statistics for dashboard.
+    async def count_events(
+        self,
+        event_type: str | None = None,
+        threat_type: str | None = None,
+        severity: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> int:
+        """Count security events matching the same filters as get_events.
+
+        Args:
+            event_type: Filter by event type
+            threat_type: Filter by threat type
+            severity: Filter by severity level
+            start_time: Filter by start time (inclusive)
+            end_time: Filter by end time (inclusive)
 
         Returns:
-            Dictionary with statistics
+            Number of matching events
         """
-        conn = await self.get_connection()
+        where, params = self._event_filters(event_type, threat_type, severity, start_time, end_time)
 
-        # Total events
-        async with conn.execute("SELECT COUNT(*) FROM security_events") as cursor:
-            row = await cursor.fetchone()
-            total_events = row[0] if row else 0
-
-        # Blocked count
-        async with conn.execute(
-            "SELECT COUNT(*) FROM security_events WHERE event_type = 'blocked'"
-        ) as cursor:
+        async with (
+            self.read_connection() as conn,
+            conn.execute(f"SELECT COUNT(*) FROM security_events {where}", params) as cursor,
+        ):
             row = await cursor.fetchone()
-            total_blocked = row[0] if row else 0
+            return row[0] if row else 0
 
-        # Allowed count
-        async with conn.execute(
-            "SELECT COUNT(*) FROM security_events WHERE event_type = 'allowed'"
-        ) as cursor:
-            row = await cursor.fetchone()
-            total_allowed = row[0] if row else 0
+    async def get_stats(self) -> dict[str, Any]:
+        """Get aggregate statistics for dashboard.
 
-        # Threat breakdown
-        async with conn.execute(
-            "SELECT threat_type, COUNT(*) as count FROM security_events WHERE threat_type IS NOT NULL GROUP BY threat_type"
-        ) as cursor:
-            rows = await cursor.fetchall()
-            threat_breakdown = {row[0]: row[1] for row in rows}
+        Returns:
+            Dictionary with statistics
+        """
+        async with self.read_connection() as conn:
+            # Total events
+            async with conn.execute("SELECT COUNT(*) FROM security_events") as cursor:
+                row = await cursor.fetchone()
+                total_events = row[0] if row else 0
+
+            # Blocked count
+            async with conn.execute(
+                "SELECT COUNT(*) FROM security_events WHERE event_type = 'blocked'"
+            ) as cursor:
+                row = await cursor.fetchone()
+                total_blocked = row[0] if row else 0
+
+            # Allowed count
+            async with conn.execute(
+                "SELECT COUNT(*) FROM security_events WHERE event_type = 'allowed'"
+            ) as cursor:
+                row = await cursor.fetchone()
+                total_allowed = row[0] if row else 0
+
+            # Threat breakdown
+            async with conn.execute(
+                "SELECT threat_type, COUNT(*) as count FROM security_events WHERE threat_type IS NOT NULL GROUP BY threat_type"
+            ) as cursor:
+                rows = await cursor.fetchall()
+                threat_breakdown = {row[0]: row[1] for row in rows}
 
         return {
             "total_requests": total_events,
@@ -396,11 +540,12 @@ class EventsDatabase:
         Returns:
             Pattern metadata dictionary or None if not found
         """
-        conn = await self.get_connection()
-
-        async with conn.execute(
-            "SELECT * FROM attack_pattern_metadata WHERE id = ?", (str(pattern_id),)
-        ) as cursor:
+        async with (
+            self.read_connection() as conn,
+            conn.execute(
+                "SELECT * FROM attack_pattern_metadata WHERE id = ?", (str(pattern_id),)
+            ) as cursor,
+        ):
             row = await cursor.fetchone()
             return dict(row) if row else None
 
@@ -413,12 +558,13 @@ class EventsDatabase:
         Returns:
             List of pattern metadata dictionaries
         """
-        conn = await self.get_connection()
-
-        async with conn.execute(
-            "SELECT * FROM attack_pattern_metadata ORDER BY detection_count DESC LIMIT ?",
-            (limit,),
-        ) as cursor:
+        async with (
+            self.read_connection() as conn,
+            conn.execute(
+                "SELECT * FROM attack_pattern_metadata ORDER BY detection_count DESC LIMIT ?",
+                (limit,),
+            ) as cursor,
+        ):
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
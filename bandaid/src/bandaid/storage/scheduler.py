@@ -3,10 +3,12 @@
 Uses APScheduler to run periodic cleanup jobs for log retention.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from bandaid.config import get_config
 from bandaid.observability.logger import get_logger
@@ -61,6 +63,28 @@ async def cleanup_old_patterns_job():
         logger.error("pattern cleanup job failed", error=str(e), exc_info=True)
 
 
+async def flush_pending_patterns_job():
+    """Scheduled job to write buffered attack patterns to ChromaDB.
+
+    Bounds how long a learned pattern stays only in memory when too few are
+    learned to fill a batch.
+    """
+    try:
+        from bandaid.learning import pattern_store as pattern_store_module
+
+        # Only flush a store that is already in use; do not create one here
+        pattern_store = pattern_store_module._pattern_store
+        if pattern_store is None or pattern_store.collection is None:
+            return
+
+        flushed = await asyncio.to_thread(pattern_store.flush)
+        if flushed:
+            logger.debug("scheduled pattern flush complete", flushed=flushed)
+
+    except Exception as e:
+        logger.error("pattern flush job failed", error=str(e), exc_info=True)
+
+
 def get_scheduler() -> AsyncIOScheduler:
     """Get or create global scheduler instance.
 
@@ -90,6 +114,15 @@ def get_scheduler() -> AsyncIOScheduler:
             replace_existing=True,
         )
 
+        # Write buffered patterns to ChromaDB every few seconds
+        _scheduler.add_job(
+            flush_pending_patterns_job,
+            trigger=IntervalTrigger(seconds=5),
+            id="flush_pending_patterns",
+            name="Flush buffered attack patterns",
+            replace_existing=True,
+        )
+
         logger.info("scheduler initialized with cleanup jobs (daily at 2 AM)")
 
     return _scheduler
@@ -0,0 +1,50 @@
+"""Tests for the shared port availability probe.
+
+These tests open REAL listening sockets on free ephemeral ports.
+"""
+
+import socket
+
+import pytest
+
+from bandaid.cli_commands._ports import check_ports
+
+
+def _free_port() -> int:
+    """Get a port the OS reports as free."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _non_loopback_address() -> str:
+    """Get an IPv4 address of a non-loopback interface, or skip the test."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        try:
+            s.connect(("192.0.2.1", 9))  # No packets are sent for UDP connect
+        except OSError:
+            pytest.skip("no non-loopback IPv4 interface")
+        address = s.getsockname()[0]
+    if address.startswith("127."):
+        pytest.skip("no non-loopback IPv4 interface")
+    return address
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "0.0.0.0", None])
+def test_listener_makes_port_unavailable(host):
+    """Test that a listener on loopback, all interfaces, or another interface is detected."""
+    host = host or _non_loopback_address()
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind((host, 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+
+        assert check_ports([port]) == {port: False}
+
+
+def test_free_ports_are_available():
+    """Test that unused ports are reported free and the probe releases them."""
+    port = _free_port()
+
+    assert check_ports([port]) == {port: True}
+    assert check_ports([port]) == {port: True}
@@ -0,0 +1,91 @@
+"""Tests for PrecompressedStaticFiles - dashboard static asset serving.
+
+These tests serve REAL files from a temporary directory through Starlette's
+test client - no mocks.
+"""
+
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from bandaid.dashboard.static_files import PrecompressedStaticFiles, _accepted_encodings
+
+CSS = b"body { color: red; }\n" * 50
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Static directory with one asset and its gzip variant."""
+    (tmp_path / "styles.css").write_bytes(CSS)
+    (tmp_path / "styles.css.gz").write_bytes(gzip.compress(CSS))
+    (tmp_path / "app.js").write_bytes(b"console.log('hi');\n")
+    return tmp_path
+
+
+@pytest.fixture
+def client(static_dir):
+    """Test client with the static directory mounted at /static."""
+    app = Starlette(routes=[Mount("/static", PrecompressedStaticFiles(directory=str(static_dir)))])
+    return TestClient(app)
+
+
+class TestAcceptedEncodings:
+    """Test Accept-Encoding parsing."""
+
+    def test_parses_encodings_and_quality(self):
+        """Test that q=0 excludes an encoding and other params are ignored."""
+        assert _accepted_encodings("gzip, deflate;q=0.5, br;q=0") == {"gzip", "deflate"}
+
+    def test_malformed_quality_is_not_accepted(self):
+        """Test that an unparseable quality value excludes the encoding."""
+        assert _accepted_encodings("gzip;q=abc") == set()
+
+
+class TestPrecompressedStaticFiles:
+    """Test serving precompressed variants."""
+
+    def test_serves_gzip_variant_when_accepted(self, client):
+        """Test that the .gz file is served with the original media type."""
+        response = client.get("/static/styles.css", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/css")
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.content == CSS  # Decoded by the client
+
+    def test_serves_plain_file_when_not_accepted(self, client):
+        """Test that clients without gzip support get the original file."""
+        response = client.get("/static/styles.css", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.content == CSS
+
+    def test_serves_plain_file_without_variant(self, client):
+        """Test that assets with no precompressed variant are served as-is."""
+        response = client.get("/static/app.js", headers={"Accept-Encoding": "br, gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.content == b"console.log('hi');\n"
+
+    def test_missing_file_returns_404(self, client):
+        """Test that unknown paths still 404."""
+        response = client.get("/static/missing.css", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 404
+
+    def test_not_modified_for_matching_etag(self, client):
+        """Test conditional requests against the compressed variant."""
+        first = client.get("/static/styles.css", headers={"Accept-Encoding": "gzip"})
+        response = client.get(
+            "/static/styles.css",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]},
+        )
+
+        assert response.status_code == 304
@@ -8,6 +8,7 @@ import uuid
 from datetime import datetime, timedelta
 
 import pytest
+import pytest_asyncio
 
 from bandaid.models.events import (
     DetectionLayer,
@@ -56,6 +57,7 @@ class TestDatabaseInitialization:
         assert "idx_events_timestamp" in indexes
         assert "idx_events_type" in indexes
         assert "idx_events_threat" in indexes
+        assert "idx_events_filter" in indexes
 
         await db.close()
 
@@ -329,6 +331,23 @@ class TestEventQuerying:
         # Pages should be different
         assert page1[0]["id"] != page2[0]["id"]
 
+    async def test_count_events_matches_filters(self, events_db):
+        """Test that count_events counts every match, not just one page."""
+        for i in range(15):
+            await events_db.insert_event(
+                SecurityEvent(
+                    event_type=EventType.BLOCKED if i % 3 else EventType.ALLOWED,
+                    request_id=uuid.uuid4(),
+                    redacted_content=f"Event {i}",
+                    severity_level=SeverityLevel.HIGH,
+                )
+            )
+
+        assert await events_db.count_events() == 15
+        assert await events_db.count_events(event_type=EventType.BLOCKED) == 10
+        assert await events_db.count_events(event_type=EventType.ALLOWED) == 5
+        assert await events_db.count_events(severity=SeverityLevel.CRITICAL) == 0
+
     async def test_time_range_filter(self, events_db):
         """Test filtering by time range."""
         now = datetime.utcnow()
@@ -585,3 +604,111 @@ class TestPatternMetadata:
         # Should be ordered by detection count (descending)
         assert top[0]["detection_count"] >= top[1]["detection_count"]
         assert top[0]["detection_count"] == 10
+
+
+@pytest.mark.asyncio
+class TestDashboardRowShape:
+    """Rows must match the dashboard API models, which skip validation on them."""
+
+    async def test_event_rows_match_event_item(self, events_db):
+        """Test that get_events rows encode to JSON that validates as EventItem."""
+        import msgspec
+
+        from bandaid.dashboard.api import EventItem, _event_row
+
+        await events_db.insert_event(
+            SecurityEvent(
+                event_type=EventType.BLOCKED,
+                threat_type=ThreatType.API_KEY_LEAK,
+                confidence_level=0.92,
+                request_id=uuid.uuid4(),
+                redacted_content="API key: ***REDACTED***",
+                severity_level=SeverityLevel.HIGH,
+                detection_layer=DetectionLayer.REGEX,
+                provider="openai",
+                model="gpt-4",
+            )
+        )
+        await events_db.insert_event(
+            SecurityEvent(
+                event_type=EventType.ALLOWED,
+                request_id=uuid.uuid4(),
+                redacted_content="Hello",
+                severity_level=SeverityLevel.INFO,
+            )
+        )
+
+        for row in await events_db.get_events():
+            encoded = msgspec.json.encode(_event_row(row))
+            assert EventItem.model_validate_json(encoded) == EventItem.model_validate(row)
+
+    async def test_pattern_rows_match_pattern_item(self, events_db):
+        """Test that get_top_patterns rows validate as PatternItem unchanged."""
+        from bandaid.dashboard.api import PatternItem, _pattern_item
+
+        event = SecurityEvent(
+            event_type=EventType.BLOCKED,
+            threat_type=ThreatType.PROMPT_INJECTION,
+            confidence_level=0.95,
+            request_id=uuid.uuid4(),
+            redacted_content="Attack",
+            severity_level=SeverityLevel.CRITICAL,
+        )
+        await events_db.insert_event(event)
+        await events_db.insert_pattern_metadata(
+            AttackPattern(
+                id=uuid.uuid4(),
+                threat_types=[ThreatType.PROMPT_INJECTION, ThreatType.API_KEY_LEAK],
+                detection_count=3,
+                first_seen=datetime.utcnow(),
+                last_seen=datetime.utcnow(),
+                source_event_id=event.id,
+                redacted_text="[REDACTED]",
+            )
+        )
+
+        (row,) = await events_db.get_top_patterns(limit=1)
+        item = _pattern_item(row)
+        assert item == PatternItem.model_validate(item.model_dump())
+        assert item.threat_types == ["prompt_injection", "api_key_leak"]
+
+
+@pytest.mark.asyncio
+class TestReadConnectionPool:
+    """Test pooled read connections on a file-backed database."""
+
+    @pytest_asyncio.fixture
+    async def file_db(self, tmp_path):
+        """File-backed database (in-memory databases never pool readers)."""
+        db = EventsDatabase(db_path=str(tmp_path / "events.db"))
+        await db.initialize()
+        yield db
+        await db.close()
+
+    async def test_reader_is_reused(self, file_db):
+        """Test that a returned reader is handed out again."""
+        async with file_db.read_connection() as first:
+            pass
+        async with file_db.read_connection() as second:
+            pass
+
+        assert second is first
+
+    async def test_reader_is_discarded_after_error(self, file_db):
+        """Test that a reader whose query raised is closed instead of pooled."""
+        with pytest.raises(RuntimeError):
+            async with file_db.read_connection() as conn:
+                raise RuntimeError("query failed")
+
+        assert conn not in file_db._readers
+        assert file_db._idle_readers == []
+
+    async def test_close_closes_borrowed_readers(self, file_db):
+        """Test that close() closes readers still in use and they are not pooled again."""
+        async with file_db.read_connection() as conn:
+            await file_db.close()
+
+        assert file_db._readers == set()
+        assert file_db._idle_readers == []
+        with pytest.raises(ValueError):
+            await conn.execute("SELECT 1")
@@ -0,0 +1,36 @@
+"""Tests for the guardrail CLI app - command registration.
+
+These tests invoke the REAL Typer app through its test runner.
+"""
+
+import pytest
+from typer.testing import CliRunner
+
+from bandaid.cli import app
+
+
+@pytest.fixture
+def runner():
+    """CLI test runner."""
+    return CliRunner()
+
+
+class TestConfigGroup:
+    """Test the lazily built `config` command group."""
+
+    def test_available_regardless_of_process_argv(self, runner, monkeypatch):
+        """Test that the group dispatches even when sys.argv names another command."""
+        monkeypatch.setattr("sys.argv", ["guardrail", "status"])
+
+        result = runner.invoke(app, ["config", "show", "--help"])
+
+        assert result.exit_code == 0
+        assert "--format" in result.output
+
+    def test_listed_in_top_level_help(self, runner):
+        """Test that top-level help lists the group next to the eager commands."""
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "config" in result.output
+        assert "status" in result.output
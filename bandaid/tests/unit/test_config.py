@@ -0,0 +1,221 @@
+"""Tests for ConfigManager - TOML loading and the on-disk config cache.
+
+These tests load REAL config files from a temporary directory; only the
+Bandaid home directory and encryption key are redirected there.
+"""
+
+import hashlib
+import os
+
+import pytest
+
+import bandaid.config as config_module
+from bandaid.config import Config, ConfigManager
+
+CONFIG_TOML = """
+[proxy]
+port = 8100
+
+[[providers]]
+provider = "openai"
+api_key = "encrypted"
+
+[[providers]]
+provider = "anthropic"
+api_key = "encrypted"
+default = true
+"""
+
+
+@pytest.fixture(autouse=True)
+def bandaid_home(tmp_path, monkeypatch):
+    """Point BANDAID_HOME and the encryption key at a temporary directory."""
+    home = tmp_path / "home"
+    home.mkdir()
+    (home / ".key").write_bytes(b"k" * 44)
+    monkeypatch.setattr(config_module, "BANDAID_HOME", home)
+    monkeypatch.setattr(config_module, "_KEY_PATH", home / ".key")
+    monkeypatch.setattr(config_module, "_load_encryption_key", lambda: b"k" * 44)
+    return home
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """A valid configuration file."""
+    path = tmp_path / "config.toml"
+    path.write_text(CONFIG_TOML)
+    return path
+
+
+def _fresh_load(path):
+    """Load with a new manager (as `start` does), so the in-process memo is empty."""
+    manager = ConfigManager(path)
+    manager.cache_writes = True
+    return manager.load_config()
+
+
+class TestConfigCache:
+    """Test the HMAC-tagged JSON config cache."""
+
+    def test_cache_is_written_under_bandaid_home(self, config_path, bandaid_home):
+        """Test that loading writes the cache under BANDAID_HOME, not next to the config."""
+        _fresh_load(config_path)
+
+        cache_path = ConfigManager._config_cache_path(config_path)
+        assert cache_path.parent == bandaid_home / "cache"
+        assert cache_path.exists()
+        assert list(config_path.parent.glob("*.pkl")) == []
+
+    def test_cache_hit_matches_validated_config(self, config_path, monkeypatch):
+        """Test that a cache hit rebuilds an equal config without parsing TOML."""
+        expected = _fresh_load(config_path)
+
+        monkeypatch.setattr(config_module, "_toml_parser", pytest.fail)
+        cached = _fresh_load(config_path)
+
+        assert cached == expected
+        assert isinstance(cached.proxy, config_module.ProxyConfig)
+        assert cached.proxy.port == 8100
+        assert cached._default_index == 1  # Recorded for the trusted path too
+
+    def test_cache_miss_when_file_changes(self, config_path):
+        """Test that a same-size edit that keeps the mtime is still re-parsed."""
+        _fresh_load(config_path)
+        stat = config_path.stat()
+
+        config_path.write_text(CONFIG_TOML.replace("8100", "8200"))
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert config_path.stat().st_size == stat.st_size
+        assert _fresh_load(config_path).proxy.port == 8200
+
+    def test_in_process_memo_tracks_contents(self, config_path):
+        """Test that a manager notices a same-size rewrite of a file it already loaded."""
+        manager = ConfigManager(config_path)
+        assert manager.load_config().proxy.port == 8100
+
+        config_path.write_text(CONFIG_TOML.replace("8100", "8200"))
+
+        assert manager.load_config().proxy.port == 8200
+
+    def test_read_only_load_writes_nothing(self, config_path, bandaid_home, monkeypatch):
+        """Test that a plain load neither writes the cache nor creates the key."""
+        (bandaid_home / ".key").unlink()
+        monkeypatch.setattr(config_module, "_load_encryption_key", pytest.fail)
+
+        assert ConfigManager(config_path).load_config().proxy.port == 8100
+        assert list(bandaid_home.iterdir()) == []
+
+    def test_stale_cache_from_other_version_is_ignored(self, config_path, monkeypatch):
+        """Test that a cache written by another bandaid version is not used."""
+        _fresh_load(config_path)
+
+        monkeypatch.setattr(config_module, "_package_version", lambda: "99.0.0")
+        parsed = []
+        parser = config_module._toml_parser()
+        monkeypatch.setattr(config_module, "_toml_parser", lambda: parsed.append(1) or parser)
+
+        assert _fresh_load(config_path).proxy.port == 8100
+        assert parsed == [1]
+
+    def test_tampered_cache_is_ignored(self, config_path):
+        """Test that a cache whose contents no longer match its tag is rejected."""
+        _fresh_load(config_path)
+
+        cache_path = ConfigManager._config_cache_path(config_path)
+        cache_path.write_bytes(cache_path.read_bytes().replace(b"8100", b"8300"))
+
+        assert _fresh_load(config_path).proxy.port == 8100
+
+    def test_cache_signed_with_other_key_is_ignored(self, config_path, monkeypatch):
+        """Test that a cache tagged with a different key is rejected."""
+        _fresh_load(config_path)
+
+        monkeypatch.setattr(config_module, "_load_encryption_key", lambda: b"x" * 44)
+        manager = ConfigManager(config_path)
+        digest = hashlib.sha256(config_path.read_bytes()).hexdigest()
+
+        assert manager._read_config_cache(config_path, digest) is None
+
+    @pytest.mark.parametrize("contents", [b"", b"garbage", b"\x80\x03pickle\n{}"])
+    def test_corrupt_cache_is_ignored(self, config_path, contents):
+        """Test that unreadable cache files fall back to loading the TOML."""
+        cache_path = ConfigManager._config_cache_path(config_path)
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(contents)
+
+        assert _fresh_load(config_path).proxy.port == 8100
+
+    def test_env_interpolated_config_is_not_cached(self, config_path, monkeypatch):
+        """Test that configs with ${VAR} references never reach the disk cache."""
+        monkeypatch.setenv("BANDAID_TEST_KEY", "secret")
+        config_path.write_text(CONFIG_TOML.replace('"encrypted"', '"${BANDAID_TEST_KEY}"'))
+
+        config = _fresh_load(config_path)
+
+        assert config.providers[0].api_key == "secret"
+        assert not ConfigManager._config_cache_path(config_path).exists()
+
+    def test_invalid_config_raises(self, config_path):
+        """Test that validation errors still surface as ValueError."""
+        config_path.write_text("[proxy]\nport = 80\n")
+
+        with pytest.raises(ValueError, match="Invalid configuration"):
+            _fresh_load(config_path)
+
+
+def test_config_defaults_round_trip():
+    """Test that a default Config survives the cache's JSON round trip."""
+    config = Config()
+    rebuilt = config_module._construct_trusted(Config, config.model_dump(mode="json"))
+
+    assert rebuilt == config
+
+
+class TestTrustedConstruction:
+    """Test _construct_trusted, used to rebuild verified cached configs."""
+
+    def test_builds_nested_models_and_provider_lists(self, config_path):
+        """Test that nested models and lists of models are real model instances."""
+        validated = _fresh_load(config_path)
+
+        rebuilt = config_module._construct_trusted(Config, validated.model_dump(mode="json"))
+        rebuilt._index_default_provider()  # As _read_config_cache does
+
+        assert rebuilt == validated
+        assert isinstance(rebuilt.models.guard, config_module.GuardModelConfig)
+        assert all(isinstance(p, config_module.ProviderConfig) for p in rebuilt.providers)
+
+    def test_missing_fields_get_defaults(self):
+        """Test that fields absent from the data fall back to their defaults."""
+        rebuilt = config_module._construct_trusted(Config, {"proxy": {"port": 9000}})
+
+        assert rebuilt.proxy.port == 9000
+        assert rebuilt.proxy.host == "0.0.0.0"
+        assert rebuilt.dashboard == config_module.DashboardConfig()
+
+
+class TestSaveConfig:
+    """Test save_config."""
+
+    def test_saved_config_is_not_served_from_stale_cache(self, config_path):
+        """Test that saving makes the cached copy stale and leaves no tag file to trust."""
+        manager = ConfigManager(config_path)
+        manager.cache_writes = True
+        config = manager.load_config()
+        assert ConfigManager._config_cache_path(config_path).exists()
+
+        config.proxy.port = 8400
+        manager.save_config(config)
+
+        assert not config_path.with_name("config.toml.tag").exists()
+        assert manager.load_config().proxy.port == 8400
+        assert _fresh_load(config_path).proxy.port == 8400
+
+    def test_hand_edited_file_is_always_validated(self, config_path):
+        """Test that a stray tag file cannot make an invalid config load."""
+        config_path.with_name("config.toml.tag").write_text("0" * 64)
+        config_path.write_text("[proxy]\nport = 80\n")
+
+        with pytest.raises(ValueError, match="Invalid configuration"):
+            _fresh_load(config_path)